@@ -1,3 +1,20 @@
 """RegisterCalculator package"""
 
-from .registercalculator import RegisterCalculator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .registercalculator import RegisterCalculator
+
+__all__ = ["RegisterCalculator"]
+
+
+def __getattr__(name):
+    # The GUI is imported on first use only, so that the headless register package
+    # can be used without loading tkinter and tkinterdnd2
+    if name == "RegisterCalculator":
+        from .registercalculator import (  # pylint: disable=import-outside-toplevel
+            RegisterCalculator,
+        )
+
+        return RegisterCalculator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,151 @@
+"""Command line interface for decoding register values without the GUI"""
+
+import argparse
+import csv
+import json
+import sys
+from itertools import tee
+from typing import Iterable, Iterator, Optional, Tuple
+
+from registercalculator.register import (
+    CompiledLayout,
+    compile_layout,
+    compile_query,
+    iter_decode,
+    load_layout,
+    load_register,
+)
+
+BASES = {"auto": 0, "hex": 16, "dec": 10, "bin": 2}
+
+
+def parse_values(
+    lines: Iterable[str], base: int = 0, bit_length: Optional[int] = None
+) -> Iterator[int]:
+    """Parse one register value per line, skipping empty lines and # comments.
+    With base 0, values without a prefix are decimal even with leading zeros.
+    Values that do not fit into bit_length bits are rejected."""
+    max_value = None if bit_length is None else (1 << bit_length) - 1
+    for line_number, line in enumerate(lines, start=1):
+        text = line.split("#", 1)[0].strip()
+        if text:
+            try:
+                value = int(text, 10 if base == 0 and text.isdigit() else base)
+            except ValueError as error:
+                raise ValueError(
+                    f"input line {line_number}: invalid value {text!r}"
+                ) from error
+            if value < 0 or (max_value is not None and value > max_value):
+                raise ValueError(
+                    f"input line {line_number}: value {text!r} does not fit into "
+                    f"{bit_length} bits"
+                )
+            yield value
+
+
+def read_lines(filenames: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of all files in turn, where '-' is standard input"""
+    for filename in filenames:
+        if filename == "-":
+            yield from sys.stdin
+        else:
+            with open(filename, "r", encoding="utf-8") as file:
+                yield from file
+
+
+def write_csv(rows: Iterator[Tuple[int, dict]], labels, file) -> None:
+    """Write decoded rows as CSV with a header line"""
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow(["value", *labels])
+    for value, fields in rows:
+        writer.writerow([value, *fields.values()])
+
+
+def write_json_lines(rows: Iterator[Tuple[int, dict]], _, file) -> None:
+    """Write decoded rows as one JSON object per line"""
+    for value, fields in rows:
+        file.write(json.dumps({"value": value, "fields": fields}) + "\n")
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_json_lines}
+
+
+def decode_stream(
+    layout: CompiledLayout, values: Iterable[int]
+) -> Iterator[Tuple[int, dict]]:
+    """Lazily pair each register value with its decoded fields"""
+    values, decoded_values = tee(values)
+    return zip(values, iter_decode(layout, decoded_values))
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Decode register values read line by line and write the fields to stdout"""
+    parser = argparse.ArgumentParser(
+        prog="run_calculator.py decode",
+        description="Decode register values into fields using an exported layout.",
+    )
+    parser.add_argument(
+        "layout",
+        help="json layout exported from the calculator, or an SVD/IP-XACT file "
+        "when --register is given",
+    )
+    parser.add_argument(
+        "files", nargs="*", default=["-"], help="files with one value per line"
+    )
+    parser.add_argument("--format", choices=WRITERS, default="csv")
+    parser.add_argument(
+        "--base",
+        choices=BASES,
+        default="auto",
+        help="base of the values, 'auto' accepts 0x/0b/0o prefixed values and "
+        "decimal values, which may have leading zeros",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always parse the layout instead of using the compiled layout cache",
+    )
+    parser.add_argument(
+        "--register",
+        metavar="PERIPHERAL.REGISTER",
+        help="decode a register of an SVD or IP-XACT device description",
+    )
+    parser.add_argument(
+        "--where",
+        metavar="QUERY",
+        help="only decode values matching a query, e.g. 'ERR == 1 and MODE in (2, 3)'",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.register:
+            layout = compile_layout(load_register(args.layout, args.register))
+        else:
+            layout = load_layout(args.layout, use_cache=not args.no_cache)
+    except OSError as error:
+        print(f"error: {args.layout}: {error.strerror or error}", file=sys.stderr)
+        return 1
+    except ValueError as error:
+        print(f"error: {args.layout}: {error}", file=sys.stderr)
+        return 1
+
+    values = parse_values(read_lines(args.files), BASES[args.base], layout.bit_length)
+    if args.where:
+        try:
+            query = compile_query(layout, args.where)
+        except ValueError as error:
+            print(f"error: {error}", file=sys.stderr)
+            return 1
+        values = filter(query.matches, values)
+
+    try:
+        WRITERS[args.format](decode_stream(layout, values), layout.labels, sys.stdout)
+    except BrokenPipeError:
+        sys.stderr.close()
+    except OSError as error:
+        print(f"error: {error.filename}: {error.strerror or error}", file=sys.stderr)
+        return 1
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    return 0
@@ -1,12 +1,89 @@
 """Module which extends ttk entries with hex/dec/bin functionality"""
 
+from collections import Counter
 from string import hexdigits
-from tkinter import END, INSERT, SEL_FIRST, SEL_LAST, Frame, ttk, IntVar
-from typing import Union
+from tkinter import END, INSERT, SEL_FIRST, SEL_LAST, Frame, IntVar, Menu, ttk
+from typing import Any, Callable, List, Optional, Union
 
 from registercalculator.register import DELIMITER, DataField, DataRegister
+from registercalculator.register.formatting import to_bin_delimited
 
 NAME_FIELD_WIDTH = 30
+VISIBLE_ROWS = 16
+HIGHLIGHT_COLOR = "blue"
+FRAME_DELAY_MS = 16
+
+
+class Debouncer:
+    """Coalesces a burst of events into a single call of a callback, made at most
+    once per frame using Tk's after().
+
+    Events and actual calls are counted per name, see statistics()."""
+
+    events: Counter = Counter()
+    recomputes: Counter = Counter()
+
+    def __init__(
+        self, widget, callback: Callable[[], Any], name: str, delay_ms=FRAME_DELAY_MS
+    ) -> None:
+        self._widget = widget
+        self._callback = callback
+        self._name = name
+        self._delay_ms = delay_ms
+        self._after_id = None
+
+    def __call__(self, *_) -> None:
+        """Schedule the callback, unless it is already scheduled"""
+        Debouncer.events[self._name] += 1
+        if self._after_id is None:
+            self._after_id = self._widget.after(self._delay_ms, self._run)
+
+    @property
+    def pending(self) -> bool:
+        """True if the callback is scheduled but not yet called"""
+        return self._after_id is not None
+
+    def flush(self) -> None:
+        """Call a scheduled callback right away"""
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._run()
+
+    def cancel(self) -> None:
+        """Drop a scheduled callback"""
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _run(self) -> None:
+        self._after_id = None
+        Debouncer.recomputes[self._name] += 1
+        self._callback()
+
+    @classmethod
+    def statistics(cls) -> dict:
+        """Number of events and actual recomputes per debouncer name"""
+        return {
+            name: {"events": cls.events[name], "recomputes": cls.recomputes[name]}
+            for name in cls.events
+        }
+
+
+def selection_bit_tables(text: str, bit_length: int, bit_0_is_lsb: bool) -> tuple:
+    """Return two tables that map a character index of a binary string to the bit
+    number of a selection starting at, respectively ending before, that index"""
+    bits_before = [0]
+    for character in text:
+        bits_before.append(bits_before[-1] + (character != DELIMITER))
+
+    # Bit numbers counted from the lsb, where the string starts with the msb
+    start_bits = [bit_length - bits - 1 for bits in bits_before]
+    end_bits = [bit_length - bits for bits in bits_before]
+
+    if not bit_0_is_lsb:
+        start_bits = [bit_length - bit - 1 for bit in start_bits]
+        end_bits = [bit_length - bit - 1 for bit in end_bits]
+    return tuple(start_bits), tuple(end_bits)
 
 
 class HexEntry(ttk.Entry):
@@ -15,16 +92,32 @@ class HexEntry(ttk.Entry):
     def __init__(self, frame: Frame, field: Union[DataRegister, DataField]):
         self._frame = frame
         self._field = field
+        self._minimum_width = self._field.max_hex_width
         super().__init__(
             frame,
-            width=self._field.max_hex_width,
+            width=self._minimum_width,
             justify="right",
             font="TkFixedFont",
             validate="key",
             validatecommand=(frame.register(self._validate), "%S", "%P"),
         )
-        self.bind("<Any-KeyRelease>", self._key_release)
+        self._key_release_debouncer = Debouncer(self, self._apply_text, "HexEntry")
+        self.bind("<Any-KeyRelease>", self._key_release_debouncer)
+        self._field.register_observer(self._observer_callback)
+
+    def update_width(self):
+        """Widen the entry if the bit length has grown beyond its initial width"""
+        self.config(width=max(self._minimum_width, self._field.max_hex_width))
+
+    def bind_field(self, field: Union[DataRegister, DataField]):
+        """Connect the entry to another register or field and show its value"""
+        self._key_release_debouncer.flush()
+        self._field.unregister_observer(self._observer_callback)
+        self._field = field
         self._field.register_observer(self._observer_callback)
+        self._minimum_width = self._field.max_hex_width
+        self.update_width()
+        self._observer_callback()
 
     def _validate(self, text_to_insert: str, all_text: str) -> bool:
         if not all(c in hexdigits for c in text_to_insert):
@@ -35,9 +128,17 @@ class HexEntry(ttk.Entry):
             return False
         return True
 
-    def _key_release(self, _):
+    def _apply_text(self):
         value_string = self.get()
-        self._field.value = int(value_string, 16) if value_string != "" else 0
+        self._set_value(int(value_string, 16) if value_string != "" else 0)
+
+    def _set_value(self, value: int):
+        # Observers are only notified of changed bits, so text like "012" for an
+        # unchanged value is rewritten here
+        if value == self._field.value:
+            self._observer_callback()
+        else:
+            self._field.value = value
 
     def _observer_callback(self):
         index = self.index(INSERT)
@@ -53,6 +154,7 @@ class HexEntry(ttk.Entry):
 
     def unregister(self):
         """Unregister the entry from register changes"""
+        self._key_release_debouncer.cancel()
         self._field.unregister_observer(self._observer_callback)
 
 
@@ -62,16 +164,32 @@ class DecEntry(ttk.Entry):
     def __init__(self, frame: Frame, field: Union[DataRegister, DataField]):
         self._frame = frame
         self._field = field
+        self._minimum_width = self._field.max_dec_width
         super().__init__(
             frame,
-            width=self._field.max_dec_width,
+            width=self._minimum_width,
             justify="right",
             font="TkFixedFont",
             validate="key",
             validatecommand=(frame.register(self._validate), "%S", "%P"),
         )
-        self.bind("<Any-KeyRelease>", self._key_release)
+        self._key_release_debouncer = Debouncer(self, self._apply_text, "DecEntry")
+        self.bind("<Any-KeyRelease>", self._key_release_debouncer)
+        self._field.register_observer(self._observer_callback)
+
+    def update_width(self):
+        """Widen the entry if the bit length has grown beyond its initial width"""
+        self.config(width=max(self._minimum_width, self._field.max_dec_width))
+
+    def bind_field(self, field: Union[DataRegister, DataField]):
+        """Connect the entry to another register or field and show its value"""
+        self._key_release_debouncer.flush()
+        self._field.unregister_observer(self._observer_callback)
+        self._field = field
         self._field.register_observer(self._observer_callback)
+        self._minimum_width = self._field.max_dec_width
+        self.update_width()
+        self._observer_callback()
 
     def _validate(self, text_to_insert: str, all_text: str) -> bool:
         if not text_to_insert.isdecimal():
@@ -82,9 +200,17 @@ class DecEntry(ttk.Entry):
             return False
         return True
 
-    def _key_release(self, _):
+    def _apply_text(self):
         value_string = self.get()
-        self._field.value = int(value_string) if value_string != "" else 0
+        self._set_value(int(value_string) if value_string != "" else 0)
+
+    def _set_value(self, value: int):
+        # Observers are only notified of changed bits, so text like "012" for an
+        # unchanged value is rewritten here
+        if value == self._field.value:
+            self._observer_callback()
+        else:
+            self._field.value = value
 
     def _observer_callback(self):
         index = self.index(INSERT)
@@ -100,6 +226,7 @@ class DecEntry(ttk.Entry):
 
     def unregister(self):
         """Unregister the entry from register changes"""
+        self._key_release_debouncer.cancel()
         self._field.unregister_observer(self._observer_callback)
 
 
@@ -112,31 +239,31 @@ class BinEntry(ttk.Entry):
         self._with_delimiter = with_delimiter
         self._frame = frame
         self._field = field
-        width = self._field.bit_length
-
-        if self._with_delimiter:
-            width += self._field.bit_length // 4 - 1
+        self._minimum_width = self._text_width()
 
         super().__init__(
             frame,
-            width=width,
+            width=self._minimum_width,
             justify="right",
             font="TkFixedFont",
             validate="key",
             validatecommand=(frame.register(self._validate), "%S", "%P"),
         )
+        self._value_typed = False
+        self._key_release_debouncer = Debouncer(self, self._apply_text, "BinEntry")
         self.bind("<Any-KeyRelease>", self._key_release)
         self._field.register_observer(self._observer_callback)
         self._observers = []
         self.field_selection: dict[str, int | None] = {"start": None, "end": None}
+        self._selection_tables_key = None
+        self._selection_table_cache = ((), ())
 
     def _validate(self, text_to_insert: str, all_text: str) -> bool:
         allowed_characters = "01"
-        allowed_length = self._field.bit_length
+        allowed_length = self._text_width()
 
         if self._with_delimiter:
             allowed_characters += DELIMITER
-            allowed_length += self._field.bit_length // 4 - 1
 
         if not all(c in allowed_characters for c in text_to_insert):
             return False
@@ -144,13 +271,47 @@ class BinEntry(ttk.Entry):
             return False
         return True
 
+    def _text_width(self) -> int:
+        width = self._field.bit_length
+        if self._with_delimiter:
+            width += self._field.bit_length // 4 - 1
+        return width
+
+    def update_width(self):
+        """Widen the entry if the bit length has grown beyond its initial width"""
+        self.config(width=max(self._minimum_width, self._text_width()))
+
+    def bind_field(self, field: Union[DataRegister, DataField]):
+        """Connect the entry to another register or field and show its value"""
+        self._key_release_debouncer.flush()
+        self._field.unregister_observer(self._observer_callback)
+        self._field = field
+        self._field.register_observer(self._observer_callback)
+        self._minimum_width = self._text_width()
+        self.update_width()
+        self._observer_callback()
+
     def _key_release(self, event):
-        value_string = self.get()
         if event.char in ["0", "1"]:
-            self._field.value = int(value_string, 2) if value_string != "" else 0
+            self._value_typed = True
+        self._key_release_debouncer()
+
+    def _apply_text(self):
+        value_string = self.get()
+        if self._value_typed:
+            self._value_typed = False
+            self._set_value(int(value_string, 2) if value_string != "" else 0)
         else:
             self.notify_observers()
 
+    def _set_value(self, value: int):
+        # Observers are only notified of changed bits, so text like "012" for an
+        # unchanged value is rewritten here
+        if value == self._field.value:
+            self._observer_callback()
+        else:
+            self._field.value = value
+
     def _observer_callback(self):
         index = self.index(INSERT)
         self.config(state="enabled")
@@ -168,6 +329,7 @@ class BinEntry(ttk.Entry):
 
     def unregister(self):
         """Unregister the entry from register changes"""
+        self._key_release_debouncer.cancel()
         self._field.unregister_observer(self._observer_callback)
 
     def register_observer(self, callback):
@@ -178,40 +340,39 @@ class BinEntry(ttk.Entry):
         """Unregister a callback"""
         self._observers.remove(callback)
 
-    def notify_observers(self):
-        """Notify all observers about a selection change"""
+    def notify_observers(self, force=False):
+        """Notify all observers about a selection change. Unless forced, observers
+        are only notified if the selection has changed since the last call."""
+        previous_selection = self.get_selection()
         self._calculate_selection()
+        if not force and self.get_selection() == previous_selection:
+            return
         for callback in self._observers:
             callback(self.field_selection["start"], self.field_selection["end"])
 
+    def _selection_tables(self) -> tuple:
+        """Return the selection bit tables of the entry's text, which are rebuilt
+        only when the bit length, delimiter mode or bit numbering changes"""
+        key = (self._field.bit_length, self._with_delimiter, self._field.bit_0_is_lsb)
+        if key != self._selection_tables_key:
+            text = to_bin_delimited(0, key[0]) if self._with_delimiter else "0" * key[0]
+            self._selection_table_cache = selection_bit_tables(text, key[0], key[2])
+            self._selection_tables_key = key
+
+        # Fall back to the actual text while it is being edited
+        if self.index(END) != len(self._selection_table_cache[0]) - 1:
+            return selection_bit_tables(
+                self.get(), self._field.bit_length, self._field.bit_0_is_lsb
+            )
+        return self._selection_table_cache
+
     def _calculate_selection(self):
         start_index, end_index = self._get_raw_selection()
 
         if start_index is not None and end_index is not None:
-            # Count number of delimiters in that selection
-            delimiters_before_selection = self.get()[0:start_index].count(DELIMITER)
-            delimiters_in_selection = self.get()[start_index:end_index].count(DELIMITER)
-
-            # Calculate bit indexes
-            start_index = (
-                self._field.bit_length - (start_index - delimiters_before_selection) - 1
-            )
-            end_index = self._field.bit_length - (
-                end_index - delimiters_before_selection - delimiters_in_selection
-            )
-
-            # Store current selection
-            self.field_selection["start"] = (
-                start_index
-                if self._field.bit_0_is_lsb
-                else self._field.bit_length - start_index - 1
-            )
-
-            self.field_selection["end"] = (
-                end_index
-                if self._field.bit_0_is_lsb
-                else self._field.bit_length - end_index - 1
-            )
+            start_bits, end_bits = self._selection_tables()
+            self.field_selection["start"] = start_bits[start_index]
+            self.field_selection["end"] = end_bits[end_index]
         else:
             self.field_selection["start"] = None
             self.field_selection["end"] = None
@@ -231,63 +392,136 @@ class BinEntry(ttk.Entry):
 
 
 class FieldGui(DataField):
-    """A ttk gui object that represent a register field on a row"""
+    """A register field shown on a row of a FieldTable"""
 
     def __init__(
         self,
-        frame: Frame,
         register: DataRegister,
         start_bit: int,
         end_bit: int,
         name: str = "",
+        validate: bool = True,
     ) -> None:
-        super().__init__(register, start_bit, end_bit)
+        super().__init__(register, start_bit, end_bit, name, validate)
+        self.highlighted = False
+        self.row: Optional["FieldRow"] = None
+
+    def highlight(self, enabled: bool) -> None:
+        """Highlight the field's bit label, e.g. when it overlaps the selected bits"""
+        self.highlighted = enabled
+        if self.row is not None:
+            self.row.update_highlight()
+
+    @property
+    def settings(self) -> dict:
+        """Dict containing the field's settings"""
+        settings = {
+            "name": self.name,
+            "start": self.start_bit,
+            "end": self.end_bit,
+        }
+        return settings
+
+
+class FieldRow:
+    """The widgets of one row of a FieldTable, which can be bound to any field"""
+
+    def __init__(self, frame: Frame, field: FieldGui, row: int) -> None:
+        self.field = field
 
         self.bit_label = ttk.Label(frame, borderwidth=5)
-        self.bin_entry = BinEntry(frame, self)
-        self.hex_entry = HexEntry(frame, self)
-        self.dec_entry = DecEntry(frame, self)
+        self.bin_entry = BinEntry(frame, field)
+        self.hex_entry = HexEntry(frame, field)
+        self.dec_entry = DecEntry(frame, field)
 
         self.checkbox_value = IntVar()
-        self.checkbox = None
-        if end_bit - start_bit == 0:  # bit length 1
-            self.checkbox = ttk.Checkbutton(
-                frame, variable=self.checkbox_value, command=self._toggle_value
-            )
-            self.checkbox_value.set(self.value)
+        self.checkbox = ttk.Checkbutton(
+            frame, variable=self.checkbox_value, command=self._toggle_value
+        )
 
         self.name_entry = ttk.Entry(
             frame, width=NAME_FIELD_WIDTH, justify="left", font="TkFixedFont"
         )
         self.name_entry.bind("<Any-KeyRelease>", self._name_field_keyrelease)
 
-        self.name_entry.insert(0, name)
-        self._adjust_entry_length()
-
-    def grid(self, row):
-        """Position the widget in the parent at a specific row"""
         self.bit_label.grid(row=row, column=0, padx=1, pady=1)
         self.bin_entry.grid(row=row, column=1, sticky="E", padx=3, pady=1)
         self.hex_entry.grid(row=row, column=2, sticky="E", padx=3, pady=1)
         self.dec_entry.grid(row=row, column=3, sticky="E", padx=3, pady=1)
-        if self.checkbox is not None:
-            self.checkbox.grid(row=row, column=4, sticky="E", padx=3, pady=1)
+        self.checkbox.grid(row=row, column=4, sticky="E", padx=3, pady=1)
         self.name_entry.grid(
             row=row, column=5, sticky="W", padx=3, pady=1, columnspan=2
         )
-        self.register_observer(self._observer_callback)
-        self._register.notify_observers()
+
+        field.register_observer(self._observer_callback)
+        self.bind_field(field)
+
+    @property
+    def widgets(self) -> list:
+        """All widgets of the row"""
+        return [
+            self.bit_label,
+            self.bin_entry,
+            self.hex_entry,
+            self.dec_entry,
+            self.checkbox,
+            self.name_entry,
+        ]
+
+    def bind_field(self, field: FieldGui) -> None:
+        """Show another field on the row, reusing the row's widgets"""
+        self.field.unregister_observer(self._observer_callback)
+        # The field may already be shown on another row, when rows are rebound in turn
+        if self.field.row is self:
+            self.field.row = None
+        self.field = field
+        field.register_observer(self._observer_callback)
+        field.row = self
+
+        self.bin_entry.bind_field(field)
+        self.hex_entry.bind_field(field)
+        self.dec_entry.bind_field(field)
+
+        if self.field.bit_length == 1:
+            self.checkbox.grid()
+        else:
+            self.checkbox.grid_remove()
+
+        self.name_entry.delete(0, END)
+        self.name_entry.insert(0, self.field.name)
+        self.name_entry.configure(width=NAME_FIELD_WIDTH)
+        self._adjust_entry_length()
+        self.update_highlight()
+        self._observer_callback()
+
+    def update_highlight(self) -> None:
+        """Show whether the bound field is highlighted"""
+        self.bit_label.config(
+            foreground=HIGHLIGHT_COLOR if self.field.highlighted else ""
+        )
+
+    def destroy(self) -> None:
+        """Unregister the row from register changes and destroy its widgets"""
+        self.hex_entry.unregister()
+        self.dec_entry.unregister()
+        self.bin_entry.unregister()
+        self.field.unregister_observer(self._observer_callback)
+        if self.field.row is self:
+            self.field.row = None
+        for widget in self.widgets:
+            widget.destroy()
 
     def _toggle_value(self):
         """Toggle the value of the field between 1 and 0"""
-        self.value = self.checkbox_value.get()
+        self.field.value = self.checkbox_value.get()
 
     def _update_checkbox(self):
         """Update the checkbox value based on the field value"""
-        if self.checkbox is not None:
-            self.checkbox_value.set(self.value)
+        if self.field.bit_length == 1:
+            self.checkbox_value.set(self.field.value)
 
     def _name_field_keyrelease(self, _):
+        self.field.name = self.name_entry.get()
         self._adjust_entry_length()
 
     def _adjust_entry_length(self, minimum=NAME_FIELD_WIDTH):
@@ -295,40 +529,207 @@ class FieldGui(DataField):
         if length > minimum:
             self.name_entry.configure(width=length)
 
-    @property
-    def settings(self) -> dict:
-        """Dict containing the field's settings"""
-        settings = {
-            "name": self.name_entry.get(),
-            "start": self.start_bit,
-            "end": self.end_bit,
-        }
-        return settings
-
-    def unregister(self):
-        """Unregister the widget from register changes"""
-        self.hex_entry.unregister()
-        self.dec_entry.unregister()
-        self.bin_entry.unregister()
-        self.unregister_observer(self._observer_callback)
-
     def _observer_callback(self):
-        if self.start_bit >= 0 and self.end_bit >= 0:
+        if self.field.start_bit >= 0 and self.field.end_bit >= 0:
             self._update_checkbox()
-            self.bit_label.config(text=f"{self.start_bit}:{self.end_bit}")
+            self.bit_label.config(text=f"{self.field.start_bit}:{self.field.end_bit}")
         else:
             self.bit_label.config(text="N/A")
 
 
+class FieldTable(Frame):
+    """A scrollable table of fields. Widgets are only created for the visible rows
+    and are reused for other fields when the table is scrolled, sorted or edited."""
+
+    def __init__(
+        self,
+        master,
+        visible_rows: int = VISIBLE_ROWS,
+        right_click_button: str = "<Button-3>",
+        remove_command: Optional[Callable[[FieldGui], None]] = None,
+        **kw,
+    ) -> None:
+        super().__init__(master, **kw)
+        self._visible_rows = visible_rows
+        self._fields: List[FieldGui] = []
+        self._rows: List[FieldRow] = []
+        self._first_row = 0
+        self._scrollbar: Optional[ttk.Scrollbar] = None
+
+        # Context menu of a row, operating on the field shown on that row
+        self._right_click_button = right_click_button
+        self._menu_field: Optional[FieldGui] = None
+        self._menu = Menu(self.winfo_toplevel(), tearoff=0)
+        self._menu.add_command(
+            label="Move field up", command=lambda: self._move_menu_field(-1)
+        )
+        self._menu.add_command(
+            label="Move field down", command=lambda: self._move_menu_field(1)
+        )
+        self._menu.add_command(
+            label="Remove field",
+            command=lambda: (remove_command or self.remove_field)(self._menu_field),
+        )
+
+    @property
+    def fields(self) -> List[FieldGui]:
+        """All fields of the table, including the ones scrolled out of view"""
+        return list(self._fields)
+
+    def add_field(self, field: FieldGui) -> None:
+        """Add a field as the last row of the table"""
+        # If no previous fields, add labels first
+        if not self._fields:
+            self._add_header()
+
+        self._fields.append(field)
+        if len(self._rows) < self._visible_rows:
+            row = FieldRow(self, field, len(self._rows) + 1)
+            for widget in row.widgets:
+                self._bind_mouse_wheel(widget)
+                widget.bind(
+                    self._right_click_button,
+                    lambda event, row=row: self._show_menu(event, row),
+                )
+            self._rows.append(row)
+        self._update_scrollbar()
+
+    def remove_field(self, field: FieldGui) -> None:
+        """Remove a field, only rebinding the visible rows below it"""
+        self._fields.remove(field)
+        if not self._fields:
+            self.clear()
+            return
+
+        if len(self._rows) > len(self._fields):
+            self._rows.pop().destroy()
+        self._first_row = min(
+            self._first_row, max(len(self._fields) - self._visible_rows, 0)
+        )
+        self._bind_rows()
+        self._update_scrollbar()
+
+    def move_field(self, field: FieldGui, index: int) -> None:
+        """Move a field to another position in the table"""
+        self._fields.remove(field)
+        self._fields.insert(min(max(index, 0), len(self._fields)), field)
+        self._bind_rows()
+
+    def sort_fields(self, key: Callable[[FieldGui], Any], reverse=False) -> None:
+        """Sort the fields in place, only rebinding the visible rows"""
+        self._fields.sort(key=key, reverse=reverse)
+        self._bind_rows()
+
+    def clear(self) -> None:
+        """Remove all fields and destroy all widgets of the table"""
+        for row in self._rows:
+            row.destroy()
+        for widget in self.winfo_children():
+            widget.destroy()
+
+        self._fields.clear()
+        self._rows.clear()
+        self._first_row = 0
+        self._scrollbar = None
+
+    def scroll(self, *args) -> None:
+        """Scroll the table, taking the arguments of a scrollbar command"""
+        if not self._fields:
+            return
+
+        last_first_row = max(len(self._fields) - self._visible_rows, 0)
+        if args[0] == "moveto":
+            first_row = round(float(args[1]) * len(self._fields))
+        else:
+            step = self._visible_rows if args[2] == "pages" else 1
+            first_row = self._first_row + int(args[1]) * step
+        first_row = min(max(first_row, 0), last_first_row)
+
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._bind_rows()
+            self._update_scrollbar()
+
+    def _bind_rows(self) -> None:
+        """Bind the visible rows to their fields, skipping rows that already show
+        the right field"""
+        for index, row in enumerate(self._rows):
+            field = self._fields[self._first_row + index]
+            if row.field is not field:
+                row.bind_field(field)
+
+    def _show_menu(self, event, row: FieldRow):
+        self._menu_field = row.field
+        try:
+            self._menu.post(event.x_root, event.y_root)
+        finally:
+            self._menu.grab_release()
+        return "break"
+
+    def _move_menu_field(self, offset: int) -> None:
+        if self._menu_field in self._fields:
+            index = self._fields.index(self._menu_field)
+            self.move_field(self._menu_field, index + offset)
+
+    def _add_header(self) -> None:
+        ttk.Label(self, text="Bits", borderwidth=5).grid(
+            row=0, column=0, padx=1, pady=1
+        )
+        ttk.Label(self, text="Bin", borderwidth=5).grid(
+            row=0, column=1, padx=1, pady=1, sticky="E"
+        )
+        ttk.Label(self, text="Hex", borderwidth=5).grid(
+            row=0, column=2, padx=1, pady=1, sticky="E"
+        )
+        ttk.Label(self, text="Dec", borderwidth=5).grid(
+            row=0, column=3, padx=1, pady=1, sticky="E"
+        )
+        ttk.Label(self, text="Name", borderwidth=5).grid(
+            row=0, column=5, padx=3, pady=1, sticky="W"
+        )
+
+    def _update_scrollbar(self) -> None:
+        if len(self._fields) <= self._visible_rows:
+            if self._scrollbar is not None:
+                self._scrollbar.grid_remove()
+            return
+
+        if self._scrollbar is None:
+            self._scrollbar = ttk.Scrollbar(
+                self, orient="vertical", command=self.scroll
+            )
+            self._scrollbar.grid(
+                row=1, column=7, rowspan=self._visible_rows, sticky="NS"
+            )
+            self._bind_mouse_wheel(self._scrollbar)
+        self._scrollbar.grid()
+        self._scrollbar.set(
+            self._first_row / len(self._fields),
+            (self._first_row + self._visible_rows) / len(self._fields),
+        )
+
+    def _bind_mouse_wheel(self, widget) -> None:
+        widget.bind("<MouseWheel>", self._mouse_wheel)
+        widget.bind("<Button-4>", lambda _: self.scroll("scroll", -1, "units"))
+        widget.bind("<Button-5>", lambda _: self.scroll("scroll", 1, "units"))
+
+    def _mouse_wheel(self, event):
+        self.scroll("scroll", -1 if event.delta > 0 else 1, "units")
+
+
 class AddButton(ttk.Button):
     def __init__(self, master=None, **kw) -> None:
         super().__init__(master, text="Add field", state="disabled", **kw)
 
-    def update_selection_label(self, start, end) -> None:
+    def update_selection_label(self, start, end, field_exists=False) -> None:
         if start is not None and end is not None:
             self.configure(
-                text=f"Add field {start}:{end}",
-                state="enabled",
+                text=(
+                    f"Field {start}:{end} exists"
+                    if field_exists
+                    else f"Add field {start}:{end}"
+                ),
+                state="disabled" if field_exists else "enabled",
             )
         else:
             self.configure(text="Add field", state="disabled")
@@ -1,3 +1,62 @@
 """Register package"""
 
-from .register import DataRegister, DataField, DELIMITER
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .register import DataRegister, DataField
+from .formatting import DELIMITER
+from .layout import RegisterLayout
+
+if TYPE_CHECKING:
+    from .compiled import CompiledLayout, compile_layout, load_layout
+    from .decoder import decode, iter_decode
+    from .dump import RegisterDump
+    from .parallel import parallel_decode
+    from .history import RegisterHistory
+    from .dump_diff import diff
+    from .encoder import EncodeError, encode, encode_rows
+    from .statistics import RegisterStatistics, collect_statistics
+    from .register_map import RegisterMap
+    from .svd import (
+        iter_peripherals,
+        load_peripheral,
+        load_register,
+        load_register_map,
+    )
+    from .query import Query, compile_query
+
+# The submodule of each name that is imported on first use only, so that importing
+# the package loads just the register core
+_LAZY_NAMES = {
+    "CompiledLayout": "compiled",
+    "compile_layout": "compiled",
+    "load_layout": "compiled",
+    "decode": "decoder",
+    "iter_decode": "decoder",
+    "RegisterDump": "dump",
+    "parallel_decode": "parallel",
+    "RegisterHistory": "history",
+    "diff": "dump_diff",
+    "EncodeError": "encoder",
+    "encode": "encoder",
+    "encode_rows": "encoder",
+    "RegisterStatistics": "statistics",
+    "collect_statistics": "statistics",
+    "RegisterMap": "register_map",
+    "iter_peripherals": "svd",
+    "load_peripheral": "svd",
+    "load_register": "svd",
+    "load_register_map": "svd",
+    "Query": "query",
+    "compile_query": "query",
+}
+
+__all__ = ["DataRegister", "DataField", "DELIMITER", "RegisterLayout", *_LAZY_NAMES]
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(import_module(f".{_LAZY_NAMES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
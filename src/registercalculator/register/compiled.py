@@ -0,0 +1,209 @@
+"""Module for validating layouts once and caching them in a compiled form"""
+
+import hashlib
+import json
+import marshal
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .layout import RegisterLayout
+from .register import DataField, DataRegister
+
+# Bumped whenever the cached form changes, so older cache files are never read
+CACHE_VERSION = 2
+
+
+class CompiledLayout:
+    """A validated layout reduced to plain tuples of field names, bits, masks,
+    shifts and widths.
+
+    Bits are numbered as in the register, while masks and shifts are in bit
+    positions where bit 0 is the lsb, the same as DataField.mask and DataField.shift.
+    """
+
+    __slots__ = (
+        "bit_length",
+        "bit_0_is_lsb",
+        "names",
+        "starts",
+        "ends",
+        "masks",
+        "shifts",
+        "widths",
+    )
+
+    def __init__(
+        self,
+        bit_length: int,
+        bit_0_is_lsb: bool,
+        names: Sequence[str],
+        starts: Sequence[int],
+        ends: Sequence[int],
+    ) -> None:
+        self.bit_length = bit_length
+        self.bit_0_is_lsb = bit_0_is_lsb
+        self.names = tuple(names)
+        self.starts = tuple(starts)
+        self.ends = tuple(ends)
+
+        if bit_0_is_lsb:
+            highs, self.shifts = self.starts, self.ends
+        else:
+            highs = tuple(bit_length - start - 1 for start in self.starts)
+            self.shifts = tuple(bit_length - end - 1 for end in self.ends)
+        self.widths = tuple(high - low + 1 for high, low in zip(highs, self.shifts))
+        self.masks = tuple(
+            ((1 << width) - 1) << shift
+            for width, shift in zip(self.widths, self.shifts)
+        )
+
+    @property
+    def labels(self) -> List[str]:
+        """The labels of all fields, the same as DataField.label"""
+        return [
+            name if name else f"{start}:{end}"
+            for name, start, end in zip(self.names, self.starts, self.ends)
+        ]
+
+    def field_masks(self) -> List[Tuple[str, int, int, int]]:
+        """Return a (label, mask, shift, bit length) tuple for each field"""
+        return list(zip(self.labels, self.masks, self.shifts, self.widths))
+
+    def to_dict(self) -> dict:
+        """Return the dict representation of the layout"""
+        return {
+            "bit length": self.bit_length,
+            "bit 0 is lsb": self.bit_0_is_lsb,
+            "fields": [
+                {"name": name, "start": start, "end": end}
+                for name, start, end in zip(self.names, self.starts, self.ends)
+            ],
+        }
+
+    def to_layout(self, register: Optional[DataRegister] = None) -> RegisterLayout:
+        """Create a RegisterLayout with DataField objects for all fields"""
+        if register is None:
+            register = DataRegister(
+                bit_length=self.bit_length, bit_0_is_lsb=self.bit_0_is_lsb
+            )
+        layout = RegisterLayout(register)
+        for name, start, end in zip(self.names, self.starts, self.ends):
+            layout.append(DataField(register, start, end, name, validate=False))
+        return layout
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def compile_layout(data: dict) -> CompiledLayout:
+    """Validate the dict representation of a layout and compile it"""
+    if not isinstance(data, dict):
+        raise ValueError("Layout must be a json object.")
+    for key in ["bit length", "bit 0 is lsb", "fields"]:
+        if key not in data:
+            raise ValueError(f"Layout is missing {key!r}.")
+
+    bit_length = data["bit length"]
+    if not _is_int(bit_length) or bit_length <= 0 or bit_length % 8:
+        raise ValueError("Bit length must be a positive multiple of 8")
+    if not isinstance(data["bit 0 is lsb"], bool):
+        raise ValueError("'bit 0 is lsb' must be true or false.")
+    if not isinstance(data["fields"], list):
+        raise ValueError("'fields' must be a list.")
+
+    names, starts, ends = [], [], []
+    for index, field in enumerate(data["fields"]):
+        if not isinstance(field, dict):
+            raise ValueError(f"Field {index} must be a json object.")
+        name, start, end = field.get("name", ""), field.get("start"), field.get("end")
+        if not isinstance(name, str):
+            raise ValueError(f"Field {index}: 'name' must be a string.")
+        if not (_is_int(start) and _is_int(end)):
+            raise ValueError(f"Field {index}: 'start' and 'end' must be integers.")
+        if data["bit 0 is lsb"]:
+            high, low = start, end
+        else:
+            high, low = bit_length - start - 1, bit_length - end - 1
+        if not 0 <= low <= high < bit_length:
+            raise ValueError(f"Field {index}: Invalid bit configuration.")
+        names.append(name)
+        starts.append(start)
+        ends.append(end)
+
+    return CompiledLayout(bit_length, data["bit 0 is lsb"], names, starts, ends)
+
+
+def default_cache_dir() -> Path:
+    """Return the directory of the compiled layout cache"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "registercalculator"
+
+
+def _read_cache(cache_file: Path, key: tuple) -> Optional[CompiledLayout]:
+    try:
+        cached_key, (bit_length, bit_0_is_lsb, names, starts, ends) = marshal.loads(
+            cache_file.read_bytes()
+        )
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_key != key:
+        return None
+    return CompiledLayout(bit_length, bit_0_is_lsb, names, starts, ends)
+
+
+def _write_cache(cache_file: Path, key: tuple, layout: CompiledLayout) -> None:
+    data = marshal.dumps(
+        (
+            key,
+            (
+                layout.bit_length,
+                layout.bit_0_is_lsb,
+                layout.names,
+                layout.starts,
+                layout.ends,
+            ),
+        )
+    )
+    temporary_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file.write_bytes(data)
+        os.replace(temporary_file, cache_file)
+    except OSError:
+        temporary_file.unlink(missing_ok=True)
+
+
+def load_layout(path, cache_dir=None, use_cache: bool = True) -> CompiledLayout:
+    """Load and compile a json layout file.
+
+    The compiled layout is cached on disk in one file per layout file path, which
+    also stores the hash and modification time of the layout file. Loading an
+    unchanged file again skips parsing and validating it, and a changed file
+    replaces its cache file. A cache that cannot be read or written is ignored.
+    """
+    path = Path(path)
+    content = path.read_bytes()
+    if not use_cache:
+        return compile_layout(json.loads(content))
+
+    key = (
+        hashlib.sha256(content).hexdigest(),
+        path.stat().st_mtime_ns,
+        CACHE_VERSION,
+        marshal.version,
+    )
+    path_key = hashlib.sha256(os.fsencode(path.resolve())).hexdigest()
+    cache_file = (
+        Path(cache_dir if cache_dir is not None else default_cache_dir())
+        / f"{path_key}.layout"
+    )
+    layout = _read_cache(cache_file, key)
+    if layout is None:
+        layout = compile_layout(json.loads(content))
+        _write_cache(cache_file, key, layout)
+    return layout
@@ -0,0 +1,112 @@
+"""Module for decoding many register values against a register layout at once"""
+
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+from .compiled import CompiledLayout
+from .layout import RegisterLayout
+from .register import _import_numpy_if_available
+
+DEFAULT_CHUNK_SIZE = 65536
+
+Column = Union[array, List[int]]
+
+
+def new_column(bit_length: int) -> Column:
+    """Return an empty column using the smallest array type that fits the bit length.
+    Values wider than 64 bits are kept in a list."""
+    for typecode in "BHILQ":
+        if array(typecode).itemsize * 8 >= bit_length:
+            return array(typecode)
+    return []
+
+
+Layout = Union[RegisterLayout, CompiledLayout]
+
+
+def field_masks(layout: Layout) -> List[Tuple[str, int, int, int]]:
+    """Return a (label, mask, shift, bit length) tuple for each field in the layout"""
+    if isinstance(layout, CompiledLayout):
+        masks = layout.field_masks()
+    else:
+        masks = [
+            (field.label, field.mask, field.shift, field.bit_length) for field in layout
+        ]
+    if len({label for label, *_ in masks}) != len(masks):
+        raise ValueError("Field labels must be unique to decode.")
+    return masks
+
+
+def check_chunk_size(chunk_size: int) -> None:
+    """Raise a ValueError unless the chunk size is positive"""
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+
+
+def numpy_for(bit_length: int):
+    """Import NumPy for vectorizing the operations on registers of the bit length,
+    or return None. NumPy is used when it is installed and the register is at most
+    64 bits wide, so that the values fit into its unsigned integer types."""
+    return _import_numpy_if_available() if bit_length <= 64 else None
+
+
+def chunked(values: Iterable[int], chunk_size: int) -> Iterator[List[int]]:
+    """Split an iterable of values into lists of at most chunk_size values"""
+    check_chunk_size(chunk_size)
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def extract_column(values, mask: int, shift: int):
+    """Return the field values of a NumPy array of register values"""
+    if values.dtype.kind != "u":
+        raise TypeError("Register values must be an unsigned integer array.")
+    if mask >> (values.dtype.itemsize * 8):
+        raise ValueError("Field is not within its register's bit length.")
+    dtype = values.dtype.type
+    return (values & dtype(mask)) >> dtype(shift)
+
+
+def decode(
+    layout: Layout,
+    values: Iterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Column]:
+    """Decode register values into one column of field values per field.
+
+    The values are consumed chunk by chunk and each field is extracted from a whole
+    chunk at a time, so no register or field objects are touched per value.
+    A NumPy array of values is decoded into NumPy columns in a single pass.
+    """
+    return decode_masks(field_masks(layout), values, chunk_size)
+
+
+def decode_masks(
+    masks: List[Tuple[str, int, int, int]],
+    values: Iterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Column]:
+    """Decode register values using the (label, mask, shift, bit length) tuples
+    returned by field_masks"""
+    if hasattr(values, "dtype") and hasattr(values, "ndim"):
+        return {
+            label: extract_column(values, mask, shift)
+            for label, mask, shift, _ in masks
+        }
+
+    columns = {label: new_column(bit_length) for label, _, _, bit_length in masks}
+
+    for chunk in chunked(values, chunk_size):
+        for label, mask, shift, _ in masks:
+            columns[label].extend([(value & mask) >> shift for value in chunk])
+
+    return columns
+
+
+def iter_decode(layout: Layout, values: Iterable[int]) -> Iterator[Dict[str, int]]:
+    """Lazily decode register values into one dict of field values per value"""
+    masks = [(label, mask, shift) for label, mask, shift, _ in field_masks(layout)]
+    for value in values:
+        yield {label: (value & mask) >> shift for label, mask, shift in masks}
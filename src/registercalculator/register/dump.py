@@ -0,0 +1,105 @@
+"""Module for reading binary dumps of register values"""
+
+import mmap
+import sys
+from array import array
+from typing import Iterator, Union
+
+from .register import swap_bytes
+
+WORD_TYPECODES = {array(typecode).itemsize * 8: typecode for typecode in "QLIHB"}
+
+
+class RegisterDump:
+    """A memory-mapped binary file of consecutive register values.
+
+    The file is exposed as a read-only sequence of register words. Indexing returns
+    an int and slicing returns an array, so only the requested part of the file is
+    ever copied into memory. Words stored in the other byte order than the native
+    one are byte swapped the same way as DataRegister.swap_bytes does.
+    """
+
+    def __init__(
+        self,
+        path,
+        bit_length: int = 32,
+        byteorder: str = sys.byteorder,
+        offset: int = 0,
+    ) -> None:
+        if bit_length not in WORD_TYPECODES:
+            raise ValueError("Bit length must be 8, 16, 32 or 64")
+        if byteorder not in ["little", "big"]:
+            raise ValueError("Byte order must be 'little' or 'big'")
+
+        self._bit_length = bit_length
+        self._typecode = WORD_TYPECODES[bit_length]
+        self._swap = byteorder != sys.byteorder and bit_length > 8
+
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        size = self._file.seek(0, 2)
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+
+        word_size = bit_length // 8
+        length = max(size - offset, 0) // word_size
+        self._buffer = memoryview(self._mmap if self._mmap is not None else b"")
+        self._bytes = self._buffer[offset : offset + length * word_size]
+        self._words = self._bytes.cast(self._typecode)
+
+    @property
+    def bit_length(self) -> int:
+        """The bit length of each register word"""
+        return self._bit_length
+
+    @property
+    def words(self) -> memoryview:
+        """Zero-copy view of the register words, in the file's byte order"""
+        return self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            words = array(self._typecode)
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                word_size = self._bit_length // 8
+                with self._bytes[start * word_size : stop * word_size] as view:
+                    words.frombytes(view)
+            else:
+                with self._words[index] as view:
+                    words.frombytes(view.tobytes())
+            if self._swap:
+                words.byteswap()
+            return words
+
+        word = self._words[index]
+        return swap_bytes(word, self._bit_length) if self._swap else word
+
+    def __iter__(self) -> Iterator[int]:
+        for chunk in self.chunks():
+            yield from chunk
+
+    def chunks(self, chunk_size: int = 65536) -> Iterator[array]:
+        """Yield the register words as arrays of at most chunk_size words"""
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive.")
+        for start in range(0, len(self), chunk_size):
+            yield self[start : start + chunk_size]
+
+    def close(self) -> None:
+        """Release the memory map and close the file"""
+        self._words.release()
+        self._bytes.release()
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "RegisterDump":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -0,0 +1,163 @@
+"""Module for comparing two sequences of register values field by field"""
+
+from typing import Dict, List, Sequence, Tuple
+
+from .decoder import (
+    DEFAULT_CHUNK_SIZE,
+    Layout,
+    check_chunk_size,
+    field_masks,
+    numpy_for,
+)
+
+DEFAULT_MAX_OFFSETS = 10
+
+
+class FieldDiff:
+    """The number of values where a field differs and the first offsets of them"""
+
+    __slots__ = ("label", "mask", "count", "offsets")
+
+    def __init__(self, label: str, mask: int) -> None:
+        self.label = label
+        self.mask = mask
+        self.count = 0
+        self.offsets: List[int] = []
+
+    def to_dict(self) -> dict:
+        """Return the dict representation of the field difference"""
+        return {"count": self.count, "offsets": list(self.offsets)}
+
+
+class DumpDiff:
+    """The differences between two equally long sequences of register values: the
+    number of differing values, the first offsets of them and the same per field"""
+
+    __slots__ = ("length", "count", "offsets", "fields")
+
+    def __init__(self, length: int, labels_and_masks: List[Tuple[str, int]]) -> None:
+        self.length = length
+        self.count = 0
+        self.offsets: List[int] = []
+        self.fields: Dict[str, FieldDiff] = {
+            label: FieldDiff(label, mask) for label, mask in labels_and_masks
+        }
+
+    @property
+    def changed_fields(self) -> List[FieldDiff]:
+        """The fields that differ in any value, in layout order"""
+        return [field for field in self.fields.values() if field.count]
+
+    def to_dict(self) -> dict:
+        """Return the dict representation of the differences"""
+        return {
+            "length": self.length,
+            "count": self.count,
+            "offsets": list(self.offsets),
+            "fields": {label: field.to_dict() for label, field in self.fields.items()},
+        }
+
+
+def byte_field_table(masks: Sequence[int], bit_length: int) -> List[List[int]]:
+    """Return a table per register byte that maps the byte's value to a bit set of
+    the fields overlapping its set bits, where bit i is the field of masks[i]"""
+    table = [[0] * 256 for _ in range(-(-bit_length // 8))]
+    for index, mask in enumerate(masks):
+        for byte, byte_table in enumerate(table):
+            byte_mask = (mask >> (byte * 8)) & 0xFF
+            if byte_mask:
+                for value in range(256):
+                    if value & byte_mask:
+                        byte_table[value] |= 1 << index
+    return table
+
+
+def diff(
+    layout: Layout,
+    first: Sequence[int],
+    second: Sequence[int],
+    max_offsets: int = DEFAULT_MAX_OFFSETS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> DumpDiff:
+    """Compare two equally long sequences of register values, such as lists, arrays,
+    NumPy arrays or RegisterDump files, and count the values where each field of
+    the layout differs.
+
+    The values are XORed chunk by chunk, with NumPy if numpy_for the bit length
+    returns it. Otherwise the changed bits of each differing value are mapped to
+    fields through a table per register byte, so each differing value costs one
+    lookup per byte whatever the number of fields.
+    """
+    if len(first) != len(second):
+        raise ValueError("Register sequences must have the same length.")
+    check_chunk_size(chunk_size)
+
+    result = DumpDiff(
+        len(first), [(label, mask) for label, mask, _, _ in field_masks(layout)]
+    )
+    numpy = numpy_for(layout.bit_length)
+    table = None
+    if numpy is None:
+        table = byte_field_table(
+            [field.mask for field in result.fields.values()], layout.bit_length
+        )
+
+    for start in range(0, len(first), chunk_size):
+        stop = start + chunk_size
+        if table is None:
+            _diff_arrays(
+                result, numpy, first[start:stop], second[start:stop], start, max_offsets
+            )
+        else:
+            _diff_values(
+                result, table, first[start:stop], second[start:stop], start, max_offsets
+            )
+    return result
+
+
+def _diff_arrays(result: DumpDiff, numpy, first, second, start, max_offsets) -> None:
+    """XOR a chunk of values with NumPy and mask the differences per field"""
+    xors = numpy.asarray(first, dtype=numpy.uint64) ^ numpy.asarray(
+        second, dtype=numpy.uint64
+    )
+    changed = numpy.flatnonzero(xors)
+    changed_xors = xors[changed]
+    _add(result, changed, start, max_offsets)
+    for field in result.fields.values():
+        _add(
+            field,
+            changed[numpy.flatnonzero(changed_xors & numpy.uint64(field.mask))],
+            start,
+            max_offsets,
+        )
+
+
+def _add(difference, offsets, start: int, max_offsets: int) -> None:
+    """Count the differing offsets of a NumPy chunk and keep the first ones"""
+    difference.count += len(offsets)
+    missing = max_offsets - len(difference.offsets)
+    if missing > 0:
+        difference.offsets.extend(int(offset) + start for offset in offsets[:missing])
+
+
+def _diff_values(result: DumpDiff, table, first, second, start, max_offsets) -> None:
+    """XOR a chunk of values one by one and look up the fields of the differences"""
+    fields = list(result.fields.values())
+    for offset, (first_value, second_value) in enumerate(zip(first, second), start):
+        xor = first_value ^ second_value
+        if not xor:
+            continue
+        result.count += 1
+        if len(result.offsets) < max_offsets:
+            result.offsets.append(offset)
+
+        field_bits = 0
+        for byte, byte_table in enumerate(table):
+            field_bits |= byte_table[(xor >> (byte * 8)) & 0xFF]
+        while field_bits:
+            low_bit = field_bits & -field_bits
+            field = fields[low_bit.bit_length() - 1]
+            field.count += 1
+            if len(field.offsets) < max_offsets:
+                field.offsets.append(offset)
+            field_bits ^= low_bit
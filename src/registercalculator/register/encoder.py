@@ -0,0 +1,178 @@
+"""Module for packing field values into register values in bulk"""
+
+import sys
+from array import array
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+from .decoder import Layout, field_masks, numpy_for
+from .dump import WORD_TYPECODES
+
+OUTPUTS = ("list", "array", "numpy", "bytes")
+
+# Number of failing rows listed per field in the error message
+MAX_REPORTED_ROWS = 10
+
+
+class EncodeError(ValueError):
+    """Field values that cannot fit into their fields. The failing row indices are
+    listed per field label in rows."""
+
+    def __init__(self, rows: Dict[str, List[int]]) -> None:
+        self.rows = rows
+        details = "; ".join(
+            f"{label} in rows {', '.join(map(str, failed[:MAX_REPORTED_ROWS]))}"
+            + (", ..." if len(failed) > MAX_REPORTED_ROWS else "")
+            for label, failed in rows.items()
+        )
+        super().__init__(f"Value cannot fit into field: {details}")
+
+
+def encode(
+    layout: Layout,
+    columns: Mapping[str, Sequence[int]],
+    output: str = "list",
+    initial: int = 0,
+    byteorder: str = sys.byteorder,
+):
+    """Pack columns of field values, keyed by field label, into register values.
+
+    Fields without a column keep their bits of the initial register value, and
+    overlapping fields are written in layout order like DataField.value does. All
+    values are range checked before any value is packed, with NumPy if numpy_for the
+    bit length returns it, and an EncodeError lists the failing rows of each field.
+
+    The register values are returned as a list of ints, an array, a NumPy array or
+    the raw bytes of the values in byteorder, which RegisterDump can read back.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Output must be one of {', '.join(OUTPUTS)}")
+    if byteorder not in ["little", "big"]:
+        raise ValueError("Byte order must be 'little' or 'big'")
+    masks = {
+        label: (mask, shift, bit_length)
+        for label, mask, shift, bit_length in field_masks(layout)
+    }
+    unknown = set(columns) - set(masks)
+    if unknown:
+        raise ValueError(f"Unknown field labels: {', '.join(sorted(unknown))}")
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("Field columns must have the same length.")
+    length = lengths.pop() if lengths else 0
+    bit_length = layout.bit_length
+    if output in ("array", "numpy") and bit_length not in WORD_TYPECODES:
+        raise ValueError("Bit length must be 8, 16, 32 or 64 for array output")
+    initial &= (1 << bit_length) - 1
+
+    numpy = numpy_for(bit_length)
+    if numpy is None:
+        if output == "numpy":
+            raise ImportError("NumPy is required for NumPy output")
+        return _encode_values(
+            columns, masks, length, output, initial, bit_length, byteorder
+        )
+    return _encode_arrays(
+        numpy, columns, masks, length, output, initial, bit_length, byteorder
+    )
+
+
+def encode_rows(layout: Layout, rows: Iterable[Mapping[str, int]], **kwargs):
+    """Pack rows of field values, each a dict keyed by field label, into register
+    values. Fields missing from some rows are zero in those rows and fields missing
+    from all rows keep the initial value. See encode for the arguments."""
+    rows = list(rows)
+    labels = set().union(*rows)
+    columns = {label: [row.get(label, 0) for row in rows] for label in labels}
+    return encode(layout, columns, **kwargs)
+
+
+def _check_values(column: Sequence[int], bit_length: int) -> List[int]:
+    """Return the rows of a column with values that do not fit the field"""
+    max_value = (1 << bit_length) - 1
+    return [row for row, value in enumerate(column) if not 0 <= value <= max_value]
+
+
+def _encode_values(columns, masks, length, output, initial, bit_length, byteorder):
+    """Range check and pack the columns value by value"""
+    failed = {
+        label: rows
+        for label, column in columns.items()
+        if (rows := _check_values(column, masks[label][2]))
+    }
+    if failed:
+        raise EncodeError(failed)
+
+    words = [initial] * length
+    for label, (mask, shift, _) in masks.items():
+        if label in columns:
+            inverted_mask = ~mask
+            words = [
+                (word & inverted_mask) | (value << shift)
+                for word, value in zip(words, columns[label])
+            ]
+
+    if output == "array":
+        return array(WORD_TYPECODES[bit_length], words)
+    if output == "bytes":
+        word_size = bit_length // 8
+        return b"".join(word.to_bytes(word_size, byteorder) for word in words)
+    return words
+
+
+def _as_integer_array(numpy, column):
+    """Return a column as a NumPy integer array, or None if its values do not fit
+    into one integer type"""
+    if isinstance(column, numpy.ndarray):
+        if column.dtype.kind not in "iu":
+            raise TypeError("Field values must be integers.")
+        return column
+    try:
+        return numpy.asarray(column, dtype=numpy.int64)
+    except OverflowError:
+        pass
+    try:
+        return numpy.asarray(column, dtype=numpy.uint64)
+    except OverflowError:
+        return None
+
+
+def _encode_arrays(
+    numpy, columns, masks, length, output, initial, bit_length, byteorder
+):
+    """Range check and pack the columns with NumPy"""
+    arrays = {}
+    failed = {}
+    for label, column in columns.items():
+        values = _as_integer_array(numpy, column)
+        if values is None:
+            rows = _check_values(column, masks[label][2])
+        else:
+            rows = numpy.flatnonzero(
+                (values < 0) | (values > (1 << masks[label][2]) - 1)
+            ).tolist()
+        if rows:
+            failed[label] = rows
+        arrays[label] = values
+    if failed:
+        raise EncodeError(failed)
+
+    word_bits = next(bits for bits in sorted(WORD_TYPECODES) if bits >= bit_length)
+    dtype = numpy.dtype(f"uint{word_bits}")
+    words = numpy.full(length, initial, dtype=dtype)
+    for label, (mask, shift, _) in masks.items():
+        if label in arrays:
+            words &= dtype.type(~mask & ((1 << word_bits) - 1))
+            words |= arrays[label].astype(dtype) << dtype.type(shift)
+
+    if output == "numpy":
+        return words
+    if output == "array":
+        return array(WORD_TYPECODES[bit_length], words.tobytes())
+    if output == "bytes":
+        if bit_length == word_bits:
+            return words.astype(
+                dtype.newbyteorder("<" if byteorder == "little" else ">")
+            ).tobytes()
+        word_size = bit_length // 8
+        return b"".join(word.to_bytes(word_size, byteorder) for word in words.tolist())
+    return words.tolist()
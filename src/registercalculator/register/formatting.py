@@ -0,0 +1,61 @@
+"""Module with cached widths and lookup tables for rendering register values"""
+
+from typing import Dict
+
+DELIMITER = "_"
+
+# Binary strings of every nibble, and of every byte with a delimiter between its nibbles
+NIBBLES = tuple(f"{nibble:04b}" for nibble in range(16))
+DELIMITED_BYTES = tuple(
+    f"{NIBBLES[byte >> 4]}{DELIMITER}{NIBBLES[byte & 0xF]}" for byte in range(256)
+)
+
+# String widths of the max values per bit length, filled in on first use
+_DEC_WIDTHS: Dict[int, int] = {}
+_HEX_WIDTHS: Dict[int, int] = {}
+
+
+def max_value(bit_length: int) -> int:
+    """Return the max value of a bit length"""
+    return (1 << bit_length) - 1
+
+
+def max_dec_width(bit_length: int) -> int:
+    """Return the maximum decimal value string width of a bit length"""
+    width = _DEC_WIDTHS.get(bit_length)
+    if width is None:
+        width = _DEC_WIDTHS[bit_length] = len(f"{max_value(bit_length)}")
+    return width
+
+
+def max_hex_width(bit_length: int) -> int:
+    """Return the maximum hexadecimal value string width of a bit length"""
+    width = _HEX_WIDTHS.get(bit_length)
+    if width is None:
+        width = _HEX_WIDTHS[bit_length] = len(f"{max_value(bit_length):X}")
+    return width
+
+
+def to_bin(value: int, bit_length: int) -> str:
+    """Return the binary string of a value, zero padded to the bit length"""
+    return f"{value:0{bit_length}b}"
+
+
+def to_bin_delimited(value: int, bit_length: int) -> str:
+    """Return the binary string of a value, zero padded to the bit length and
+    delimited each fourth bit counted from the msb"""
+    if bit_length % 8 == 0:
+        return DELIMITER.join(
+            map(DELIMITED_BYTES.__getitem__, value.to_bytes(bit_length // 8, "big"))
+        )
+
+    if bit_length % 4 == 0:
+        low_bit_length = bit_length - 4
+        head = NIBBLES[value >> low_bit_length]
+        if not low_bit_length:
+            return head
+        low_bits = to_bin_delimited(value & max_value(low_bit_length), low_bit_length)
+        return f"{head}{DELIMITER}{low_bits}"
+
+    string = to_bin(value, bit_length)
+    return DELIMITER.join(string[i : i + 4] for i in range(0, bit_length, 4))
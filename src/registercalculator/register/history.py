@@ -0,0 +1,170 @@
+"""Module for recording the value history of a register"""
+
+from array import array
+from typing import Iterable, Iterator, List, Optional
+
+from .register import DataField, DataRegister
+
+DEFAULT_CAPACITY = 1024
+
+_WORD_BITS = 64
+_WORD_MASK = (1 << _WORD_BITS) - 1
+
+
+class RegisterHistory:
+    """A bounded history of register values with undo and redo.
+
+    Values are stored in a ring buffer preallocated as an array('Q') of capacity
+    entries, each using as many 64-bit words as the register's bit length needs.
+    Recording a value is O(1) and once the history is full the oldest value is
+    overwritten, so the memory used stays constant. Recording a value wider than the
+    entries reallocates the buffer once with wider entries.
+
+    Entries are indexed from the oldest (0) to the newest (-1) value. The current
+    entry is the one the register was last set to, which is the newest entry
+    unless values have been undone.
+    """
+
+    def __init__(
+        self,
+        register: DataRegister,
+        capacity: int = DEFAULT_CAPACITY,
+        bit_length: Optional[int] = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive.")
+        self._register = register
+        self._capacity = capacity
+        bit_length = bit_length if bit_length is not None else register.bit_length
+        self._words = max(-(-bit_length // _WORD_BITS), 1)
+        self._values = array("Q", bytes(capacity * self._words * 8))
+        self._start = 0
+        self._length = 0
+        self._current = -1
+        self._restoring = False
+
+        self.record(register.value)
+        register.register_observer(self._register_changed)
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of values kept"""
+        return self._capacity
+
+    @property
+    def current(self) -> int:
+        """The index of the current entry"""
+        return self._current
+
+    @property
+    def can_undo(self) -> bool:
+        """Return True if there is an older value to go back to"""
+        return self._current > 0
+
+    @property
+    def can_redo(self) -> bool:
+        """Return True if there is an undone value to go forward to"""
+        return self._current < self._length - 1
+
+    def record(self, value: int) -> None:
+        """Record a value as the new current entry, dropping any undone values"""
+        if value < 0:
+            raise ValueError("Value cannot be negative.")
+        if self._length and value == self[self._current]:
+            return
+        if value >> (self._words * _WORD_BITS):
+            self._widen(-(-value.bit_length() // _WORD_BITS))
+
+        self._length = self._current + 1
+        self._append(value)
+        self._current = self._length - 1
+
+    def undo(self) -> bool:
+        """Set the register to the previous value. Returns False if there is none."""
+        if not self.can_undo:
+            return False
+        self._restore(self._current - 1)
+        return True
+
+    def redo(self) -> bool:
+        """Set the register to the next undone value. Returns False if there is
+        none."""
+        if not self.can_redo:
+            return False
+        self._restore(self._current + 1)
+        return True
+
+    def changed_bits(self, first: int, second: int) -> int:
+        """Return a mask of the bits that differ between two entries"""
+        return self[first] ^ self[second]
+
+    def changed_fields(
+        self, first: int, second: int, fields: Iterable[DataField]
+    ) -> List[DataField]:
+        """Return the fields whose value differs between two entries"""
+        changed_bits = self.changed_bits(first, second)
+        return [field for field in fields if field.mask & changed_bits]
+
+    def clear(self) -> None:
+        """Forget all values except the register's current one"""
+        self._start = 0
+        self._length = 0
+        self._current = -1
+        self.record(self._register.value)
+
+    def close(self) -> None:
+        """Stop recording the register's values"""
+        self._register.unregister_observer(self._register_changed)
+
+    def _append(self, value: int) -> None:
+        if self._length == self._capacity:
+            self._start = (self._start + 1) % self._capacity
+            self._length -= 1
+
+        offset = (self._start + self._length) % self._capacity * self._words
+        for word in range(self._words):
+            self._values[offset + word] = value & _WORD_MASK
+            value >>= _WORD_BITS
+        self._length += 1
+
+    def _widen(self, words: int) -> None:
+        """Reallocate the ring buffer with more words per entry"""
+        values = list(self)
+        self._words = words
+        self._values = array("Q", bytes(self._capacity * words * 8))
+        self._start = 0
+        self._length = 0
+        for value in values:
+            self._append(value)
+
+    def _restore(self, index: int) -> None:
+        self._current = index
+        self._restoring = True
+        try:
+            self._register.value = self[index]
+        finally:
+            self._restoring = False
+
+    def _register_changed(self) -> None:
+        if not self._restoring:
+            self.record(self._register.value)
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("History index out of range")
+        offset = (self._start + index) % self._capacity * self._words
+        if self._words == 1:
+            return self._values[offset]
+        value = 0
+        for word in reversed(range(self._words)):
+            value = value << _WORD_BITS | self._values[offset + word]
+        return value
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(self._length):
+            yield self[index]
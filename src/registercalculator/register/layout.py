@@ -0,0 +1,167 @@
+"""Module for describing a register layout, i.e. a register and its fields"""
+
+import json
+from typing import Iterator, List, Optional, Tuple
+
+from .register import DataField, DataRegister
+
+
+class RegisterLayout:
+    """A register together with the fields defined on it.
+
+    Each field is also indexed by the bits it covers, so the fields touching a bit
+    or a bit range and the unassigned bits are found without scanning all fields.
+
+    The dict representation is the same as the one exported and imported by the GUI:
+    {"bit length": 32, "bit 0 is lsb": True, "fields": [{"name": .., "start": .., "end": ..}]}
+    """
+
+    def __init__(self, register: Optional[DataRegister] = None, name: str = "") -> None:
+        self._register = register if register is not None else DataRegister()
+        self.name = name
+        self._fields: List[DataField] = []
+        self._bit_index: List[List[DataField]] = []
+        self._assigned_mask = 0
+
+    @classmethod
+    def from_dict(cls, data: dict, name: str = "") -> "RegisterLayout":
+        """Create a layout from its dict representation"""
+        layout = cls(
+            DataRegister(
+                bit_length=data["bit length"], bit_0_is_lsb=data["bit 0 is lsb"]
+            ),
+            name,
+        )
+        for field in data["fields"]:
+            layout.add_field(field["start"], field["end"], field["name"])
+        return layout
+
+    @classmethod
+    def load(cls, file) -> "RegisterLayout":
+        """Create a layout from a json file object"""
+        return cls.from_dict(json.loads(file.read()))
+
+    def to_dict(self) -> dict:
+        """Return the dict representation of the layout"""
+        return {
+            "bit length": self._register.bit_length,
+            "bit 0 is lsb": self._register.bit_0_is_lsb,
+            "fields": [
+                {"name": field.name, "start": field.start_bit, "end": field.end_bit}
+                for field in self._fields
+            ],
+        }
+
+    @property
+    def register(self) -> DataRegister:
+        """The register the fields are defined on"""
+        return self._register
+
+    @property
+    def bit_length(self) -> int:
+        """The bit length of the register"""
+        return self._register.bit_length
+
+    @property
+    def bit_0_is_lsb(self) -> bool:
+        """Return True is bit 0 is LSB"""
+        return self._register.bit_0_is_lsb
+
+    @property
+    def fields(self) -> List[DataField]:
+        """The fields of the layout, in the order they were added"""
+        return list(self._fields)
+
+    @property
+    def labels(self) -> List[str]:
+        """The labels of all fields, in the order they were added"""
+        return [field.label for field in self._fields]
+
+    def add_field(self, start_bit: int, end_bit: int, name: str = "") -> DataField:
+        """Create a new field on the layout's register and add it"""
+        field = DataField(self._register, start_bit, end_bit, name)
+        self.append(field)
+        return field
+
+    def append(self, field: DataField) -> None:
+        """Add an existing field, which must be defined on the layout's register"""
+        if field.register is not self._register:
+            raise ValueError("Field does not belong to the layout's register.")
+        self._fields.append(field)
+
+        high_bit = field.shift + field.bit_length - 1
+        while len(self._bit_index) <= high_bit:
+            self._bit_index.append([])
+        for bit in range(field.shift, high_bit + 1):
+            self._bit_index[bit].append(field)
+        self._assigned_mask |= field.mask
+
+    def remove(self, field: DataField) -> None:
+        """Remove a field from the layout"""
+        self._fields.remove(field)
+        for bit in range(field.shift, field.shift + field.bit_length):
+            fields = self._bit_index[bit]
+            fields.remove(field)
+            if not fields:
+                self._assigned_mask &= ~(1 << bit)
+
+    def clear(self) -> None:
+        """Remove all fields from the layout"""
+        self._fields.clear()
+        self._bit_index.clear()
+        self._assigned_mask = 0
+
+    def fields_at(self, bit: int) -> List[DataField]:
+        """Return the fields covering a bit, numbered as in the register"""
+        bit = self._physical_bit(bit)
+        return list(self._bit_index[bit]) if 0 <= bit < len(self._bit_index) else []
+
+    def fields_overlapping(self, start_bit: int, end_bit: int) -> List[DataField]:
+        """Return the fields covering any bit of a bit range, numbered as in the
+        register, ordered by their lowest bit"""
+        low_bit, high_bit = self._physical_range(start_bit, end_bit)
+        fields = {}
+        for bit in range(low_bit, min(high_bit + 1, len(self._bit_index))):
+            fields.update(dict.fromkeys(self._bit_index[bit]))
+        return list(fields)
+
+    def overlaps(self, start_bit: int, end_bit: int) -> bool:
+        """Return True if any field covers a bit of a bit range"""
+        low_bit, high_bit = self._physical_range(start_bit, end_bit)
+        if high_bit < low_bit:
+            return False
+        range_mask = ((1 << (high_bit - low_bit + 1)) - 1) << low_bit
+        return bool(range_mask & self._assigned_mask)
+
+    @property
+    def unassigned_mask(self) -> int:
+        """Mask of the register bits not covered by any field"""
+        return self._register.max & ~self._assigned_mask
+
+    def unassigned_bits(self) -> List[int]:
+        """Return the register bits not covered by any field, numbered as in the
+        register"""
+        mask = self.unassigned_mask
+        bits = [bit for bit in range(self._register.bit_length) if mask >> bit & 1]
+        if not self._register.bit_0_is_lsb:
+            bits = sorted(self._physical_bit(bit) for bit in bits)
+        return bits
+
+    def _physical_range(self, start_bit: int, end_bit: int) -> Tuple[int, int]:
+        low_bit, high_bit = sorted(
+            (self._physical_bit(start_bit), self._physical_bit(end_bit))
+        )
+        return max(low_bit, 0), high_bit
+
+    def _physical_bit(self, bit: int) -> int:
+        """Convert between register bit numbering and bit positions where bit 0 is
+        the lsb"""
+        if self._register.bit_0_is_lsb:
+            return bit
+        return self._register.bit_length - bit - 1
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __iter__(self) -> Iterator[DataField]:
+        return iter(self._fields)
@@ -0,0 +1,88 @@
+"""Module for decoding large binary dumps of register values on many cores"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .decoder import (
+    Column,
+    Layout,
+    check_chunk_size,
+    decode_masks,
+    field_masks,
+    new_column,
+)
+from .dump import RegisterDump
+
+# Number of register words decoded by a worker per task
+DEFAULT_TASK_SIZE = 1 << 20
+
+_Task = Tuple[str, int, str, int, List[Tuple[str, int, int, int]], int, int]
+
+
+def _decode_task(task: _Task) -> Dict[str, Column]:
+    """Decode one word range of a dump, run in a worker process"""
+    path, bit_length, byteorder, offset, masks, start, stop = task
+    with RegisterDump(path, bit_length, byteorder, offset) as dump:
+        return decode_masks(masks, dump[start:stop])
+
+
+def parallel_decode(
+    layout: Layout,
+    path,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_TASK_SIZE,
+    byteorder: str = sys.byteorder,
+    offset: int = 0,
+) -> Dict[str, Column]:
+    """Decode a binary dump of register values into one column per field, using a
+    pool of worker processes.
+
+    The dump is split into tasks of chunk_size words. Each worker maps the file
+    itself, so only the field masks and a word range are sent to it, and the
+    decoded columns are merged in file order. The register words have the bit length
+    of the layout. Workers defaults to the number of CPUs, and with a single worker
+    the dump is decoded in the calling process.
+    """
+    check_chunk_size(chunk_size)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be positive.")
+
+    masks = field_masks(layout)
+    with RegisterDump(path, layout.bit_length, byteorder, offset) as dump:
+        length = len(dump)
+    tasks = [
+        (
+            os.fspath(path),
+            layout.bit_length,
+            byteorder,
+            offset,
+            masks,
+            start,
+            start + chunk_size,
+        )
+        for start in range(0, length, chunk_size)
+    ]
+
+    columns = {label: new_column(bit_length) for label, _, _, bit_length in masks}
+    if workers == 1 or len(tasks) <= 1:
+        _merge(columns, map(_decode_task, tasks))
+    else:
+        # Imported here as it loads multiprocessing, which slows down importing the
+        # register package
+        from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+            ProcessPoolExecutor,
+        )
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            _merge(columns, executor.map(_decode_task, tasks))
+    return columns
+
+
+def _merge(columns: Dict[str, Column], results: Iterable[Dict[str, Column]]) -> None:
+    """Append the decoded columns of each task, in task order"""
+    for result in results:
+        for label, column in result.items():
+            columns[label].extend(column)
@@ -0,0 +1,291 @@
+"""Module for filtering register values with predicates over field names
+
+A query compares fields of a layout, referred to by their labels, to integers:
+
+    STATUS.ERR == 1 and MODE in (2, 3) and not (COUNT >= 0x10 or `15:8` != 0)
+
+Comparisons use ==, !=, <, <=, > and >=, and a field alone is true when it is not
+zero. Labels that are not plain names, like the default '15:8' label, are written
+within backticks. Each comparison of a field to a constant is equivalent to
+comparing the masked register value to the constant shifted to the field, so a
+compiled query never extracts any field value.
+"""
+
+import operator
+import re
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from .decoder import (
+    DEFAULT_CHUNK_SIZE,
+    Layout,
+    check_chunk_size,
+    chunked,
+    field_masks,
+    numpy_for,
+)
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+    (?P<number>-?(?:0[xX][0-9a-fA-F_]+|0[bB][01_]+|\d[\d_]*))
+    |(?P<operator>==|!=|<=|>=|<|>|\(|\)|,)
+    |(?P<name>[A-Za-z_][\w.\[\]]*|`[^`]*`)
+    )""",
+    re.VERBOSE,
+)
+
+_KEYWORDS = {"and", "or", "not", "in"}
+
+COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# Query tree nodes are tuples of a node type and its operands:
+# ("compare", mask, operator, shifted constant), ("in", mask, frozenset of shifted
+# constants), ("not", node), ("and", [nodes]) and ("or", [nodes])
+Node = tuple
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise ValueError(
+                f"Invalid query: unexpected {expression[position:].split()[0]!r} "
+                f"at position {position}"
+            )
+        kind = match.lastgroup
+        text = match[kind]
+        start = match.start(kind)
+        if kind == "name" and text in _KEYWORDS:
+            kind = "keyword"
+        tokens.append((kind, text, start))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser of a query into a tree of mask/compare nodes"""
+
+    def __init__(self, expression: str, masks: Dict[str, Tuple[int, int]]) -> None:
+        self._tokens = _tokenize(expression)
+        self._index = 0
+        self._masks = masks
+
+    def parse(self) -> Node:
+        node = self._or()
+        if self._index < len(self._tokens):
+            self._error()
+        return node
+
+    def _peek(self) -> str:
+        if self._index < len(self._tokens):
+            return self._tokens[self._index][1]
+        return ""
+
+    def _next(self, kind: str = "") -> str:
+        if self._index >= len(self._tokens):
+            raise ValueError("Invalid query: unexpected end")
+        token_kind, text, _ = self._tokens[self._index]
+        if kind and token_kind != kind:
+            self._error()
+        self._index += 1
+        return text
+
+    def _expect(self, text: str) -> None:
+        if self._next() != text:
+            self._index -= 1
+            self._error()
+
+    def _error(self):
+        _, text, position = self._tokens[self._index]
+        raise ValueError(f"Invalid query: unexpected {text!r} at position {position}")
+
+    def _or(self) -> Node:
+        nodes = [self._and()]
+        while self._peek() == "or":
+            self._next()
+            nodes.append(self._and())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def _and(self) -> Node:
+        nodes = [self._not()]
+        while self._peek() == "and":
+            self._next()
+            nodes.append(self._not())
+        return nodes[0] if len(nodes) == 1 else _merge_equalities(nodes)
+
+    def _not(self) -> Node:
+        if self._peek() == "not":
+            self._next()
+            return ("not", self._not())
+        if self._peek() == "(":
+            self._next()
+            node = self._or()
+            self._expect(")")
+            return node
+        return self._comparison()
+
+    def _comparison(self) -> Node:
+        name = self._next("name").strip("`")
+        if name not in self._masks:
+            raise ValueError(f"Invalid query: unknown field {name!r}")
+        mask, shift = self._masks[name]
+
+        comparison = self._peek()
+        if comparison in COMPARISONS:
+            self._next()
+            return ("compare", mask, comparison, self._number() << shift)
+        if comparison in ("in", "not"):
+            negate = comparison == "not"
+            if negate:
+                self._next()
+            self._expect("in")
+            self._expect("(")
+            constants = [self._number()]
+            while self._peek() == ",":
+                self._next()
+                constants.append(self._number())
+            self._expect(")")
+            node = ("in", mask, frozenset(value << shift for value in constants))
+            return ("not", node) if negate else node
+        return ("compare", mask, "!=", 0)
+
+    def _number(self) -> int:
+        return int(self._next("number"), 0)
+
+
+def _merge_equalities(nodes: List[Node]) -> Node:
+    """Merge the equality comparisons of disjoint fields in a conjunction into one
+    comparison of the combined mask. Constants that do not fit their field are not
+    merged, as they would spill into the other fields."""
+    mask, constant = 0, 0
+    remaining = []
+    for node in nodes:
+        if (
+            node[0] == "compare"
+            and node[2] == "=="
+            and not node[1] & mask
+            and not node[3] & ~node[1]
+        ):
+            mask |= node[1]
+            constant |= node[3]
+        else:
+            remaining.append(node)
+    if mask:
+        remaining.insert(0, ("compare", mask, "==", constant))
+    return remaining[0] if len(remaining) == 1 else ("and", remaining)
+
+
+def _source(node: Node, constants: list) -> str:
+    """Return the Python source of a node as an expression of the register value v"""
+    kind = node[0]
+    if kind == "compare":
+        return f"(v & {node[1]}) {node[2]} {node[3]}"
+    if kind == "in":
+        constants.append(node[2])
+        return f"(v & {node[1]}) in c{len(constants) - 1}"
+    if kind == "not":
+        return f"not ({_source(node[1], constants)})"
+    return f" {kind} ".join(f"({_source(child, constants)})" for child in node[1])
+
+
+class Query:
+    """A query compiled into mask and compare operations on register values"""
+
+    def __init__(self, layout: Layout, expression: str) -> None:
+        masks = {label: (mask, shift) for label, mask, shift, _ in field_masks(layout)}
+        self.expression = expression
+        self._tree = _Parser(expression, masks).parse()
+
+        constants: list = []
+        source = _source(self._tree, constants)
+        namespace = {f"c{index}": value for index, value in enumerate(constants)}
+        # The source only contains integers, operators and the names above
+        self._predicate = eval(  # pylint: disable=eval-used
+            f"lambda v: {source}", {"__builtins__": {}, **namespace}
+        )
+        self._numpy = numpy_for(layout.bit_length)
+
+    def matches(self, value: int) -> bool:
+        """Return True if a register value matches the query"""
+        return self._predicate(value)
+
+    def filter(
+        self, values: Iterable[int], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield the offset and value of every matching register value, filtering
+        chunk by chunk. Sequences such as arrays, NumPy arrays and RegisterDump
+        files are sliced into chunks and filtered with NumPy if numpy_for the bit
+        length returns it."""
+        check_chunk_size(chunk_size)
+
+        if not (hasattr(values, "__len__") and hasattr(values, "__getitem__")):
+            start = 0
+            for chunk in chunked(values, chunk_size):
+                yield from self._filter_values(chunk, start)
+                start += len(chunk)
+            return
+
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start : start + chunk_size]
+            if self._numpy is None:
+                yield from self._filter_values(chunk, start)
+            else:
+                yield from self._filter_array(chunk, start)
+
+    def count(self, values: Iterable[int], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Return the number of matching register values"""
+        return sum(1 for _ in self.filter(values, chunk_size))
+
+    def _filter_values(
+        self, values: Sequence[int], start: int
+    ) -> Iterator[Tuple[int, int]]:
+        predicate = self._predicate
+        for offset, value in enumerate(values, start):
+            if predicate(value):
+                yield offset, value
+
+    def _filter_array(self, values, start: int) -> Iterator[Tuple[int, int]]:
+        numpy = self._numpy
+        words = numpy.asarray(values, dtype=numpy.uint64)
+        offsets = numpy.flatnonzero(_evaluate(numpy, self._tree, words))
+        for offset, value in zip(offsets.tolist(), words[offsets].tolist()):
+            yield start + offset, value
+
+
+def _evaluate(numpy, node: Node, words):
+    """Evaluate a node on a NumPy array of register values"""
+    kind = node[0]
+    if kind == "compare":
+        _, mask, comparison, constant = node
+        if not 0 <= constant < 1 << 64:
+            # Every masked value is within 0 and 2**64, so it compares as 0 does
+            return numpy.full(words.shape, COMPARISONS[comparison](0, constant))
+        return COMPARISONS[comparison](
+            words & numpy.uint64(mask), numpy.uint64(constant)
+        )
+    if kind == "in":
+        constants = [value for value in node[2] if 0 <= value < 1 << 64]
+        return numpy.isin(
+            words & numpy.uint64(node[1]), numpy.array(constants, dtype=numpy.uint64)
+        )
+    if kind == "not":
+        return ~_evaluate(numpy, node[1], words)
+    combine = numpy.logical_and if kind == "and" else numpy.logical_or
+    result = _evaluate(numpy, node[1][0], words)
+    for child in node[1][1:]:
+        result = combine(result, _evaluate(numpy, child, words))
+    return result
+
+
+def compile_query(layout: Layout, expression: str) -> Query:
+    """Compile a query over the field labels of a layout"""
+    return Query(layout, expression)
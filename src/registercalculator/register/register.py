@@ -1,13 +1,62 @@
 """Module for handling data registers and register fieldss"""
 
 from abc import ABC, abstractmethod
-
-DELIMITER = "_"
+from contextlib import contextmanager
+
+from .formatting import (
+    DELIMITER,
+    max_dec_width,
+    max_hex_width,
+    max_value,
+    to_bin,
+    to_bin_delimited,
+)
+
+__all__ = [
+    "ALL_BITS",
+    "DELIMITER",
+    "DataField",
+    "DataRegister",
+    "DataRegisterBase",
+    "swap_bytes",
+]
+
+# Observer mask and change set covering every bit
+ALL_BITS = -1
+
+
+def _import_numpy():
+    """Import NumPy, which is only needed for the array operations"""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ImportError(
+            "NumPy is required for array operations, "
+            "install it with 'pip install registercalculator[numpy]'"
+        ) from error
+    return numpy
+
+
+def _import_numpy_if_available():
+    """Import NumPy for optional vectorized operations, or return None"""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
+
+
+def swap_bytes(value: int, bit_length: int) -> int:
+    """Return the value with the order of its bytes reversed. The value must fit
+    within the bit length, which must be a multiple of 8."""
+    return int.from_bytes(value.to_bytes(bit_length // 8, "little"), "big")
 
 
 class DataRegisterBase(ABC):
     """Abstract class with common functionality for both registers and register fields"""
 
+    __slots__ = ("_bit_length",)
+
     def __init__(self, bit_length: int) -> None:
         self._bit_length = bit_length
 
@@ -34,34 +83,27 @@ class DataRegisterBase(ABC):
     @property
     def bin(self) -> str:
         """Return the binary string representing current value"""
-        return f"{self.value:0{self._bit_length}b}"
+        return to_bin(self.value, self._bit_length)
 
     @property
     def bin_delimited(self) -> str:
         """Return the hexadecimal string representing current value, delimited each fourth bit"""
-        string = self.bin
-
-        groups = []
-        for i in range(0, len(string), 4):
-            groups.append(string[i : i + 4])
-        string = DELIMITER.join(groups)
-
-        return string
+        return to_bin_delimited(self.value, self._bit_length)
 
     @property
     def max(self) -> int:
         """Max value of the register or field"""
-        return (2**self._bit_length) - 1
+        return max_value(self._bit_length)
 
     @property
     def max_dec_width(self) -> int:
         """The maximum decimal value string width"""
-        return len(f"{self.max}")
+        return max_dec_width(self._bit_length)
 
     @property
     def max_hex_width(self) -> int:
         """The maximum hexadecimal value string width"""
-        return len(f"{self.max:X}")
+        return max_hex_width(self._bit_length)
 
     @property
     def max_bin_width(self) -> int:
@@ -72,12 +114,22 @@ class DataRegisterBase(ABC):
 class DataRegister(DataRegisterBase):
     """Class to handle a data register"""
 
+    __slots__ = (
+        "_register_value",
+        "_observers",
+        "_batch_depth",
+        "_pending_changes",
+        "_bit_0_is_lsb",
+    )
+
     def __init__(
         self, value: int = 0, bit_length: int = 32, bit_0_is_lsb: bool = True
     ) -> None:
         super().__init__(bit_length)
         self._register_value = value
         self._observers = []
+        self._batch_depth = 0
+        self._pending_changes = 0
         self.bit_length = bit_length
         self._bit_0_is_lsb = bit_0_is_lsb
 
@@ -87,17 +139,23 @@ class DataRegister(DataRegisterBase):
 
     @value.setter
     def value(self, value: int) -> None:
+        previous_value = self._register_value
         self._register_value = value
         self._truncate()
-        self.notify_observers()
+        self.notify_observers(previous_value ^ self._register_value)
 
-    @DataRegisterBase.bit_length.setter
+    @property
+    def bit_length(self) -> int:
+        """The bit length of the maximum value"""
+        return self._bit_length
+
+    @bit_length.setter
     def bit_length(self, bit_length: int) -> None:
-        if bit_length in [8, 16, 32]:
+        if bit_length > 0 and bit_length % 8 == 0:
             self._bit_length = bit_length
             self._truncate()
         else:
-            raise ValueError("Bit length must be 8, 16 or 32")
+            raise ValueError("Bit length must be a positive multiple of 8")
         self.notify_observers()
 
     @property
@@ -111,43 +169,67 @@ class DataRegister(DataRegisterBase):
 
     def swap_bytes(self) -> None:
         """Swap all bytes of the current value."""
-        if self._bit_length == 16:
-            self._register_value = ((self._register_value >> 0x08) & 0x00FF) | (
-                (self._register_value << 0x08) & 0xFF00
-            )
-        elif self._bit_length == 32:
-            self._register_value = (
-                ((self._register_value >> 0x18) & 0x000000FF)
-                | ((self._register_value << 0x08) & 0x00FF0000)
-                | ((self._register_value >> 0x08) & 0x0000FF00)
-                | ((self._register_value << 0x18) & 0xFF000000)
-            )
-        else:
-            pass
-        self.notify_observers()
+        previous_value = self._register_value
+        self._register_value = swap_bytes(self._register_value, self._bit_length)
+        self.notify_observers(previous_value ^ self._register_value)
 
     def _truncate(self) -> None:
         self._register_value = self._register_value & self.max
 
-    def register_observer(self, callback):
-        """Register a callback to be called when the register value is changed."""
-        self._observers.append(callback)
+    def register_observer(self, callback, mask: int = ALL_BITS):
+        """Register a callback to be called when any of the bits in mask is changed.
+        By default the callback is called on every change."""
+        self._observers.append((callback, mask))
 
     def unregister_observer(self, callback):
         """Unregister a callback"""
-        self._observers.remove(callback)
-
-    def notify_observers(self):
-        """Notify all observers about a value change"""
-        for callback in self._observers:
-            callback()
+        for index, (observer, _) in enumerate(self._observers):
+            if observer == callback:
+                del self._observers[index]
+                return
+        raise ValueError("Callback is not registered.")
+
+    def notify_observers(self, changed_bits: int = ALL_BITS):
+        """Notify the observers whose mask overlaps the changed bits about a change.
+        By default all observers are notified."""
+        if self._batch_depth:
+            self._pending_changes |= changed_bits
+            return
+
+        self._pending_changes = 0
+        for callback, mask in self._observers:
+            if mask & changed_bits:
+                callback()
+
+    @contextmanager
+    def batch_notifications(self):
+        """Context manager that holds back observer notifications during a compound
+        update. Observers are notified once about all held back changes when the
+        outermost batch ends."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_changes:
+                self.notify_observers(self._pending_changes)
 
 
 class DataField(DataRegisterBase):
     """Class to handle a data register field"""
 
-    def __init__(self, register: DataRegister, start_bit: int, end_bit: int) -> None:
+    __slots__ = ("_register", "name", "_start_bit", "_end_bit", "_mask")
+
+    def __init__(
+        self,
+        register: DataRegister,
+        start_bit: int,
+        end_bit: int,
+        name: str = "",
+        validate: bool = True,
+    ) -> None:
         self._register = register
+        self.name = name
 
         if self._register.bit_0_is_lsb:
             self._start_bit = start_bit
@@ -156,7 +238,8 @@ class DataField(DataRegisterBase):
             self._start_bit = self._register.bit_length - start_bit - 1
             self._end_bit = self._register.bit_length - end_bit - 1
 
-        if (
+        # Fields of a compiled layout are validated already
+        if validate and (
             (self._start_bit > register.bit_length - 1)
             or (self._start_bit < 0)
             or (self._end_bit < 0)
@@ -184,6 +267,60 @@ class DataField(DataRegisterBase):
         else:
             raise ValueError("Value cannot fit into field.")
 
+    def extract(self, register_values):
+        """Return the field values of a NumPy array of register values"""
+        numpy = _import_numpy()
+        register_values = numpy.asarray(register_values)
+        dtype = self._array_dtype(numpy, register_values)
+        return (register_values & dtype(self._mask)) >> dtype(self._end_bit)
+
+    def insert(self, register_values, field_values):
+        """Return a copy of a NumPy array of register values where the field is set
+        to the corresponding values of a NumPy array of field values"""
+        numpy = _import_numpy()
+        register_values = numpy.asarray(register_values)
+        field_values = numpy.asarray(field_values)
+        dtype = self._array_dtype(numpy, register_values)
+
+        if field_values.size and (
+            field_values.max() > self.max or field_values.min() < 0
+        ):
+            raise ValueError("Value cannot fit into field.")
+
+        inverted_mask = dtype(numpy.iinfo(dtype).max ^ self._mask)
+        return (register_values & inverted_mask) | (
+            field_values.astype(dtype) << dtype(self._end_bit)
+        )
+
+    def _array_dtype(self, numpy, register_values):
+        if register_values.dtype.kind != "u":
+            raise TypeError("Register values must be an unsigned integer array.")
+        if self._start_bit >= min(
+            self._register.bit_length, register_values.dtype.itemsize * 8
+        ):
+            raise ValueError("Field is not within its register's bit length.")
+        return numpy.dtype(register_values.dtype).type
+
+    @property
+    def mask(self) -> int:
+        """Mask of the field's bits within its register"""
+        return self._mask
+
+    @property
+    def shift(self) -> int:
+        """Number of bits the field is shifted up within its register"""
+        return self._end_bit
+
+    @property
+    def label(self) -> str:
+        """The field name, or its bit range if the field is unnamed"""
+        return self.name if self.name else f"{self.start_bit}:{self.end_bit}"
+
+    @property
+    def register(self) -> DataRegister:
+        """The register the field belongs to"""
+        return self._register
+
     @property
     def start_bit(self):
         """Return the number of the first bit included in the field"""
@@ -208,8 +345,8 @@ class DataField(DataRegisterBase):
         return self._register.bit_0_is_lsb
 
     def register_observer(self, callback) -> None:
-        """Register a callback to be called when the register value is changed."""
-        self._register.register_observer(callback)
+        """Register a callback to be called when the field's bits are changed."""
+        self._register.register_observer(callback, self._mask)
 
     def unregister_observer(self, callback) -> None:
         """Unregister a callback."""
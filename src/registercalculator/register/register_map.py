@@ -0,0 +1,103 @@
+"""Module for handling a map of many registers keyed by address"""
+
+import json
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Tuple
+
+from .layout import RegisterLayout
+
+
+class RegisterMap:
+    """Register layouts keyed by address.
+
+    Registers are looked up by address in a dict, while a sorted list of the
+    addresses serves range queries. The dict representation extends the one of
+    RegisterLayout with an address and a name per register:
+    {"registers": [{"address": 0, "name": .., "bit length": .., ..., "fields": [..]}]}
+    """
+
+    def __init__(self) -> None:
+        self._layouts: Dict[int, RegisterLayout] = {}
+        self._addresses: List[int] = []
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RegisterMap":
+        """Create a register map from its dict representation"""
+        register_map = cls()
+        for register in data["registers"]:
+            register_map.add(
+                register["address"],
+                RegisterLayout.from_dict(register, register.get("name", "")),
+            )
+        return register_map
+
+    @classmethod
+    def load(cls, file) -> "RegisterMap":
+        """Create a register map from a json file object"""
+        return cls.from_dict(json.loads(file.read()))
+
+    def to_dict(self) -> dict:
+        """Return the dict representation of the register map"""
+        return {
+            "registers": [
+                {"address": address, "name": layout.name, **layout.to_dict()}
+                for address, layout in self.items()
+            ]
+        }
+
+    def add(self, address: int, layout: RegisterLayout) -> None:
+        """Add a register layout at an address"""
+        if address < 0:
+            raise ValueError("Address cannot be negative.")
+        if address in self._layouts:
+            raise ValueError(f"Address {address:#x} is already in use.")
+        self._layouts[address] = layout
+        insort(self._addresses, address)
+
+    def remove(self, address: int) -> RegisterLayout:
+        """Remove and return the register layout at an address"""
+        layout = self._layouts.pop(address)
+        del self._addresses[bisect_left(self._addresses, address)]
+        return layout
+
+    def items(self) -> Iterator[Tuple[int, RegisterLayout]]:
+        """Iterate over (address, layout) pairs in address order"""
+        for address in self._addresses:
+            yield address, self._layouts[address]
+
+    def in_range(self, start: int, stop: int) -> List[Tuple[int, RegisterLayout]]:
+        """Return the (address, layout) pairs with start <= address < stop"""
+        first = bisect_left(self._addresses, start)
+        last = bisect_left(self._addresses, stop, lo=first)
+        return [
+            (address, self._layouts[address]) for address in self._addresses[first:last]
+        ]
+
+    def apply_dump(self, data, base_address: int = 0, byteorder: str = "little") -> int:
+        """Set the value of every register contained in a memory dump, where the
+        first byte of data is at base_address. Returns the number of registers set."""
+        registers_set = 0
+        with memoryview(data) as view:
+            for address, layout in self.in_range(
+                base_address, base_address + len(view)
+            ):
+                offset = address - base_address
+                size = layout.bit_length // 8
+                if offset + size <= len(view):
+                    layout.register.value = int.from_bytes(
+                        view[offset : offset + size], byteorder
+                    )
+                    registers_set += 1
+        return registers_set
+
+    def __getitem__(self, address: int) -> RegisterLayout:
+        return self._layouts[address]
+
+    def __contains__(self, address: int) -> bool:
+        return address in self._layouts
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._addresses)
@@ -0,0 +1,202 @@
+"""Module for aggregating field statistics over many register values"""
+
+import json
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from .decoder import (
+    DEFAULT_CHUNK_SIZE,
+    Layout,
+    check_chunk_size,
+    chunked,
+    field_masks,
+    numpy_for,
+)
+
+# Maximum number of distinct values counted per field, which bounds the memory used
+DEFAULT_MAX_BINS = 4096
+
+
+class FieldStatistics:
+    """Value range, histogram and per-bit set counts of one field.
+
+    The histogram holds at most max_bins distinct values. Values first seen after
+    that are only counted in overflow, and distinct is then unknown.
+    """
+
+    __slots__ = (
+        "label",
+        "shift",
+        "bit_length",
+        "count",
+        "min",
+        "max",
+        "histogram",
+        "overflow",
+        "bit_counts",
+        "_max_bins",
+    )
+
+    def __init__(self, label: str, shift: int, bit_length: int, max_bins: int) -> None:
+        self.label = label
+        self.shift = shift
+        self.bit_length = bit_length
+        self.count = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self.histogram: Dict[int, int] = {}
+        self.overflow = 0
+        self.bit_counts = [0] * bit_length
+        self._max_bins = max_bins
+
+    @property
+    def distinct(self) -> Optional[int]:
+        """The number of distinct values, or None if the histogram overflowed"""
+        return None if self.overflow else len(self.histogram)
+
+    def add_counts(self, counts: Iterable, minimum: int, maximum: int) -> None:
+        """Add (value, count) pairs of a chunk of field values"""
+        for value, count in counts:
+            self.count += count
+            if value in self.histogram:
+                self.histogram[value] += count
+            elif len(self.histogram) < self._max_bins:
+                self.histogram[value] = count
+            else:
+                self.overflow += count
+        self.min = minimum if self.min is None else min(self.min, minimum)
+        self.max = maximum if self.max is None else max(self.max, maximum)
+
+    def to_dict(self) -> dict:
+        """Return the dict representation of the statistics"""
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "distinct": self.distinct,
+            "histogram": {
+                str(value): count for value, count in sorted(self.histogram.items())
+            },
+            "overflow": self.overflow,
+            "bit counts": self.bit_counts,
+        }
+
+
+class RegisterStatistics:
+    """Streaming statistics of the fields of a layout over register values.
+
+    Values are added chunk by chunk with update, and the memory used does not grow
+    with the number of values. The set bits are counted per register byte through
+    a histogram of the byte values, with NumPy if numpy_for the bit length returns
+    it. Bit counts are listed from the lsb.
+    """
+
+    def __init__(self, layout: Layout, max_bins: int = DEFAULT_MAX_BINS) -> None:
+        if max_bins < 1:
+            raise ValueError("Max bins must be positive.")
+        self._layout = layout
+        self._masks = field_masks(layout)
+        self.count = 0
+        self.bit_counts = [0] * layout.bit_length
+        self.fields: Dict[str, FieldStatistics] = {
+            label: FieldStatistics(label, shift, bit_length, max_bins)
+            for label, _, shift, bit_length in self._masks
+        }
+        self._numpy = numpy_for(layout.bit_length)
+
+    def update(self, values: Iterable[int]) -> None:
+        """Add a chunk of register values"""
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        if self._numpy is not None:
+            self._update_array(self._numpy.asarray(values, dtype=self._numpy.uint64))
+        else:
+            self._update_values(values if isinstance(values, list) else list(values))
+
+        for field in self.fields.values():
+            field.bit_counts = self.bit_counts[
+                field.shift : field.shift + field.bit_length
+            ]
+
+    def _update_values(self, values: List[int]) -> None:
+        if not values:
+            return
+        self.count += len(values)
+        for byte in range(len(self.bit_counts) // 8):
+            shift = byte * 8
+            self._add_byte_counts(
+                byte, Counter([(value >> shift) & 0xFF for value in values]).items()
+            )
+        for label, mask, shift, _ in self._masks:
+            counts = Counter([(value & mask) >> shift for value in values])
+            self.fields[label].add_counts(counts.items(), min(counts), max(counts))
+
+    def _update_array(self, values) -> None:
+        numpy = self._numpy
+        if not values.size:
+            return
+        self.count += values.size
+        for byte in range(len(self.bit_counts) // 8):
+            byte_counts = numpy.bincount(
+                ((values >> numpy.uint64(byte * 8)) & numpy.uint64(0xFF)).astype(
+                    numpy.uint8
+                ),
+                minlength=256,
+            )
+            # bincount returns an array, but pylint infers its result as a tuple
+            byte_counts = byte_counts.tolist()  # pylint: disable=no-member
+            self._add_byte_counts(byte, enumerate(byte_counts))
+        for label, mask, shift, _ in self._masks:
+            field_values, counts = numpy.unique(
+                (values & numpy.uint64(mask)) >> numpy.uint64(shift), return_counts=True
+            )
+            self.fields[label].add_counts(
+                zip(field_values.tolist(), counts.tolist()),
+                int(field_values[0]),
+                int(field_values[-1]),
+            )
+
+    def _add_byte_counts(self, byte: int, counts: Iterable) -> None:
+        """Add the set bits of a histogram of one register byte's values"""
+        for value, count in counts:
+            if count:
+                for bit in range(8):
+                    if value >> bit & 1:
+                        self.bit_counts[byte * 8 + bit] += count
+
+    def to_dict(self) -> dict:
+        """Return the layout's dict representation extended with the statistics"""
+        return {
+            **self._layout.to_dict(),
+            "count": self.count,
+            "bit counts": self.bit_counts,
+            "statistics": {
+                label: field.to_dict() for label, field in self.fields.items()
+            },
+        }
+
+    def export(self, file) -> None:
+        """Write the statistics and the layout to a json file object"""
+        file.write(json.dumps(self.to_dict(), indent=4))
+
+
+def collect_statistics(
+    layout: Layout,
+    values: Iterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_bins: int = DEFAULT_MAX_BINS,
+) -> RegisterStatistics:
+    """Aggregate the statistics of register values chunk by chunk. Sequences such as
+    lists, arrays, NumPy arrays and RegisterDump files are sliced into chunks."""
+    check_chunk_size(chunk_size)
+    statistics = RegisterStatistics(layout, max_bins)
+    if hasattr(values, "__len__") and hasattr(values, "__getitem__"):
+        chunks = (
+            values[start : start + chunk_size]
+            for start in range(0, len(values), chunk_size)
+        )
+    else:
+        chunks = chunked(values, chunk_size)
+    for chunk in chunks:
+        statistics.update(chunk)
+    return statistics
@@ -0,0 +1,324 @@
+"""Module for importing register layouts from CMSIS-SVD and IP-XACT files
+
+Files are parsed incrementally with iterparse and each peripheral, or IP-XACT address
+block, is converted and discarded as soon as its end tag is read, so only one
+peripheral at a time is kept as XML elements however large the file is. Converted
+peripherals are only kept while parsing if a later peripheral is derived from them.
+
+Every register is returned as the dict representation of a RegisterMap entry,
+which is also the layout dict exported and imported by the GUI:
+{"address": .., "name": .., "bit length": .., "bit 0 is lsb": True, "fields": [..]}
+"""
+
+import os
+import re
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set
+
+from .layout import RegisterLayout
+from .register_map import RegisterMap
+
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element
+
+DEFAULT_REGISTER_SIZE = 32
+
+# Size of the chunks read when scanning a file for derivedFrom attributes
+SCAN_CHUNK_SIZE = 1 << 20
+
+_BIT_RANGE = re.compile(r"\[\s*(\w+)\s*:\s*(\w+)\s*\]")
+_DERIVED_FROM = re.compile(rb"""derivedFrom\s*=\s*["']([^"']*)["']""")
+
+
+class Peripheral:
+    """A peripheral, or IP-XACT address block, and its registers"""
+
+    __slots__ = ("name", "base_address", "registers")
+
+    def __init__(self, name: str, base_address: int, registers: List[dict]) -> None:
+        self.name = name
+        self.base_address = base_address
+        self.registers = registers
+
+    def register(self, name: str) -> dict:
+        """Return the dict of a register by its name"""
+        for register in self.registers:
+            if register["name"] == name:
+                return register
+        raise ValueError(f"Register {name!r} not found in {self.name}.")
+
+    def to_register_map(self, prefix: str = "") -> RegisterMap:
+        """Create a register map of the peripheral's registers. Alternate registers
+        sharing the address of an earlier register are left out."""
+        register_map = RegisterMap()
+        add_registers(register_map, self.registers, prefix)
+        return register_map
+
+    def __len__(self) -> int:
+        return len(self.registers)
+
+
+def add_registers(
+    register_map: RegisterMap, registers: List[dict], prefix: str = ""
+) -> None:
+    """Add register dicts to a register map, skipping already used addresses"""
+    for register in registers:
+        if register["address"] not in register_map:
+            register_map.add(
+                register["address"],
+                RegisterLayout.from_dict(register, prefix + register["name"]),
+            )
+
+
+def parse_int(text: str) -> int:
+    """Parse an SVD or IP-XACT integer such as 32, 0x20, #100000 or 'h20"""
+    text = text.strip().lower()
+    if text.startswith("#"):
+        return int(text[1:], 2)
+    if "'h" in text:
+        return int(text.split("'h", 1)[1], 16)
+    if text.startswith(("0x", "0b")):
+        return int(text, 0)
+    return int(text)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _children(element: "Element", tag: str) -> Iterator["Element"]:
+    return (child for child in element if _local_name(child.tag) == tag)
+
+
+def _text(element: "Element", tag: str) -> Optional[str]:
+    child = next(_children(element, tag), None)
+    return child.text.strip() if child is not None and child.text else None
+
+
+def _dim_instances(element: "Element", name: str) -> List[tuple]:
+    """Return a (name, address increment) pair per instance of a dim array"""
+    dim = _text(element, "dim")
+    if dim is None:
+        return [(name, 0)]
+    increment = parse_int(_text(element, "dimIncrement") or "0")
+    indices = _text(element, "dimIndex")
+    if indices is None:
+        indices = [str(index) for index in range(parse_int(dim))]
+    elif "-" in indices and "," not in indices:
+        first, last = (index.strip() for index in indices.split("-"))
+        if first.isdigit() and last.isdigit():
+            indices = [str(index) for index in range(int(first), int(last) + 1)]
+        else:
+            # Letter ranges such as A-D
+            indices = [chr(index) for index in range(ord(first), ord(last) + 1)]
+    else:
+        indices = [index.strip() for index in indices.split(",")]
+    return [
+        (name.replace("[%s]", index).replace("%s", index), position * increment)
+        for position, index in enumerate(indices)
+    ]
+
+
+def _field(element: "Element", defined: Dict[str, dict]) -> dict:
+    name = _text(element, "name") or ""
+    derived_from = element.get("derivedFrom")
+    has_bit_range = any(
+        _text(element, tag) is not None for tag in ("bitOffset", "lsb", "bitRange")
+    )
+    if derived_from is not None and not has_bit_range:
+        base = defined.get(derived_from) or defined.get(derived_from.rsplit(".")[-1])
+        if base is None:
+            raise ValueError(
+                f"Field {name!r} is derived from unknown {derived_from!r}."
+            )
+        return {**base, "name": name}
+
+    bit_offset = _text(element, "bitOffset")
+    if bit_offset is not None:
+        lsb = parse_int(bit_offset)
+        msb = lsb + parse_int(_text(element, "bitWidth") or "1") - 1
+    elif _text(element, "lsb") is not None:
+        lsb = parse_int(_text(element, "lsb"))
+        msb = parse_int(_text(element, "msb"))
+    else:
+        match = _BIT_RANGE.fullmatch(_text(element, "bitRange") or "")
+        if match is None:
+            raise ValueError(f"Field {name!r} has no bit range.")
+        msb, lsb = parse_int(match[1]), parse_int(match[2])
+    return {"name": name, "start": msb, "end": lsb}
+
+
+def _fields(element: "Element", base_fields: List[dict]) -> List[dict]:
+    """Return the fields of a register element, resolving derived fields within the
+    register and the register it is derived from"""
+    defined = {field["name"]: field for field in base_fields}
+    fields = []
+    for child in _children(next(_children(element, "fields"), element), "field"):
+        field = _field(child, defined)
+        defined[field["name"]] = field
+        fields.append(field)
+    return fields
+
+
+def _base_register(
+    element: "Element", prefix: str, defined: Dict[str, dict]
+) -> Optional[dict]:
+    """Return the earlier register a register element is derived from, if any"""
+    derived_from = element.get("derivedFrom")
+    if derived_from is None:
+        return None
+    for name in (prefix + derived_from, derived_from, derived_from.partition(".")[2]):
+        if name in defined:
+            return defined[name]
+    raise ValueError(
+        f"Register {_text(element, 'name')!r} is derived from unknown "
+        f"{derived_from!r}."
+    )
+
+
+def _registers(
+    element: "Element",
+    base_address: int,
+    size: int,
+    prefix: str = "",
+    defined: Optional[Dict[str, dict]] = None,
+) -> Iterator[dict]:
+    """Yield the registers of a peripheral, cluster or register file element.
+    Registers derived from an earlier register of the peripheral inherit its size
+    and fields unless they define their own."""
+    if defined is None:
+        defined = {}
+    for child in element:
+        tag = _local_name(child.tag)
+        if tag == "registers":
+            yield from _registers(child, base_address, size, prefix, defined)
+        elif tag in ("register", "cluster", "registerFile"):
+            offset = parse_int(_text(child, "addressOffset") or "0")
+            child_size = parse_int(_text(child, "size") or str(size))
+            fields = []
+            if tag == "register":
+                base = _base_register(child, prefix, defined)
+                base_fields = base["fields"] if base is not None else []
+                fields = _fields(child, base_fields) or list(base_fields)
+                if base is not None and _text(child, "size") is None:
+                    child_size = base["bit length"]
+            for name, increment in _dim_instances(child, _text(child, "name") or ""):
+                address = base_address + offset + increment
+                if tag == "register":
+                    register = {
+                        "address": address,
+                        "name": prefix + name,
+                        "bit length": child_size,
+                        "bit 0 is lsb": True,
+                        "fields": fields,
+                    }
+                    defined[register["name"]] = register
+                    yield register
+                else:
+                    yield from _registers(
+                        child, address, child_size, f"{prefix}{name}.", defined
+                    )
+
+
+def _derived_from_names(source) -> Optional[Set[str]]:
+    """Return the names in the derivedFrom attributes of a file, scanned as raw
+    bytes, or None if the file object cannot be read twice"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            return _scan_derived_from(file)
+    if not source.seekable():
+        return None
+    position = source.tell()
+    names = _scan_derived_from(source)
+    source.seek(position)
+    return names
+
+
+def _scan_derived_from(file) -> Set[str]:
+    names = set()
+    tail = b""
+    while chunk := file.read(SCAN_CHUNK_SIZE):
+        data = tail + chunk
+        names.update(match[1].decode() for match in _DERIVED_FROM.finditer(data))
+        # Keep enough of the chunk for an attribute split across two chunks
+        tail = data[-256:]
+    return names
+
+
+def iter_peripherals(source) -> Iterator[Peripheral]:
+    """Incrementally parse an SVD or IP-XACT file, given as a path or a binary file
+    object, and yield its peripherals one at a time. IP-XACT address blocks are
+    yielded as peripherals, the address blocks within SVD peripherals are not."""
+    # Imported here as the XML parser is only needed for SVD and IP-XACT files
+    from xml.etree.ElementTree import (  # pylint: disable=import-outside-toplevel
+        iterparse,
+    )
+
+    size = DEFAULT_REGISTER_SIZE
+    derived_from = _derived_from_names(source)
+    definitions: Dict[str, Peripheral] = {}
+    depth = 0
+    peripheral_depth = 0
+    for event, element in iterparse(source, events=("start", "end")):
+        tag = _local_name(element.tag)
+        if event == "start":
+            depth += 1
+            peripheral_depth += tag == "peripheral"
+            continue
+        depth -= 1
+        if tag == "size" and depth == 1:
+            size = parse_int(element.text)
+        elif tag == "peripheral" or (tag == "addressBlock" and not peripheral_depth):
+            peripheral_depth -= tag == "peripheral"
+            peripheral = _peripheral(element, size, definitions)
+            if derived_from is None or peripheral.name in derived_from:
+                definitions[peripheral.name] = peripheral
+            element.clear()
+            yield peripheral
+
+
+def _peripheral(
+    element: "Element", size: int, definitions: Dict[str, Peripheral]
+) -> Peripheral:
+    name = _text(element, "name") or ""
+    base_address = parse_int(_text(element, "baseAddress") or "0")
+    size = parse_int(_text(element, "size") or str(size))
+    registers = list(_registers(element, base_address, size))
+
+    derived_from = element.get("derivedFrom")
+    if derived_from is not None and not registers:
+        if derived_from not in definitions:
+            raise ValueError(
+                f"Peripheral {name!r} is derived from unknown {derived_from!r}."
+            )
+        base = definitions[derived_from]
+        registers = [
+            {
+                **register,
+                "address": register["address"] - base.base_address + base_address,
+            }
+            for register in base.registers
+        ]
+    return Peripheral(name, base_address, registers)
+
+
+def load_peripheral(source, name: str) -> Peripheral:
+    """Parse an SVD or IP-XACT file only up to the end of a named peripheral"""
+    for peripheral in iter_peripherals(source):
+        if peripheral.name == name:
+            return peripheral
+    raise ValueError(f"Peripheral {name!r} not found.")
+
+
+def load_register(source, path: str) -> dict:
+    """Return the dict of a register given as 'PERIPHERAL.REGISTER'"""
+    peripheral_name, _, register_name = path.partition(".")
+    return load_peripheral(source, peripheral_name).register(register_name)
+
+
+def load_register_map(source) -> RegisterMap:
+    """Create a register map of all registers of an SVD or IP-XACT file, named
+    'PERIPHERAL.REGISTER'"""
+    register_map = RegisterMap()
+    for peripheral in iter_peripherals(source):
+        add_registers(register_map, peripheral.registers, f"{peripheral.name}.")
+    return register_map
@@ -5,17 +5,30 @@ import json
 import sys
 import tkinter as tk
 import webbrowser
-from math import log
 from pathlib import Path
 from tkinter import Frame, filedialog, ttk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
-from registercalculator.register import DataRegister
-
-from .gui_extensions import BinEntry, DecEntry, FieldGui, HexEntry, AddButton
+from registercalculator.register import (
+    DataRegister,
+    RegisterHistory,
+    RegisterLayout,
+    load_layout,
+)
+
+from .gui_extensions import (
+    AddButton,
+    BinEntry,
+    Debouncer,
+    DecEntry,
+    FieldGui,
+    FieldTable,
+    HexEntry,
+)
 
 VERSION = "1.1.1"
-BIT_LENGTHS = ["8 bits", "16 bits", "32 bits"]
+BIT_LENGTHS = ["8 bits", "16 bits", "32 bits", "64 bits"]
+DEFAULT_BIT_LENGTH = 32
 
 
 class RegisterCalculator:
@@ -24,12 +37,14 @@ class RegisterCalculator:
     def __init__(self, import_filepath=None) -> None:
         if sys.platform == "darwin":
             self.right_click_button = "<Button-2>"
+            self.shortcut_modifier = "Command"
             self.swap_button_width = 8
             self.add_button_width = 16
             self.bit_button_width = 16
             self.bit_menu_width = 7
         else:
             self.right_click_button = "<Button-3>"
+            self.shortcut_modifier = "Control"
             self.swap_button_width = 10
             self.add_button_width = 21
             self.bit_button_width = 21
@@ -53,7 +68,11 @@ class RegisterCalculator:
 
         self.topframe = Frame(self.root)
         self.topframe.pack(padx=1, pady=1)
-        self.bottomframe = Frame(self.root)
+        self.bottomframe = FieldTable(
+            self.root,
+            right_click_button=self.right_click_button,
+            remove_command=self._remove_field,
+        )
         self.bottomframe.pack(padx=1, pady=1)
 
         # Entry labels
@@ -94,17 +113,20 @@ class RegisterCalculator:
 
         # Dropdown for number of bits
         self.bit_length_string = tk.StringVar(self.root)
-        self.bit_length_string.set(BIT_LENGTHS[2])
+        self.bit_length_string.set(f"{DEFAULT_BIT_LENGTH} bits")
         self.bit_length_menu = ttk.OptionMenu(
             self.topframe,
             self.bit_length_string,
-            BIT_LENGTHS[2],
+            f"{DEFAULT_BIT_LENGTH} bits",
             *BIT_LENGTHS,
             command=self._bit_selection_clicked,
         )
         self.bit_length_menu.config(width=self.bit_menu_width)
 
-        # Bind mouse movement to handle selection of bits
+        # Bind mouse movement to handle selection of bits, once per frame
+        self._mouse_motion = Debouncer(
+            self.root, self.bin_entry.notify_observers, "Motion"
+        )
         self.bin_entry.bind("<Motion>", self._mouse_motion)
 
         # Gui layout
@@ -132,13 +154,18 @@ class RegisterCalculator:
         self.bottomframe.bind("<Expose>", self._on_expose)
 
         # Reset selection, clear fields and update all entries
-        self.fields = []
+        self.layout = RegisterLayout(self.register)
+        self._highlighted_fields = set()
 
-        self.bin_entry.register_observer(self.add_button.update_selection_label)
+        self.bin_entry.register_observer(self._selection_changed)
+
+        # Record register values for undo and redo
+        self.history = RegisterHistory(self.register)
+        self.root.bind(f"<{self.shortcut_modifier}-z>", self._undo)
+        self.root.bind(f"<{self.shortcut_modifier}-y>", self._redo)
 
         if import_filepath:
-            with open(import_filepath, "r", encoding="utf-8") as import_file:
-                self._import_fields(import_file)
+            self._import_fields(import_filepath)
         else:
             self._update_bit_button()
             self.register.notify_observers()
@@ -148,34 +175,39 @@ class RegisterCalculator:
         file = re.findall(r"{(.*?)}", event.data)[0]
 
         print(f"Dropped file: {file}")
-        with open(file, "r", encoding="utf-8") as import_file:
-            self._import_fields(import_file)
+        self._import_fields(file)
 
     @property
     def _selected_number_of_bits(self):
-        return 2 ** (BIT_LENGTHS.index(self.bit_length_string.get()) + 3)
-
-    @staticmethod
-    def _get_dropdown_index(bits: int) -> int:
-        return int(log(bits) / log(2) - 3)
+        return int(self.bit_length_string.get().split()[0])
 
     def _bit_selection_clicked(self, _):
-        self.register.bit_length = self._selected_number_of_bits
-        self.swap_button.configure(
-            state="disabled" if self.register.bit_length == 8 else "enabled"
-        )
-        self._update_bit_button()
-        self.register.notify_observers()
+        with self.register.batch_notifications():
+            self.register.bit_length = self._selected_number_of_bits
+            for entry in (self.hex_entry, self.dec_entry, self.bin_entry):
+                entry.update_width()
+            self.swap_button.configure(
+                state="disabled" if self.register.bit_length == 8 else "enabled"
+            )
+            self._update_bit_button()
+            self.register.notify_observers()
 
     def _swap_bytes_button_click(self):
         self.register.swap_bytes()
-        self.register.notify_observers()
+
+    def _undo(self, _):
+        self.history.undo()
+        return "break"
+
+    def _redo(self, _):
+        self.history.redo()
+        return "break"
 
     def _bit_order_button_click(self):
         self.register.bit_0_is_lsb = not self.register.bit_0_is_lsb
         self._update_bit_button()
         self.register.notify_observers()
-        self.bin_entry.notify_observers()
+        self.bin_entry.notify_observers(force=True)
 
     def _update_bit_button(self):
         new_button_label = (
@@ -187,24 +219,20 @@ class RegisterCalculator:
         self.bit_button.config(text=new_button_label)
 
     def _get_numbering_label(self) -> str:
-        label = ""
-        if self.register.bit_length == 8:
-            if self.register.bit_0_is_lsb:
-                label = "                              7       0"
-            else:
-                label = "                              0       7"
-        elif self.register.bit_length == 16:
-            if self.register.bit_0_is_lsb:
-                label = "                    15      8|7       0"
-            else:
-                label = "                    0       7|8      15"
-        elif self.register.bit_length == 32:
-            if self.register.bit_0_is_lsb:
-                label = "31     24|23     16|15      8|7       0"
-            else:
-                label = "0       7|8      15|16     23|24     31"
-
-        return label
+        bit_length = self.register.bit_length
+        groups = []
+        for byte in range(bit_length // 8):
+            high_bit = bit_length - 8 * byte - 1
+            low_bit = high_bit - 7
+            if not self.register.bit_0_is_lsb:
+                high_bit, low_bit = bit_length - high_bit - 1, bit_length - low_bit - 1
+
+            # Each byte spans eight bits and one delimiter in the binary entry
+            left, right = f"{high_bit}", f"{low_bit}"
+            groups.append(left + " " * (9 - len(left) - len(right)) + right)
+
+        label_width = max(bit_length, DEFAULT_BIT_LENGTH)
+        return "|".join(groups).rjust(label_width + label_width // 4 - 1)
 
     def _show_menu(self, event):
         try:
@@ -236,71 +264,72 @@ class RegisterCalculator:
         file.write(json.dumps(export_data, indent=4))
 
     def _import_dialog(self):
-        if (
-            import_file := filedialog.askopenfile(
-                filetypes=[("JSON-files", "*.json"), ("All files", "*.*")]
-            )
-        ) is not None:
-            self._import_fields(import_file)
-            import_file.close()
+        if import_filepath := filedialog.askopenfilename(
+            filetypes=[("JSON-files", "*.json"), ("All files", "*.*")]
+        ):
+            self._import_fields(import_filepath)
 
-    def _import_fields(self, file):
+    def _import_fields(self, path):
+        layout = load_layout(path)
         self._reset_fields()
-        import_data = json.loads(file.read())
-        self.root.title(f"{self.window_title} - {Path(file.name).stem}")
-        self.bit_length_string.set(
-            BIT_LENGTHS[self._get_dropdown_index(import_data["bit length"])]
-        )
-        self.register.bit_0_is_lsb = import_data["bit 0 is lsb"]
-        self._bit_selection_clicked(None)
-        for field in import_data["fields"]:
-            self._add_field(field["start"], field["end"], field["name"])
+        self.root.title(f"{self.window_title} - {Path(path).stem}")
+        self.bit_length_string.set(f"{layout.bit_length} bits")
+        self.register.bit_0_is_lsb = layout.bit_0_is_lsb
+        with self.register.batch_notifications():
+            self._bit_selection_clicked(None)
+            # The compiled layout is validated already
+            for name, start, end in zip(layout.names, layout.starts, layout.ends):
+                self._add_field(start, end, name, validate=False)
+        self.bin_entry.notify_observers(force=True)
+
+    @property
+    def fields(self) -> list:
+        """The fields in the order they are shown"""
+        return self.bottomframe.fields
 
     def _sort_fields(self):
-        sorted_fields = [field.settings for field in self.fields]
-        sorted_fields.sort(
-            key=lambda sorted_fields: sorted_fields["start"],
-            reverse=self.register.bit_0_is_lsb,
+        self.bottomframe.sort_fields(
+            key=lambda field: field.start_bit, reverse=self.register.bit_0_is_lsb
         )
 
-        self._reset_fields()
-        for field in sorted_fields:
-            self._add_field(field["start"], field["end"], field["name"])
-
     def _add_field_button_click(self):
         start_bit, end_bit = self.bin_entry.get_selection()
         if start_bit is not None and end_bit is not None:
             self._add_field(start_bit, end_bit)
             self.bin_entry.selection_clear()
-            self.bin_entry.notify_observers()
+            self.bin_entry.notify_observers(force=True)
 
-    def _add_field(self, start_bit: int, end_bit: int, name=""):
-        # If no previous fields, add labels first
-        if len(self.fields) == 0:
-            ttk.Label(self.bottomframe, text="Bits", borderwidth=5).grid(
-                row=0, column=0, padx=1, pady=1
-            )
-            ttk.Label(self.bottomframe, text="Bin", borderwidth=5).grid(
-                row=0, column=1, padx=1, pady=1, sticky="E"
-            )
-            ttk.Label(self.bottomframe, text="Hex", borderwidth=5).grid(
-                row=0, column=2, padx=1, pady=1, sticky="E"
-            )
-            ttk.Label(self.bottomframe, text="Dec", borderwidth=5).grid(
-                row=0, column=3, padx=1, pady=1, sticky="E"
-            )
-            ttk.Label(self.bottomframe, text="Name", borderwidth=5).grid(
-                row=0, column=5, padx=3, pady=1, sticky="W"
+    def _add_field(self, start_bit: int, end_bit: int, name="", validate=True):
+        # Widgets are only created if the field ends up on a visible row
+        gui_field = FieldGui(self.register, start_bit, end_bit, name, validate)
+        self.bottomframe.add_field(gui_field)
+        self.layout.append(gui_field)
+
+    def _remove_field(self, field: FieldGui):
+        self.bottomframe.remove_field(field)
+        self.layout.remove(field)
+        self._highlighted_fields.discard(field)
+        self.bin_entry.notify_observers(force=True)
+
+    def _selection_changed(self, start_bit, end_bit):
+        if start_bit is not None and end_bit is not None:
+            overlapping_fields = set(self.layout.fields_overlapping(start_bit, end_bit))
+            field_exists = any(
+                field.start_bit == start_bit and field.end_bit == end_bit
+                for field in overlapping_fields
             )
+        else:
+            overlapping_fields = set()
+            field_exists = False
 
-        # Create GUI for the field and place it on next available row
-        next_row = len(self.fields) + 1
-        gui_field = FieldGui(self.bottomframe, self.register, start_bit, end_bit, name)
-        gui_field.grid(next_row)
-        self.fields.append(gui_field)
+        # Only fields entering or leaving the selection are redrawn
+        for field in self._highlighted_fields - overlapping_fields:
+            field.highlight(False)
+        for field in overlapping_fields - self._highlighted_fields:
+            field.highlight(True)
+        self._highlighted_fields = overlapping_fields
 
-    def _mouse_motion(self, _):
-        self.bin_entry.notify_observers()
+        self.add_button.update_selection_label(start_bit, end_bit, field_exists)
 
     def _on_expose(self, event):
         widget = event.widget
@@ -308,13 +337,10 @@ class RegisterCalculator:
             widget.configure(height=1)
 
     def _reset_fields(self):
-        for field in self.fields:
-            field.unregister()
-
-        for widget in self.bottomframe.winfo_children():
-            widget.destroy()
-
-        self.fields.clear()
+        self.bottomframe.clear()
+        self.layout.clear()
+        self._highlighted_fields.clear()
+        self.bin_entry.notify_observers(force=True)
 
     def show(self):
         """Show the main window"""
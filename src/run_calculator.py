@@ -2,9 +2,14 @@
 
 import sys
 
-from registercalculator import RegisterCalculator
-
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "decode":
+        from registercalculator.cli import main
+
+        sys.exit(main(sys.argv[2:]))
+
+    from registercalculator import RegisterCalculator
+
     if len(sys.argv) > 1:
         main_window = RegisterCalculator(sys.argv[1])
     else:
@@ -0,0 +1,165 @@
+"""Fixtures shared by the test modules"""
+
+import pytest
+
+# Widget classes created by the GUI, and Tk commands whose effect is not needed
+WIDGET_CLASSES = [
+    "frame",
+    "menu",
+    "ttk::button",
+    "ttk::checkbutton",
+    "ttk::entry",
+    "ttk::label",
+    "ttk::menubutton",
+    "ttk::scrollbar",
+]
+IGNORED_COMMANDS = ["bind", "event", "focus", "grab", "pack", "wm"]
+
+
+class TkStandIn:
+    """Tk widget commands of a plain Tcl interpreter, for running the GUI widgets
+    without a display.
+
+    Widgets keep their options and whether they are gridded. Entries also keep
+    their text, insert cursor and selection, and scrollbars their position.
+    Everything else Tk would do, like drawing and events, is left out.
+    """
+
+    def __init__(self, tk) -> None:
+        self._tk = tk
+        self.widgets = {}
+        for widget_class in WIDGET_CLASSES:
+            tk.createcommand(
+                widget_class,
+                lambda path, *options, widget_class=widget_class: self._create(
+                    widget_class, path, options
+                ),
+            )
+        for command in IGNORED_COMMANDS:
+            tk.createcommand(command, lambda *_: "")
+        tk.createcommand("grid", self._grid)
+        tk.createcommand("winfo", self._winfo)
+        tk.createcommand("destroy", self._destroy)
+
+    def _create(self, widget_class, path, options):
+        self.widgets[path] = {
+            "class": widget_class,
+            "options": dict(zip(options[::2], options[1::2])),
+            "gridded": False,
+            "text": "",
+            "cursor": 0,
+            "selection": None,
+            "position": (0.0, 1.0),
+        }
+        self._tk.createcommand(
+            path, lambda *args: self._widget_command(self.widgets[path], *args)
+        )
+        return path
+
+    def _widget_command(self, widget, command, *args):
+        if command in ("configure", "config"):
+            widget["options"].update(zip(args[::2], args[1::2]))
+        elif command == "cget":
+            return widget["options"].get(args[0], "")
+        elif command == "insert":
+            index = self._index(widget, args[0])
+            widget["text"] = widget["text"][:index] + args[1] + widget["text"][index:]
+            if widget["selection"] is not None:
+                first, last = widget["selection"]
+                widget["selection"] = (
+                    first + len(args[1]) if first >= index else first,
+                    last + len(args[1]) if last > index else last,
+                )
+        elif command == "delete":
+            first = self._index(widget, args[0])
+            last = self._index(widget, args[1]) if len(args) > 1 else first + 1
+            widget["text"] = widget["text"][:first] + widget["text"][last:]
+            widget["cursor"] = min(widget["cursor"], len(widget["text"]))
+            if widget["selection"] is not None:
+                # Like Tk, the selection shrinks and is cleared once it is empty
+                selection = [
+                    index - (last - first) if index >= last else min(index, first)
+                    for index in widget["selection"]
+                ]
+                widget["selection"] = (
+                    tuple(selection) if selection[0] < selection[1] else None
+                )
+        elif command == "get":
+            if widget["class"] == "ttk::scrollbar":
+                return widget["position"]
+            return widget["text"]
+        elif command == "set":
+            widget["position"] = (float(args[0]), float(args[1]))
+        elif command == "index":
+            return self._index(widget, args[0])
+        elif command == "icursor":
+            widget["cursor"] = self._index(widget, args[0])
+        elif command == "selection":
+            if args[0] == "present":
+                return int(widget["selection"] is not None)
+            if args[0] == "range":
+                widget["selection"] = (
+                    self._index(widget, args[1]),
+                    self._index(widget, args[2]),
+                )
+            else:
+                widget["selection"] = None
+        return ""
+
+    @staticmethod
+    def _index(widget, index) -> int:
+        length = len(widget["text"])
+        if index == "end":
+            return length
+        if index == "insert":
+            return widget["cursor"]
+        if index in ("sel.first", "sel.last"):
+            return widget["selection"][index == "sel.last"]
+        return min(max(int(index), 0), length)
+
+    def _grid(self, command, *args):
+        if command == "info" and self.widgets[args[0]]["gridded"]:
+            return ("-in", args[0].rpartition(".")[0] or ".")
+        if command in ("configure", "remove", "forget") and args[0] in self.widgets:
+            self.widgets[args[0]]["gridded"] = command == "configure"
+        return ""
+
+    def _winfo(self, command, path, *_):
+        if command == "toplevel":
+            return "."
+        if command == "children":
+            prefix = "." if path == "." else f"{path}."
+            return tuple(
+                child
+                for child in self.widgets
+                if child.startswith(prefix) and "." not in child[len(prefix) :]
+            )
+        return ""
+
+    def _destroy(self, *paths):
+        for path in paths:
+            for widget in [
+                widget
+                for widget in self.widgets
+                if widget == path or widget.startswith(f"{path}.") or path == "."
+            ]:
+                del self.widgets[widget]
+                self._tk.deletecommand(widget)
+        return ""
+
+
+@pytest.fixture(name="tk_root")
+def fixture_tk_root(monkeypatch):
+    """A hidden Tk root window, or a Tcl interpreter standing in for Tk when no
+    display is available"""
+    tkinter = pytest.importorskip("tkinter")
+    try:
+        root = tkinter.Tk()
+        root.withdraw()
+    except tkinter.TclError:
+        root = tkinter.Tcl()
+        root.stand_in = TkStandIn(root.tk)
+        # Variables without a master are created in the default root
+        monkeypatch.setattr(tkinter, "_default_root", root)
+    yield root
+    root.destroy()
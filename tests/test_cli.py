@@ -0,0 +1,106 @@
+"""Command line interface tests"""
+
+import io
+import json
+
+import pytest
+
+from registercalculator.cli import main
+
+LAYOUT = {
+    "bit length": 16,
+    "bit 0 is lsb": True,
+    "fields": [
+        {"name": "HIGH", "start": 15, "end": 8},
+        {"name": "", "start": 3, "end": 0},
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def fixture_cache_dir(tmp_path, monkeypatch):
+    """Keep the compiled layout cache out of the home directory"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def test_decode_csv(tmp_path, monkeypatch, capsys):
+    """Test decoding values from stdin into CSV"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps(LAYOUT))
+    monkeypatch.setattr(
+        "sys.stdin", io.StringIO("0x1234\n# comment\n\n0b1111\n42\n0042\n")
+    )
+
+    assert main([str(layout_path)]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "value,HIGH,3:0",
+        "4660,18,4",
+        "15,0,15",
+        "42,0,10",
+        "42,0,10",
+    ]
+
+
+def test_decode_json_lines(tmp_path, capsys):
+    """Test decoding hexadecimal values from files into JSON lines"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps(LAYOUT))
+    values_path = tmp_path / "values.txt"
+    values_path.write_text("ABCD\n")
+
+    assert (
+        main([str(layout_path), str(values_path), "--base", "hex", "--format", "jsonl"])
+        == 0
+    )
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"value": 0xABCD, "fields": {"HIGH": 0xAB, "3:0": 0xD}}
+    ]
+
+
+def test_decode_invalid_value(tmp_path, monkeypatch, capsys):
+    """Test that an invalid value is reported with its line number"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps(LAYOUT))
+    monkeypatch.setattr("sys.stdin", io.StringIO("1\nzz\n"))
+
+    assert main([str(layout_path)]) == 1
+    assert "input line 2" in capsys.readouterr().err
+
+
+def test_decode_value_out_of_range(tmp_path, monkeypatch, capsys):
+    """Test that values which do not fit the layout's bit length are rejected"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps(LAYOUT))
+
+    for text in ["0xFFFF\n0x12345\n", "1\n-1\n"]:
+        monkeypatch.setattr("sys.stdin", io.StringIO(text))
+        assert main([str(layout_path)]) == 1
+        assert "input line 2" in capsys.readouterr().err
+
+
+def test_decode_missing_file(tmp_path, monkeypatch, capsys):
+    """Test that missing layout and input files are reported without a traceback"""
+    layout_path = tmp_path / "layout.json"
+    missing_path = tmp_path / "missing.txt"
+
+    assert main([str(layout_path)]) == 1
+    assert capsys.readouterr().err.startswith(f"error: {layout_path}: ")
+
+    layout_path.write_text(json.dumps(LAYOUT))
+    monkeypatch.setattr("sys.stdin", io.StringIO("1\n"))
+    assert main([str(layout_path), "-", str(missing_path)]) == 1
+    assert f"error: {missing_path}: " in capsys.readouterr().err
+
+
+def test_decode_where(tmp_path, monkeypatch, capsys):
+    """Test decoding only the values matching a query"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps(LAYOUT))
+    monkeypatch.setattr("sys.stdin", io.StringIO("0x1234\n0x12FF\n0x0034\n"))
+
+    assert main([str(layout_path), "--where", "HIGH == 0x12 and `3:0` != 4"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["value,HIGH,3:0", "4863,18,15"]
+
+    assert main([str(layout_path), "--where", "LOW == 1"]) == 1
+    assert "unknown field 'LOW'" in capsys.readouterr().err
@@ -0,0 +1,101 @@
+"""Compiled layout and layout cache tests"""
+
+import json
+import os
+
+import pytest
+
+from registercalculator.register import (
+    CompiledLayout,
+    RegisterLayout,
+    compile_layout,
+    decode,
+    load_layout,
+)
+
+LAYOUT = {
+    "bit length": 16,
+    "bit 0 is lsb": False,
+    "fields": [
+        {"name": "HIGH", "start": 0, "end": 7},
+        {"name": "", "start": 12, "end": 15},
+    ],
+}
+
+
+def test_compile_layout():
+    """Test that a compiled layout has the same masks and labels as its fields"""
+    compiled = compile_layout(LAYOUT)
+    layout = RegisterLayout.from_dict(LAYOUT)
+    assert len(compiled) == 2
+    assert compiled.labels == layout.labels
+    assert compiled.field_masks() == [
+        (field.label, field.mask, field.shift, field.bit_length) for field in layout
+    ]
+    assert compiled.to_dict() == LAYOUT
+    assert compiled.to_layout().to_dict() == LAYOUT
+
+    values = [0x1234, 0xFFFF, 0]
+    assert decode(compiled, values) == decode(layout, values)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {"bit length": 16, "fields": []},
+        {"bit length": 12, "bit 0 is lsb": True, "fields": []},
+        {"bit length": 16, "bit 0 is lsb": 1, "fields": []},
+        {"bit length": 16, "bit 0 is lsb": True, "fields": {}},
+        {"bit length": 16, "bit 0 is lsb": True, "fields": [{"start": 3}]},
+        {"bit length": 16, "bit 0 is lsb": True, "fields": [{"start": 0, "end": 3}]},
+        {"bit length": 16, "bit 0 is lsb": True, "fields": [{"start": 16, "end": 0}]},
+    ],
+)
+def test_compile_invalid_layout(data):
+    """Test that invalid layouts are rejected with a ValueError"""
+    with pytest.raises(ValueError):
+        compile_layout(data)
+
+
+def test_load_layout_cache(tmp_path, monkeypatch):
+    """Test that an unchanged layout file is loaded from the cache, and that a
+    changed file replaces its cache file"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps(LAYOUT))
+    cache_dir = tmp_path / "cache"
+
+    compiled = load_layout(layout_path, cache_dir)
+    assert isinstance(compiled, CompiledLayout)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    def fail(_):
+        raise AssertionError("layout was compiled again")
+
+    monkeypatch.setattr("registercalculator.register.compiled.compile_layout", fail)
+    cached = load_layout(layout_path, cache_dir)
+    assert cached.field_masks() == compiled.field_masks()
+    monkeypatch.undo()
+
+    layout_path.write_text(json.dumps({**LAYOUT, "fields": LAYOUT["fields"][:1]}))
+    os.utime(layout_path, ns=(0, 0))
+    assert len(load_layout(layout_path, cache_dir)) == 1
+    assert len(list(cache_dir.iterdir())) == 1
+
+    other_path = tmp_path / "other.json"
+    other_path.write_text(json.dumps(LAYOUT))
+    assert len(load_layout(other_path, cache_dir)) == len(LAYOUT["fields"])
+    assert len(load_layout(layout_path, cache_dir)) == 1
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_load_layout_corrupt_cache(tmp_path):
+    """Test that a corrupt cache file is replaced instead of used"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps(LAYOUT))
+    load_layout(layout_path, tmp_path / "cache")
+    (cache_file,) = (tmp_path / "cache").iterdir()
+    cache_file.write_bytes(b"garbage")
+
+    assert load_layout(layout_path, tmp_path / "cache").to_dict() == LAYOUT
+    assert load_layout(layout_path, use_cache=False).to_dict() == LAYOUT
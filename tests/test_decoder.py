@@ -0,0 +1,95 @@
+"""Layout and decoder module tests"""
+
+import io
+import json
+from array import array
+
+import pytest
+
+from registercalculator.register import (
+    DataRegister,
+    RegisterLayout,
+    decode,
+    iter_decode,
+)
+
+LAYOUT = {
+    "bit length": 32,
+    "bit 0 is lsb": True,
+    "fields": [
+        {"name": "HIGH", "start": 31, "end": 16},
+        {"name": "", "start": 15, "end": 8},
+        {"name": "FLAG", "start": 0, "end": 0},
+    ],
+}
+
+
+def test_layout_round_trip():
+    """Test that a layout survives conversion to and from its dict representation"""
+    layout = RegisterLayout.load(io.StringIO(json.dumps(LAYOUT)))
+    assert layout.bit_length == 32
+    assert len(layout) == 3
+    assert layout.labels == ["HIGH", "15:8", "FLAG"]
+    assert layout.to_dict() == LAYOUT
+
+    with pytest.raises(ValueError):
+        layout.add_field(32, 0)
+
+    with pytest.raises(ValueError):
+        layout.append(RegisterLayout().add_field(3, 0))
+
+
+def test_decode_columns():
+    """Test that decoded columns match the values read through DataField"""
+    layout = RegisterLayout.from_dict(LAYOUT)
+    values = [0x11223344, 0xAABBCCDD, 0, 0xFFFFFFFF, 0x00000101]
+
+    columns = decode(layout, values, chunk_size=2)
+    assert list(columns) == ["HIGH", "15:8", "FLAG"]
+    assert isinstance(columns["HIGH"], array)
+
+    register = DataRegister()
+    for index, value in enumerate(values):
+        register.value = value
+        for field in layout:
+            reference = (value & field.mask) >> field.shift
+            assert columns[field.label][index] == reference
+
+    assert list(columns["15:8"]) == [0x33, 0xCC, 0x00, 0xFF, 0x01]
+    assert list(columns["FLAG"]) == [0, 1, 0, 1, 1]
+
+
+def test_decode_msb_numbering():
+    """Test decoding of a layout where bit 0 is the msb"""
+    layout = RegisterLayout(DataRegister(bit_length=16, bit_0_is_lsb=False))
+    layout.add_field(0, 7, "MSB")
+    layout.add_field(8, 15)
+
+    columns = decode(layout, iter([0x1234, 0xABCD]))
+    assert list(columns["MSB"]) == [0x12, 0xAB]
+    assert list(columns["8:15"]) == [0x34, 0xCD]
+
+    rows = list(iter_decode(layout, [0x1234]))
+    assert rows == [{"MSB": 0x12, "8:15": 0x34}]
+
+
+def test_decode_duplicate_labels():
+    """Test that fields must have unique labels to be decoded"""
+    layout = RegisterLayout()
+    layout.add_field(7, 0, "A")
+    layout.add_field(15, 8, "A")
+
+    with pytest.raises(ValueError):
+        decode(layout, [0])
+
+
+def test_decode_numpy():
+    """Test that a NumPy array is decoded into NumPy columns"""
+    numpy = pytest.importorskip("numpy")
+    layout = RegisterLayout.from_dict(LAYOUT)
+    values = numpy.array([0x11223344, 0xAABBCCDD], dtype=numpy.uint32)
+
+    columns = decode(layout, values)
+    assert columns["HIGH"].tolist() == [0x1122, 0xAABB]
+    assert columns["15:8"].tolist() == [0x33, 0xCC]
+    assert columns["FLAG"].tolist() == [0, 1]
@@ -0,0 +1,67 @@
+"""Dump module tests"""
+
+import pytest
+
+from registercalculator.register import RegisterDump, RegisterLayout, decode
+
+VALUES = [0x11223344, 0xAABBCCDD, 0x00000001, 0xFFFFFFFF, 0x12345678]
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_dump_words(tmp_path, byteorder):
+    """Test reading 32-bit words in both byte orders"""
+    path = tmp_path / "dump.bin"
+    path.write_bytes(b"".join(v.to_bytes(4, byteorder) for v in VALUES) + b"\x00")
+
+    with RegisterDump(path, 32, byteorder) as dump:
+        assert len(dump) == len(VALUES)
+        assert dump[0] == VALUES[0]
+        assert dump[-1] == VALUES[-1]
+        assert list(dump[1:4]) == VALUES[1:4]
+        assert list(dump[::2]) == VALUES[::2]
+        assert list(dump) == VALUES
+        assert [list(chunk) for chunk in dump.chunks(2)] == [
+            VALUES[0:2],
+            VALUES[2:4],
+            VALUES[4:],
+        ]
+
+
+def test_dump_widths_and_offset(tmp_path):
+    """Test other word widths and skipping a file header"""
+    path = tmp_path / "dump.bin"
+    path.write_bytes(b"HDR" + bytes([0x12, 0x34, 0x56, 0x78]))
+
+    with RegisterDump(path, 16, "big", offset=3) as dump:
+        assert list(dump) == [0x1234, 0x5678]
+
+    with RegisterDump(path, 8, offset=3) as dump:
+        assert list(dump) == [0x12, 0x34, 0x56, 0x78]
+
+    with pytest.raises(ValueError):
+        RegisterDump(path, 24)
+
+
+def test_dump_empty(tmp_path):
+    """Test that an empty file is an empty dump"""
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    with RegisterDump(path) as dump:
+        assert len(dump) == 0
+        assert list(dump) == []
+
+
+def test_dump_decode(tmp_path):
+    """Test decoding fields straight from a dump"""
+    path = tmp_path / "dump.bin"
+    path.write_bytes(b"".join(v.to_bytes(4, "little") for v in VALUES))
+
+    layout = RegisterLayout()
+    layout.add_field(31, 24, "TOP")
+
+    with RegisterDump(path, byteorder="little") as dump:
+        assert list(decode(layout, dump[1:3])["TOP"]) == [0xAA, 0x00]
+        assert list(decode(layout, dump, chunk_size=2)["TOP"]) == [
+            v >> 24 for v in VALUES
+        ]
@@ -0,0 +1,69 @@
+"""Dump diff tests"""
+
+from array import array
+
+import pytest
+
+from registercalculator.register import RegisterLayout, diff
+from registercalculator.register import dump_diff
+
+LAYOUT = {
+    "bit length": 32,
+    "bit 0 is lsb": True,
+    "fields": [
+        {"name": "HIGH", "start": 31, "end": 16},
+        {"name": "MID", "start": 11, "end": 4},
+        {"name": "FLAG", "start": 0, "end": 0},
+    ],
+}
+
+FIRST = [0x00000000, 0x12345678, 0xFFFFFFFF, 0x00000001, 0x0000F000]
+SECOND = [0x00000000, 0x12345679, 0x7FFFFFFF, 0x00000FF0, 0x00000000]
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_diff(monkeypatch, numpy_available):
+    """Test that differences are counted per field with and without NumPy"""
+    if numpy_available:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(dump_diff, "numpy_for", lambda _: None)
+    layout = RegisterLayout.from_dict(LAYOUT)
+
+    result = diff(layout, array("I", FIRST), array("I", SECOND), chunk_size=2)
+    assert result.to_dict() == {
+        "length": 5,
+        "count": 4,
+        "offsets": [1, 2, 3, 4],
+        "fields": {
+            "HIGH": {"count": 1, "offsets": [2]},
+            "MID": {"count": 1, "offsets": [3]},
+            "FLAG": {"count": 2, "offsets": [1, 3]},
+        },
+    }
+    assert [field.label for field in result.changed_fields] == ["HIGH", "MID", "FLAG"]
+
+    result = diff(layout, FIRST, SECOND, max_offsets=1)
+    assert result.offsets == [1]
+    assert result.fields["FLAG"].offsets == [1]
+    assert result.fields["FLAG"].count == 2
+
+
+def test_diff_wide_register():
+    """Test comparing registers wider than 64 bits"""
+    layout = RegisterLayout.from_dict(
+        {
+            "bit length": 128,
+            "bit 0 is lsb": True,
+            "fields": [{"name": "TOP", "start": 127, "end": 120}],
+        }
+    )
+    result = diff(layout, [1 << 127, 1], [0, 0])
+    assert result.count == 2
+    assert result.fields["TOP"].offsets == [0]
+
+
+def test_diff_length_mismatch():
+    """Test that sequences of different lengths are rejected"""
+    with pytest.raises(ValueError):
+        diff(RegisterLayout.from_dict(LAYOUT), [1, 2], [1])
@@ -0,0 +1,93 @@
+"""Batch encoder tests"""
+
+from array import array
+
+import pytest
+
+from registercalculator.register import (
+    EncodeError,
+    RegisterLayout,
+    decode,
+    encode,
+    encode_rows,
+)
+from registercalculator.register import encoder
+
+LAYOUT = {
+    "bit length": 32,
+    "bit 0 is lsb": True,
+    "fields": [
+        {"name": "HIGH", "start": 31, "end": 16},
+        {"name": "MID", "start": 11, "end": 4},
+        {"name": "FLAG", "start": 0, "end": 0},
+    ],
+}
+
+COLUMNS = {"HIGH": [0x1234, 0xFFFF, 0], "MID": [0xAB, 0, 0xFF], "FLAG": [1, 0, 1]}
+WORDS = [0x12340AB1, 0xFFFF0000, 0x00000FF1]
+
+
+@pytest.fixture(name="numpy_available", params=[True, False])
+def fixture_numpy_available(request, monkeypatch):
+    """Run a test both with NumPy and with the pure Python encoder"""
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(encoder, "numpy_for", lambda _: None)
+    return request.param
+
+
+def test_encode_outputs(numpy_available):
+    """Test that encoded values round trip through the decoder in all outputs"""
+    layout = RegisterLayout.from_dict(LAYOUT)
+    assert encode(layout, COLUMNS) == WORDS
+    assert encode(layout, COLUMNS, output="array") == array("I", WORDS)
+    assert encode(layout, COLUMNS, output="bytes", byteorder="big") == b"".join(
+        word.to_bytes(4, "big") for word in WORDS
+    )
+    assert decode(layout, encode(layout, COLUMNS)) == {
+        label: array(typecode, column)
+        for (label, column), typecode in zip(COLUMNS.items(), "HBB")
+    }
+    if numpy_available:
+        assert encode(layout, COLUMNS, output="numpy").tolist() == WORDS
+
+
+def test_encode_rows(numpy_available):
+    """Test encoding row dicts, where missing fields keep the initial value"""
+    del numpy_available
+    layout = RegisterLayout.from_dict(LAYOUT)
+    rows = [{"HIGH": 0x1234, "FLAG": 1}, {"HIGH": 0xFFFF}]
+    assert encode_rows(layout, rows, initial=0x0000F0F0) == [0x1234F0F1, 0xFFFFF0F0]
+
+
+def test_encode_range_check(numpy_available):
+    """Test that all rows with values out of range are reported"""
+    del numpy_available
+    layout = RegisterLayout.from_dict(LAYOUT)
+    with pytest.raises(EncodeError) as error:
+        encode(layout, {"MID": [0, 256, -1, 3], "FLAG": [2, 0, 1, 1]})
+    assert error.value.rows == {"MID": [1, 2], "FLAG": [0]}
+
+    with pytest.raises(EncodeError) as error:
+        encode(layout, {"HIGH": [1 << 64, -1]})
+    assert error.value.rows == {"HIGH": [0, 1]}
+
+    with pytest.raises(ValueError):
+        encode(layout, {"LOW": [1]})
+    with pytest.raises(ValueError):
+        encode(layout, {"MID": [1], "FLAG": [1, 0]})
+
+
+def test_encode_wide_register():
+    """Test encoding values wider than 64 bits"""
+    layout = RegisterLayout.from_dict(
+        {
+            "bit length": 128,
+            "bit 0 is lsb": True,
+            "fields": [{"name": "TOP", "start": 127, "end": 64}],
+        }
+    )
+    assert encode(layout, {"TOP": [(1 << 64) - 1]}) == [((1 << 64) - 1) << 64]
+    with pytest.raises(ValueError):
+        encode(layout, {"TOP": [1]}, output="array")
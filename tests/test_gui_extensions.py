@@ -0,0 +1,297 @@
+"""GUI extension tests that do not need a display"""
+
+from tkinter import END
+from tkinter.ttk import Scrollbar
+
+import pytest
+
+from registercalculator.gui_extensions import (
+    BinEntry,
+    DecEntry,
+    Debouncer,
+    FieldGui,
+    FieldTable,
+    HexEntry,
+    selection_bit_tables,
+)
+from registercalculator.register import DataRegister
+
+
+class Scheduler:
+    """Collects the callbacks passed to after(), like a Tk widget does"""
+
+    def __init__(self):
+        self.scheduled = {}
+
+    def after(self, _, callback):
+        after_id = f"after#{len(self.scheduled)}"
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        del self.scheduled[after_id]
+
+    def run(self):
+        scheduled, self.scheduled = self.scheduled, {}
+        for callback in scheduled.values():
+            callback()
+
+
+def test_debouncer_coalesces_events():
+    """Test that a burst of events results in a single call"""
+    scheduler = Scheduler()
+    calls = []
+    debouncer = Debouncer(scheduler, lambda: calls.append(None), "test burst")
+
+    for _ in range(10):
+        debouncer("event")
+    assert debouncer.pending
+    assert not calls
+
+    scheduler.run()
+    assert len(calls) == 1
+    assert not debouncer.pending
+
+    debouncer()
+    scheduler.run()
+    assert len(calls) == 2
+    assert Debouncer.statistics()["test burst"] == {"events": 11, "recomputes": 2}
+
+
+def test_debouncer_flush_and_cancel():
+    """Test calling a scheduled callback right away or dropping it"""
+    scheduler = Scheduler()
+    calls = []
+    debouncer = Debouncer(scheduler, lambda: calls.append(None), "test flush")
+
+    debouncer()
+    debouncer.flush()
+    assert len(calls) == 1
+    assert not scheduler.scheduled
+
+    debouncer()
+    debouncer.cancel()
+    scheduler.run()
+    debouncer.flush()
+    assert len(calls) == 1
+    assert Debouncer.statistics()["test flush"] == {"events": 2, "recomputes": 1}
+
+
+def _counted_selection(text, bit_length, bit_0_is_lsb, start_index, end_index):
+    """The selection calculation that counts delimiters in the text"""
+    delimiters_before_selection = text[0:start_index].count("_")
+    delimiters_in_selection = text[start_index:end_index].count("_")
+    start = bit_length - (start_index - delimiters_before_selection) - 1
+    end = bit_length - (
+        end_index - delimiters_before_selection - delimiters_in_selection
+    )
+    if not bit_0_is_lsb:
+        start, end = bit_length - start - 1, bit_length - end - 1
+    return start, end
+
+
+def test_selection_bit_tables():
+    """Test that the lookup tables match counting the delimiters"""
+    for bit_length in [8, 16, 32]:
+        for bit_0_is_lsb in [True, False]:
+            reg = DataRegister(0x5A5A5A5A, bit_length, bit_0_is_lsb)
+            for text in [reg.bin_delimited, reg.bin]:
+                start_bits, end_bits = selection_bit_tables(
+                    text, bit_length, bit_0_is_lsb
+                )
+                assert len(start_bits) == len(end_bits) == len(text) + 1
+                for start_index in range(len(text)):
+                    for end_index in range(start_index + 1, len(text) + 1):
+                        assert (
+                            start_bits[start_index],
+                            end_bits[end_index],
+                        ) == _counted_selection(
+                            text, bit_length, bit_0_is_lsb, start_index, end_index
+                        )
+
+    start_bits, end_bits = selection_bit_tables("1111_0000", 8, True)
+    assert (start_bits[0], end_bits[4]) == (7, 4)
+    assert (start_bits[5], end_bits[9]) == (3, 0)
+
+
+def test_bin_entry_calculate_selection(tk_root):
+    """Test that the selected characters are converted to the selected bits"""
+    reg = DataRegister(0, 16)
+    entry = BinEntry(tk_root, reg, with_delimiter=True)
+    entry.insert(0, reg.bin_delimited)
+    entry.selection_range(0, 4)
+    selections = []
+    entry.register_observer(lambda start, end: selections.append((start, end)))
+
+    entry.notify_observers()
+    assert entry.get_selection() == (15, 12)
+    entry.notify_observers()
+    entry.notify_observers(force=True)
+    assert selections == [(15, 12), (15, 12)]
+
+    entry.selection_range(5, 19)
+    entry.notify_observers()
+    assert selections[-1] == (11, 0)
+
+    reg.bit_0_is_lsb = False
+    entry.notify_observers()
+    assert selections[-1] == (4, 15)
+
+    # While being edited the text is shorter than the bit length implies
+    reg.bit_0_is_lsb = True
+    entry.delete(0, END)
+    entry.insert(0, "0000_0000")
+    entry.selection_range(0, 4)
+    entry.notify_observers()
+    assert selections[-1] == (15, 12)
+    entry.delete(0, END)
+    entry.insert(0, "00000000")
+    entry.selection_range(4, 8)
+    entry.notify_observers()
+    assert selections[-1] == (11, 8)
+
+    entry.selection_clear()
+    entry.notify_observers()
+    assert selections[-1] == (None, None)
+
+
+def test_entries_rewrite_text_of_unchanged_value(tk_root):
+    """Test that applying text whose value is unchanged shows the value's text"""
+    # pylint: disable=protected-access
+    reg = DataRegister(0x12, 16)
+    field = FieldGui(reg, 7, 0)
+    for entry, text, expected in [
+        (HexEntry(tk_root, field), "012", "12"),
+        (DecEntry(tk_root, field), "018", "18"),
+        (BinEntry(tk_root, field), "10010", "00010010"),
+    ]:
+        entry.delete(0, END)
+        entry.insert(0, text)
+        entry._value_typed = True
+        entry._apply_text()
+        assert entry.get() == expected
+
+    field.value = 0
+    entry = HexEntry(tk_root, field)
+    entry.delete(0, END)
+    entry._apply_text()
+    assert entry.get() == "0"
+    assert reg.value == 0
+
+
+def _field_table(tk_root, number_of_fields, visible_rows=3):
+    reg = DataRegister(0x76543210)
+    table = FieldTable(tk_root, visible_rows=visible_rows)
+    for index in range(number_of_fields):
+        table.add_field(FieldGui(reg, index * 4 + 3, index * 4, f"F{index}"))
+    return table
+
+
+def _shown_fields(table):
+    """The fields bound to a row, which are the visible fields"""
+    return [field.name for field in table.fields if field.row is not None]
+
+
+def _scrollbar(table):
+    return next(
+        (child for child in table.winfo_children() if isinstance(child, Scrollbar)),
+        None,
+    )
+
+
+def test_field_table_add_beyond_visible_rows(tk_root):
+    """Test that only the visible rows get widgets and a scrollbar is added"""
+    table = _field_table(tk_root, 3)
+    assert _shown_fields(table) == ["F0", "F1", "F2"]
+    assert _scrollbar(table) is None
+
+    entries = len(table.winfo_children())
+    table.add_field(FieldGui(table.fields[0].register, 19, 16, "F3"))
+    table.add_field(FieldGui(table.fields[0].register, 23, 20, "F4"))
+    assert [field.name for field in table.fields] == ["F0", "F1", "F2", "F3", "F4"]
+    assert _shown_fields(table) == ["F0", "F1", "F2"]
+    assert len(table.winfo_children()) == entries + 1
+    assert _scrollbar(table).get() == pytest.approx((0, 0.6))
+
+
+def test_field_table_scroll(tk_root):
+    """Test that scrolling is clamped to the first and last fields"""
+    table = _field_table(tk_root, 5)
+
+    table.scroll("scroll", 1, "units")
+    assert _shown_fields(table) == ["F1", "F2", "F3"]
+    table.scroll("scroll", 5, "units")
+    assert _shown_fields(table) == ["F2", "F3", "F4"]
+    assert _scrollbar(table).get() == pytest.approx((0.4, 1))
+    table.scroll("scroll", -1, "pages")
+    assert _shown_fields(table) == ["F0", "F1", "F2"]
+
+    table.scroll("moveto", "0.5")
+    assert _shown_fields(table) == ["F2", "F3", "F4"]
+    table.scroll("moveto", "-0.2")
+    assert _shown_fields(table) == ["F0", "F1", "F2"]
+    table.scroll("moveto", "1.0")
+    assert _shown_fields(table) == ["F2", "F3", "F4"]
+
+
+def test_field_table_rows_follow_scroll(tk_root):
+    """Test that each row shows the field it is bound to after scrolling"""
+    table = _field_table(tk_root, 5)
+    table.scroll("moveto", "1.0")
+
+    for field in table.fields:
+        if field.row is None:
+            continue
+        assert field.row.field is field
+        assert field.row.bit_label.cget("text") == f"{field.start_bit}:{field.end_bit}"
+        assert field.row.hex_entry.get() == field.hex
+        assert field.row.name_entry.get() == field.name
+
+    # Changing a field updates the row that shows it
+    field = table.fields[3]
+    field.value = 0xA
+    assert field.row.hex_entry.get() == "A"
+    assert table.fields[0].row is None
+
+
+def test_field_table_remove_field(tk_root):
+    """Test removing fields while there are fewer fields than rows, and while
+    scrolled to the end"""
+    table = _field_table(tk_root, 2)
+    widgets = len(table.winfo_children())
+    first, second = table.fields[0], table.fields[1]
+    table.remove_field(first)
+    assert _shown_fields(table) == ["F1"]
+    assert second.row.bit_label.cget("text") == "7:4"
+    assert first.row is None
+    assert len(table.winfo_children()) == widgets - len(second.row.widgets)
+    table.remove_field(second)
+    assert not table.fields
+    assert not table.winfo_children()
+
+    table = _field_table(tk_root, 5)
+    table.scroll("moveto", "1.0")
+    assert _scrollbar(table).grid_info()
+    table.remove_field(table.fields[-1])
+    assert _shown_fields(table) == ["F1", "F2", "F3"]
+    table.remove_field(table.fields[0])
+    assert _shown_fields(table) == ["F1", "F2", "F3"]
+    assert not _scrollbar(table).grid_info()
+
+
+def test_field_table_move_and_sort(tk_root):
+    """Test moving fields to the edges and sorting without creating widgets"""
+    table = _field_table(tk_root, 5)
+    widgets = table.winfo_children()
+    rows = [field.row for field in table.fields[:3]]
+
+    table.move_field(table.fields[1], -5)
+    assert [field.name for field in table.fields] == ["F1", "F0", "F2", "F3", "F4"]
+    table.move_field(table.fields[0], 10)
+    assert [field.name for field in table.fields] == ["F0", "F2", "F3", "F4", "F1"]
+    assert _shown_fields(table) == ["F0", "F2", "F3"]
+
+    table.sort_fields(key=lambda field: field.start_bit, reverse=True)
+    assert [field.name for field in table.fields] == ["F4", "F3", "F2", "F1", "F0"]
+    assert [field.row for field in table.fields[:3]] == rows
+    assert table.winfo_children() == widgets
@@ -0,0 +1,68 @@
+"""Register history tests"""
+
+import pytest
+
+from registercalculator.register import DataField, DataRegister, RegisterHistory
+
+
+def test_undo_redo():
+    """Test that undo and redo step through the recorded register values"""
+    reg = DataRegister(1)
+    history = RegisterHistory(reg)
+    reg.value = 2
+    reg.value = 3
+    assert list(history) == [1, 2, 3]
+
+    assert history.undo() and reg.value == 2
+    assert history.undo() and reg.value == 1
+    assert not history.undo()
+    assert history.redo() and reg.value == 2
+    assert list(history) == [1, 2, 3]
+
+    reg.value = 5
+    assert list(history) == [1, 2, 5]
+    assert not history.can_redo
+
+    history.close()
+    reg.value = 6
+    assert len(history) == 3
+
+
+def test_ring_buffer():
+    """Test that the oldest values are dropped once the history is full"""
+    reg = DataRegister()
+    history = RegisterHistory(reg, capacity=4)
+    for value in range(1, 10):
+        reg.value = value
+    assert list(history) == [6, 7, 8, 9]
+    assert history[0] == 6 and history[-1] == 9
+    with pytest.raises(IndexError):
+        history[4]  # pylint: disable=pointless-statement
+
+    with pytest.raises(ValueError):
+        RegisterHistory(reg, capacity=0)
+
+
+def test_wide_values():
+    """Test that values wider than 64 bits are recorded in multiple words"""
+    reg = DataRegister(bit_length=64)
+    history = RegisterHistory(reg, capacity=3)
+    reg.value = (1 << 64) - 1
+    reg.bit_length = 200
+    reg.value = (1 << 199) | 0x1234
+    reg.value = 0xABCD << 100
+    assert list(history) == [(1 << 64) - 1, (1 << 199) | 0x1234, 0xABCD << 100]
+    assert history.undo() and reg.value == (1 << 199) | 0x1234
+
+
+def test_changed_fields():
+    """Test finding the fields changed between two snapshots"""
+    reg = DataRegister(0x11223344)
+    fields = [DataField(reg, 31, 16, "HIGH"), DataField(reg, 15, 0, "LOW")]
+    history = RegisterHistory(reg)
+    fields[1].value = 0xFFFF
+    fields[1].value = 0x3344
+
+    assert history.changed_fields(0, 1, fields) == [fields[1]]
+    assert history.changed_fields(0, 2, fields) == []
+    assert history.changed_bits(0, 1) == 0x3344 ^ 0xFFFF
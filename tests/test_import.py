@@ -0,0 +1,83 @@
+"""Package import tests"""
+
+import subprocess
+import sys
+
+import pytest
+
+import registercalculator.register
+
+# The submodules loaded by importing the register package, the others are loaded
+# on first use of their names
+CORE_MODULES = [
+    "registercalculator.register.formatting",
+    "registercalculator.register.layout",
+    "registercalculator.register.register",
+]
+
+GUI_MODULES = ["tkinter", "tkinterdnd2", "webbrowser"]
+
+# Modules that are only imported when the functions that need them are used
+HEAVY_MODULES = [
+    "multiprocessing",
+    "concurrent.futures",
+    "logging",
+    "xml.etree",
+    "numpy",
+]
+
+
+def _run_python(*args) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def test_register_import_is_headless():
+    """Test that importing the register package does not load the GUI"""
+    result = _run_python(
+        "-c",
+        "import sys, registercalculator, registercalculator.register;"
+        f"print([m for m in {GUI_MODULES!r} if m in sys.modules])",
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_register_import_is_lazy():
+    """Test that importing the register package does not load heavy modules"""
+    result = _run_python(
+        "-c",
+        "import sys, registercalculator.register;"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_register_submodules_are_lazy():
+    """Test that importing the register package loads only the core submodules"""
+    result = _run_python(
+        "-c",
+        "import sys, registercalculator.register;"
+        "print(sorted(m for m in sys.modules if m.startswith("
+        "'registercalculator.register.')))",
+    )
+    assert result.stdout.strip() == repr(CORE_MODULES)
+
+
+def test_register_names_are_imported_on_use():
+    """Test that the names of the lazily loaded submodules are still available
+    from the package"""
+    for name in registercalculator.register.__all__:
+        assert getattr(registercalculator.register, name) is not None
+
+    with pytest.raises(AttributeError):
+        _ = registercalculator.register.NoSuchAttribute  # type: ignore
+
+
+def test_gui_is_imported_on_use():
+    """Test that the GUI class is still available from the package"""
+    pytest.importorskip("tkinterdnd2")
+    assert registercalculator.RegisterCalculator.__name__ == "RegisterCalculator"
+
+    with pytest.raises(AttributeError):
+        _ = registercalculator.NoSuchAttribute  # type: ignore
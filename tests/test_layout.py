@@ -0,0 +1,51 @@
+"""Layout index tests"""
+
+from registercalculator.register import DataRegister, RegisterLayout
+
+
+def test_layout_bit_queries():
+    """Test the lookup of fields by bit and bit range"""
+    layout = RegisterLayout(DataRegister(bit_length=16))
+    high = layout.add_field(15, 8, "HIGH")
+    nibble = layout.add_field(11, 8, "NIBBLE")
+    flag = layout.add_field(0, 0, "FLAG")
+
+    assert layout.fields_at(15) == [high]
+    assert layout.fields_at(8) == [high, nibble]
+    assert layout.fields_at(4) == []
+    assert layout.fields_at(16) == []
+
+    assert layout.fields_overlapping(3, 0) == [flag]
+    assert layout.fields_overlapping(0, 9) == [flag, high, nibble]
+    assert layout.fields_overlapping(7, 1) == []
+
+    assert layout.overlaps(8, 8)
+    assert not layout.overlaps(7, 1)
+    assert layout.unassigned_bits() == list(range(1, 8))
+    assert layout.unassigned_mask == 0x00FE
+
+    layout.remove(high)
+    assert layout.fields_at(15) == []
+    assert layout.fields_at(8) == [nibble]
+    assert layout.unassigned_bits() == list(range(1, 8)) + list(range(12, 16))
+
+    layout.clear()
+    assert len(layout) == 0
+    assert layout.fields_at(0) == []
+    assert layout.unassigned_mask == 0xFFFF
+
+
+def test_layout_msb_numbering():
+    """Test bit queries when bit 0 is the msb"""
+    register = DataRegister(bit_length=8, bit_0_is_lsb=False)
+    layout = RegisterLayout(register)
+    top = layout.add_field(0, 3, "TOP")
+
+    assert layout.fields_at(0) == [top]
+    assert layout.fields_at(7) == []
+    assert layout.fields_overlapping(3, 5) == [top]
+    assert layout.unassigned_bits() == [4, 5, 6, 7]
+
+    register.bit_0_is_lsb = True
+    assert layout.fields_at(7) == [top]
+    assert layout.unassigned_bits() == [0, 1, 2, 3]
@@ -0,0 +1,35 @@
+"""Memory tests of register and field objects"""
+
+import tracemalloc
+
+from registercalculator.register import DataField, DataRegister
+
+NUMBER_OF_FIELDS = 50_000
+
+# A slotted field takes about 117 bytes of a 50k field map, including its share of
+# the register, its mask and the list entry. With a per-instance __dict__ it would
+# take over 150 bytes.
+BYTES_PER_FIELD_LIMIT = 128
+
+
+def _allocated_bytes() -> int:
+    """Return the memory allocated by a map of 32-bit registers with one field per
+    bit"""
+    tracemalloc.start()
+    register_map = []
+    register = None
+    for index in range(NUMBER_OF_FIELDS):
+        if index % 32 == 0:
+            register = DataRegister(index)
+        register_map.append(DataField(register, index % 32, index % 32, "FIELD"))
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated
+
+
+def test_slotted_objects_memory():
+    """Test that a 50k field map of slotted objects stays within its memory bound"""
+    assert not hasattr(DataField(DataRegister(), 0, 0), "__dict__")
+    assert not hasattr(DataRegister(), "__dict__")
+
+    assert _allocated_bytes() / NUMBER_OF_FIELDS < BYTES_PER_FIELD_LIMIT
@@ -0,0 +1,41 @@
+"""Parallel decoder tests"""
+
+from array import array
+
+import pytest
+
+from registercalculator.register import RegisterLayout, decode, parallel_decode
+
+LAYOUT = {
+    "bit length": 32,
+    "bit 0 is lsb": True,
+    "fields": [
+        {"name": "HIGH", "start": 31, "end": 16},
+        {"name": "LOW", "start": 7, "end": 0},
+    ],
+}
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 3), (2, 3), (2, 1000)])
+def test_parallel_decode(tmp_path, workers, chunk_size):
+    """Test that a parallel decode matches decoding the values in one process"""
+    layout = RegisterLayout.from_dict(LAYOUT)
+    values = array("I", [value * 0x01010101 & 0xFFFFFFFF for value in range(10)])
+    path = tmp_path / "dump.bin"
+    path.write_bytes(values.tobytes())
+
+    columns = parallel_decode(layout, path, workers=workers, chunk_size=chunk_size)
+    assert columns == decode(layout, values)
+
+
+def test_parallel_decode_invalid(tmp_path):
+    """Test that invalid worker counts and chunk sizes are rejected"""
+    layout = RegisterLayout.from_dict(LAYOUT)
+    path = tmp_path / "dump.bin"
+    path.write_bytes(b"")
+    assert parallel_decode(layout, path) == {"HIGH": array("H"), "LOW": array("B")}
+
+    with pytest.raises(ValueError):
+        parallel_decode(layout, path, workers=0)
+    with pytest.raises(ValueError):
+        parallel_decode(layout, path, chunk_size=0)
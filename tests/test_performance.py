@@ -0,0 +1,252 @@
+"""pytest-benchmark suite for the register core and the GUI entry callbacks
+
+Save a baseline with 'make benchmark-save' and compare against it with
+'make benchmark', which fails when a benchmark regresses beyond the threshold.
+"""
+
+import io
+import json
+import random
+from array import array
+
+import pytest
+
+from registercalculator.register import (
+    DELIMITER,
+    DataField,
+    DataRegister,
+    RegisterDump,
+    RegisterLayout,
+    compile_query,
+    encode,
+    load_layout,
+    parallel_decode,
+)
+from registercalculator.register.formatting import to_bin_delimited
+from registercalculator.register.register import swap_bytes
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(max_time=0.2, min_rounds=5)
+
+NUMBER_OF_LAYOUT_FIELDS = 5_000
+NUMBER_OF_DUMP_WORDS = 1 << 19
+
+
+def _large_layout_json() -> str:
+    fields = [
+        {"name": f"FIELD{index}", "start": index % 32, "end": index % 32}
+        for index in range(NUMBER_OF_LAYOUT_FIELDS)
+    ]
+    return json.dumps({"bit length": 32, "bit 0 is lsb": True, "fields": fields})
+
+
+def test_field_get(benchmark):
+    """Benchmark reading a field value"""
+    field = DataField(DataRegister(0x11223344), 23, 8)
+    assert benchmark(lambda: field.value) == 0x2233
+
+
+def test_field_set(benchmark):
+    """Benchmark writing a field value, which writes the register value"""
+    reg = DataRegister(0x11223344)
+    field = DataField(reg, 23, 8)
+
+    def set_field():
+        field.value = 0xABCD
+
+    benchmark(set_field)
+    assert reg.value == 0x11ABCD44
+
+
+def test_swap_bytes(benchmark):
+    """Benchmark swapping the bytes of a register"""
+    reg = DataRegister(0x11223344)
+    benchmark(reg.swap_bytes)
+
+
+def _hard_coded_swap_32(value: int) -> int:
+    """The hard-coded 32-bit byte swap that the generic swap replaced"""
+    return (
+        ((value >> 0x18) & 0x000000FF)
+        | ((value << 0x08) & 0x00FF0000)
+        | ((value >> 0x08) & 0x0000FF00)
+        | ((value << 0x18) & 0xFF000000)
+    )
+
+
+@pytest.mark.benchmark(group="swap_bytes")
+def test_swap_bytes_hard_coded(benchmark):
+    """Benchmark the hard-coded 32-bit byte swap, as the reference for the
+    generic swap"""
+    assert benchmark(_hard_coded_swap_32, 0x11223344) == 0x44332211
+
+
+@pytest.mark.benchmark(group="swap_bytes")
+@pytest.mark.parametrize("bit_length", [32, 64, 128, 512])
+def test_swap_bytes_generic(benchmark, bit_length):
+    """Benchmark the generic byte swap of increasing widths"""
+    benchmark(swap_bytes, 0x11223344, bit_length)
+
+
+@pytest.mark.parametrize(
+    "name", ["hex", "dec", "bin", "bin_delimited", "max", "max_dec_width"]
+)
+@pytest.mark.parametrize("of_field", [False, True], ids=["register", "field"])
+def test_strings(benchmark, name, of_field):
+    """Benchmark the string and width properties of a register and a field"""
+    reg = DataRegister(0x11223344)
+    data = DataField(reg, 23, 4) if of_field else reg
+    benchmark(getattr, data, name)
+
+
+def _sliced_bin_delimited(value: int, bit_length: int) -> str:
+    """The slice and join implementation that the lookup tables replaced"""
+    string = f"{value:0{bit_length}b}"
+    return DELIMITER.join([string[i : i + 4] for i in range(0, len(string), 4)])
+
+
+@pytest.mark.benchmark(group="bin_delimited")
+def test_bin_delimited_sliced(benchmark):
+    """Benchmark grouping binary digits by slicing, as the reference for the
+    lookup tables"""
+    benchmark(_sliced_bin_delimited, 0x11223344, 32)
+
+
+@pytest.mark.benchmark(group="bin_delimited")
+def test_bin_delimited_tables(benchmark):
+    """Benchmark grouping binary digits with the lookup tables"""
+    benchmark(to_bin_delimited, 0x11223344, 32)
+
+
+@pytest.mark.parametrize("number_of_observers", [1, 10, 100, 1000])
+def test_notify_observers(benchmark, number_of_observers):
+    """Benchmark notifying all observers of a register"""
+    reg = DataRegister()
+    calls = []
+    for _ in range(number_of_observers):
+        reg.register_observer(lambda: calls.append(None))
+
+    benchmark(reg.notify_observers)
+    assert len(calls) % number_of_observers == 0
+
+
+@pytest.mark.parametrize("number_of_fields", [32, 1024])
+def test_notify_single_bit_change(benchmark, number_of_fields):
+    """Benchmark a one bit change of a register with many single bit field
+    observers, where only the observers of the changed bit are called"""
+    reg = DataRegister()
+    calls = []
+    for index in range(number_of_fields):
+        DataField(reg, index % 32, index % 32).register_observer(
+            lambda: calls.append(None)
+        )
+
+    def toggle_bit():
+        reg.value ^= 1
+
+    benchmark(toggle_bit)
+    assert len(calls) % (number_of_fields // 32) == 0
+
+
+def test_layout_import(benchmark):
+    """Benchmark importing a large json layout"""
+    layout_json = _large_layout_json()
+    layout = benchmark(lambda: RegisterLayout.load(io.StringIO(layout_json)))
+    assert len(layout) == NUMBER_OF_LAYOUT_FIELDS
+
+
+def test_layout_load_cached(benchmark, tmp_path):
+    """Benchmark loading a large json layout through the compiled layout cache"""
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(_large_layout_json())
+    load_layout(layout_path, tmp_path)
+    layout = benchmark(lambda: load_layout(layout_path, tmp_path))
+    assert len(layout) == NUMBER_OF_LAYOUT_FIELDS
+
+
+def test_layout_export(benchmark):
+    """Benchmark exporting a large layout to json"""
+    layout = RegisterLayout.load(io.StringIO(_large_layout_json()))
+    exported = benchmark(lambda: json.dumps(layout.to_dict(), indent=4))
+    assert json.loads(exported) == json.loads(_large_layout_json())
+
+
+@pytest.fixture(name="dump_path", scope="module")
+def fixture_dump_path(tmp_path_factory):
+    """A binary dump of random 32-bit register values"""
+    path = tmp_path_factory.mktemp("dump") / "dump.bin"
+    generator = random.Random(0)
+    words = array("I", (generator.getrandbits(32) for _ in range(NUMBER_OF_DUMP_WORDS)))
+    path.write_bytes(words.tobytes())
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_parallel_decode_scaling(benchmark, dump_path, workers):
+    """Benchmark decoding a large dump with an increasing number of workers"""
+    layout = RegisterLayout()
+    for start in range(31, 0, -8):
+        layout.add_field(start, start - 7)
+    columns = benchmark.pedantic(
+        parallel_decode,
+        args=(layout, dump_path),
+        kwargs={"workers": workers, "chunk_size": NUMBER_OF_DUMP_WORDS // 16},
+        rounds=3,
+    )
+    assert len(columns["31:24"]) == NUMBER_OF_DUMP_WORDS
+
+
+def test_query_filter(benchmark, dump_path):
+    """Benchmark filtering a large dump with a compiled query"""
+    layout = RegisterLayout()
+    layout.add_field(31, 31, "ERR")
+    layout.add_field(30, 28, "MODE")
+    query = compile_query(layout, "ERR == 1 and MODE in (2, 3)")
+    with RegisterDump(dump_path) as dump:
+        matches = benchmark(query.count, dump)
+    assert 0 < matches < NUMBER_OF_DUMP_WORDS
+
+
+def test_encode(benchmark):
+    """Benchmark packing columns of field values into register values"""
+    layout = RegisterLayout()
+    for start in range(31, 0, -8):
+        layout.add_field(start, start - 7)
+    columns = {
+        label: [value % 256 for value in range(100_000)] for label in layout.labels
+    }
+    words = benchmark(encode, layout, columns, output="array")
+    assert len(words) == 100_000
+
+
+@pytest.mark.parametrize("number_of_fields", [8, 32])
+def test_field_widget_update(benchmark, tk_root, number_of_fields):
+    """Benchmark a register change that updates the entries of the register and
+    all its field widgets"""
+    from registercalculator.gui_extensions import (  # pylint: disable=import-outside-toplevel
+        BinEntry,
+        DecEntry,
+        FieldGui,
+        FieldTable,
+        HexEntry,
+    )
+
+    reg = DataRegister()
+    widgets = [
+        HexEntry(tk_root, reg),
+        DecEntry(tk_root, reg),
+        BinEntry(tk_root, reg, with_delimiter=True),
+    ]
+    field_table = FieldTable(tk_root, visible_rows=number_of_fields)
+    bit_length = 32 // number_of_fields
+    for index in range(number_of_fields):
+        field_table.add_field(
+            FieldGui(reg, (index + 1) * bit_length - 1, index * bit_length)
+        )
+
+    def update_register():
+        reg.value = ~reg.value
+
+    benchmark(update_register)
+    assert widgets[0].get() in ["0", "FFFFFFFF"]
@@ -0,0 +1,76 @@
+"""Query module tests"""
+
+from array import array
+
+import pytest
+
+from registercalculator.register import RegisterLayout, compile_query
+from registercalculator.register import query as query_module
+
+LAYOUT = {
+    "bit length": 16,
+    "bit 0 is lsb": True,
+    "fields": [
+        {"name": "STATUS.ERR", "start": 15, "end": 15},
+        {"name": "MODE", "start": 14, "end": 12},
+        {"name": "", "start": 7, "end": 0},
+    ],
+}
+
+VALUES = [0x0000, 0x8000, 0xA000, 0xB0FF, 0x3010, 0xA080]
+
+
+@pytest.fixture(name="numpy_available", params=[True, False])
+def fixture_numpy_available(request, monkeypatch):
+    """Run a test both with NumPy and with the compiled Python predicate"""
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(query_module, "numpy_for", lambda _: None)
+    return request.param
+
+
+def _fields(value):
+    return value >> 15, value >> 12 & 0x7, value & 0xFF
+
+
+@pytest.mark.parametrize(
+    "expression, predicate",
+    [
+        ("STATUS.ERR == 1 and MODE in (2, 3)", lambda e, m, d: e == 1 and m in (2, 3)),
+        ("STATUS.ERR", lambda e, m, d: e != 0),
+        ("not STATUS.ERR or MODE not in (0x2)", lambda e, m, d: not e or m != 2),
+        ("`7:0` >= 0x80 and MODE < 3", lambda e, m, d: d >= 0x80 and m < 3),
+        ("(MODE == 3 or `7:0` == 16) and MODE != 0", lambda e, m, d: m in (3, 1)),
+        ("MODE > 300 or `7:0` > -1", lambda e, m, d: True),
+        ("MODE == 2 and MODE == 3", lambda e, m, d: False),
+        ("MODE == 8 and STATUS.ERR == 0", lambda e, m, d: False),
+        ("`7:0` == 0x110 and MODE == 3", lambda e, m, d: False),
+        ("MODE == -1 and STATUS.ERR == 1", lambda e, m, d: False),
+    ],
+)
+def test_query(numpy_available, expression, predicate):
+    """Test that a query matches the same values as the field comparisons"""
+    del numpy_available
+    query = compile_query(RegisterLayout.from_dict(LAYOUT), expression)
+    expected = [
+        (offset, value)
+        for offset, value in enumerate(VALUES)
+        if predicate(*_fields(value))
+    ]
+    assert [query.matches(value) for value in VALUES] == [
+        bool(predicate(*_fields(value))) for value in VALUES
+    ]
+    assert list(query.filter(array("H", VALUES), chunk_size=4)) == expected
+    assert list(query.filter(iter(VALUES), chunk_size=4)) == expected
+    assert query.count(VALUES) == len(expected)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["MODE ==", "UNKNOWN == 1", "MODE = 1", "MODE in 1, 2", "(MODE == 1", "MODE 1", ""],
+)
+def test_invalid_query(expression):
+    """Test that invalid queries are rejected"""
+    with pytest.raises(ValueError):
+        compile_query(RegisterLayout.from_dict(LAYOUT), expression)
@@ -2,7 +2,9 @@
 
 import pytest
 
-from registercalculator.register import DataField, DataRegister
+from registercalculator.register import DELIMITER, DataField, DataRegister
+from registercalculator.register.formatting import to_bin_delimited
+from registercalculator.register.register import swap_bytes
 
 
 def test_register_strings():
@@ -126,6 +128,12 @@ def test_field_bit_positions():
     with pytest.raises(ValueError):
         _ = DataField(reg, -8, 2)
 
+    # Fields of a compiled layout are not checked again
+    field = DataField(reg, 23, 16, validate=False)
+    assert field.value == 0x22
+    reg.bit_0_is_lsb = False
+    assert DataField(reg, 8, 15, validate=False).value == 0x22
+
 
 def test_field_registry_changes():
     """Test that a field reflects changes in a register"""
@@ -175,3 +183,143 @@ def test_field_value_changes():
 
     with pytest.raises(ValueError):
         field.value = 0x1FF
+
+
+def test_field_array_extract_and_insert():
+    """Test the NumPy array counterparts of the field value getter and setter"""
+    numpy = pytest.importorskip("numpy")
+    reg = DataRegister(bit_length=16)
+    field = DataField(reg, 11, 4)
+
+    for dtype in (numpy.uint16, numpy.uint32):
+        values = numpy.array([0x1234, 0xABCD, 0xFFFF, 0x0000], dtype=dtype)
+        extracted = field.extract(values)
+        assert extracted.dtype == dtype
+        assert extracted.tolist() == [0x23, 0xBC, 0xFF, 0x00]
+
+        inserted = field.insert(values, numpy.array([0x00, 0x11, 0x22, 0xFF]))
+        assert inserted.dtype == dtype
+        assert inserted.tolist() == [0x1004, 0xA11D, 0xF22F, 0x0FF0]
+        assert values.tolist() == [0x1234, 0xABCD, 0xFFFF, 0x0000]
+
+    with pytest.raises(ValueError):
+        field.insert(numpy.zeros(2, dtype=numpy.uint16), numpy.array([0, 0x100]))
+
+    with pytest.raises(ValueError):
+        field.extract(numpy.zeros(2, dtype=numpy.uint8))
+
+    with pytest.raises(TypeError):
+        field.extract(numpy.zeros(2, dtype=numpy.int16))
+
+
+def test_register_batch_notifications():
+    """Test that notifications within a batch are coalesced into one"""
+    reg = DataRegister(0x11223344)
+    field = DataField(reg, 7, 0)
+    calls = []
+    reg.register_observer(lambda: calls.append(reg.value))
+
+    with reg.batch_notifications():
+        reg.value = 0xAABBCCDD
+        with reg.batch_notifications():
+            field.value = 0x11
+            reg.swap_bytes()
+        assert not calls
+        reg.bit_length = 16
+    assert calls == [0xBBAA]
+
+    with reg.batch_notifications():
+        pass
+    assert calls == [0xBBAA]
+
+    with pytest.raises(ValueError):
+        with reg.batch_notifications():
+            reg.value = 0x1234
+            field.value = 0x1FF
+    assert calls == [0xBBAA, 0x1234]
+
+    reg.value = 0
+    assert calls == [0xBBAA, 0x1234, 0]
+
+
+def test_field_observers_of_changed_bits():
+    """Test that field observers are only notified when the field's bits change"""
+    reg = DataRegister(0x11223344)
+    low = DataField(reg, 7, 0)
+    high = DataField(reg, 31, 24)
+    calls = []
+    reg.register_observer(lambda: calls.append("reg"))
+    low.register_observer(lambda: calls.append("low"))
+    high.register_observer(lambda: calls.append("high"))
+
+    low.value = 0x55
+    assert calls == ["reg", "low"]
+
+    calls.clear()
+    reg.value = 0x11223355
+    assert not calls
+
+    reg.swap_bytes()
+    assert calls == ["reg", "low", "high"]
+
+    calls.clear()
+    with reg.batch_notifications():
+        high.value = 0
+        high.value = 0x55
+    assert calls == ["reg", "high"]
+
+    calls.clear()
+    reg.bit_length = 32
+    assert calls == ["reg", "low", "high"]
+
+    callback = calls.clear
+    reg.register_observer(callback)
+    reg.unregister_observer(callback)
+    with pytest.raises(ValueError):
+        reg.unregister_observer(callback)
+
+
+def test_register_wide_bit_lengths():
+    """Test registers wider than 32 bits"""
+    reg = DataRegister(0x0011223344556677, 64)
+    assert reg.max == 2**64 - 1
+    reg.swap_bytes()
+    assert reg.value == 0x7766554433221100
+
+    reg.bit_length = 128
+    reg.value = int.from_bytes(bytes(range(16)), "big")
+    reg.swap_bytes()
+    assert reg.value == int.from_bytes(bytes(range(16)), "little")
+
+    reg.bit_length = 512
+    reg.value = 1
+    reg.swap_bytes()
+    assert reg.value == 1 << 504
+
+    field = DataField(reg, 511, 448)
+    assert field.value == 0x0100000000000000
+    assert field.bit_length == 64
+
+    with pytest.raises(ValueError):
+        reg.bit_length = 0
+    with pytest.raises(ValueError):
+        reg.bit_length = 100
+
+
+def test_swap_bytes_reverses_bytes():
+    """Test that the generic byte swap reverses the bytes of any width"""
+    for bit_length in (8, 16, 32, 64, 128, 512):
+        value = int.from_bytes(bytes(range(1, bit_length // 8 + 1)), "big")
+        assert swap_bytes(value, bit_length) == int.from_bytes(
+            value.to_bytes(bit_length // 8, "big"), "little"
+        )
+
+
+def test_bin_delimited_of_any_width():
+    """Test the delimited binary strings against grouping the digits by slicing"""
+    for bit_length in range(1, 72):
+        value = 0x5A5A5A5A5A5A5A5A5A & ((1 << bit_length) - 1)
+        string = f"{value:0{bit_length}b}"
+        assert to_bin_delimited(value, bit_length) == DELIMITER.join(
+            string[index : index + 4] for index in range(0, len(string), 4)
+        )
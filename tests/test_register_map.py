@@ -0,0 +1,84 @@
+"""Register map module tests"""
+
+import io
+import json
+
+import pytest
+
+from registercalculator.register import DataRegister, RegisterLayout, RegisterMap
+
+MAP = {
+    "registers": [
+        {
+            "address": 0x10,
+            "name": "STATUS",
+            "bit length": 16,
+            "bit 0 is lsb": True,
+            "fields": [{"name": "ERR", "start": 0, "end": 0}],
+        },
+        {
+            "address": 0x0,
+            "name": "CTRL",
+            "bit length": 32,
+            "bit 0 is lsb": True,
+            "fields": [{"name": "MODE", "start": 3, "end": 0}],
+        },
+        {
+            "address": 0x4,
+            "name": "DATA",
+            "bit length": 8,
+            "bit 0 is lsb": False,
+            "fields": [],
+        },
+    ]
+}
+
+
+def test_register_map_lookup():
+    """Test address lookup, ordering and range queries"""
+    register_map = RegisterMap.load(io.StringIO(json.dumps(MAP)))
+    assert len(register_map) == 3
+    assert list(register_map) == [0x0, 0x4, 0x10]
+    assert register_map[0x10].name == "STATUS"
+    assert 0x8 not in register_map
+
+    assert [address for address, _ in register_map.in_range(0x4, 0x10)] == [0x4]
+    assert [address for address, _ in register_map.in_range(0x0, 0x11)] == [
+        0x0,
+        0x4,
+        0x10,
+    ]
+
+    with pytest.raises(ValueError):
+        register_map.add(0x4, RegisterLayout())
+
+    assert register_map.remove(0x4).name == "DATA"
+    assert list(register_map) == [0x0, 0x10]
+
+    register_map.add(0x8, RegisterLayout(DataRegister(bit_length=8), "NEW"))
+    assert list(register_map) == [0x0, 0x8, 0x10]
+
+
+def test_register_map_round_trip():
+    """Test that a map survives conversion to and from its dict representation"""
+    register_map = RegisterMap.from_dict(MAP)
+    data = register_map.to_dict()
+    assert [register["address"] for register in data["registers"]] == [0x0, 0x4, 0x10]
+    assert RegisterMap.from_dict(data).to_dict() == data
+    assert data["registers"][2] == MAP["registers"][0]
+
+
+def test_register_map_apply_dump():
+    """Test setting the register values from a memory dump"""
+    register_map = RegisterMap.from_dict(MAP)
+    dump = bytes(range(0x12))
+
+    assert register_map.apply_dump(dump) == 3
+    assert register_map[0x0].register.value == 0x03020100
+    assert register_map[0x4].register.value == 0x04
+    assert register_map[0x10].register.value == 0x1110
+    assert register_map[0x0].fields[0].value == 0x0
+
+    assert register_map.apply_dump(b"\xaa\xbb\xcc\xdd\xee", 0x1, "big") == 1
+    assert register_map[0x4].register.value == 0xDD
+    assert register_map[0x0].register.value == 0x03020100
@@ -0,0 +1,77 @@
+"""RegisterCalculator GUI tests"""
+
+import json
+
+import pytest
+
+pytest.importorskip("tkinterdnd2")
+
+# pylint: disable=protected-access,wrong-import-position
+from registercalculator import registercalculator
+
+
+@pytest.fixture(name="calculator")
+def fixture_calculator(tk_root, monkeypatch):
+    """A RegisterCalculator in the tk_root window, without drag and drop"""
+    monkeypatch.setattr(tk_root, "drop_target_register", lambda *_: None, raising=False)
+    monkeypatch.setattr(tk_root, "dnd_bind", lambda *_: None, raising=False)
+    monkeypatch.setattr(registercalculator.TkinterDnD, "Tk", lambda: tk_root)
+    return registercalculator.RegisterCalculator()
+
+
+def test_remove_field(calculator):
+    """Test that removing a field removes it from the table and the layout, and
+    updates the selection"""
+    for start, end in [(7, 0), (15, 8), (23, 16)]:
+        calculator._add_field(start, end)
+    calculator.bin_entry.selection_range(10, 19)
+    calculator.bin_entry.notify_observers()
+    first, second, third = calculator.fields
+    assert third.highlighted
+    assert str(calculator.add_button.cget("text")) == "Field 23:16 exists"
+
+    calculator._remove_field(second)
+    assert calculator.fields == [first, third]
+    assert calculator.layout.labels == ["7:0", "23:16"]
+    assert third.row.bit_label.cget("text") == "23:16"
+
+    calculator._remove_field(third)
+    assert third not in calculator._highlighted_fields
+    assert str(calculator.add_button.cget("text")) == "Add field 23:16"
+    assert str(calculator.add_button.cget("state")) == "enabled"
+
+    calculator._remove_field(first)
+    assert not calculator.fields
+    assert not calculator.layout.fields
+
+
+def test_reset_and_import_update_selection(calculator, tmp_path, monkeypatch):
+    """Test that the add button reflects the selection after the fields are reset
+    and after fields are imported"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    calculator._add_field(23, 16)
+    calculator.bin_entry.selection_range(10, 19)
+    calculator.bin_entry.notify_observers()
+    assert str(calculator.add_button.cget("text")) == "Field 23:16 exists"
+
+    calculator._reset_fields()
+    assert str(calculator.add_button.cget("text")) == "Add field 23:16"
+    assert str(calculator.add_button.cget("state")) == "enabled"
+
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(
+        json.dumps(
+            {
+                "bit length": 16,
+                "bit 0 is lsb": True,
+                "fields": [{"name": "LOW", "start": 7, "end": 0}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    calculator._import_fields(layout_path)
+    assert calculator.register.bit_length == 16
+    assert [field.name for field in calculator.fields] == ["LOW"]
+    # The entry text is replaced, which clears the selection
+    assert str(calculator.add_button.cget("text")) == "Add field"
+    assert str(calculator.add_button.cget("state")) == "disabled"
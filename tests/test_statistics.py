@@ -0,0 +1,81 @@
+"""Field statistics tests"""
+
+import io
+import json
+from array import array
+
+import pytest
+
+from registercalculator.register import (
+    RegisterLayout,
+    RegisterStatistics,
+    collect_statistics,
+)
+from registercalculator.register import statistics as statistics_module
+
+LAYOUT = {
+    "bit length": 16,
+    "bit 0 is lsb": True,
+    "fields": [
+        {"name": "HIGH", "start": 15, "end": 8},
+        {"name": "LOW", "start": 3, "end": 0},
+    ],
+}
+
+VALUES = [0x0102, 0x0103, 0xFF03, 0x0000, 0x010F]
+
+
+@pytest.fixture(name="numpy_available", params=[True, False])
+def fixture_numpy_available(request, monkeypatch):
+    """Run a test both with NumPy and with the pure Python aggregation"""
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(statistics_module, "numpy_for", lambda _: None)
+    return request.param
+
+
+def test_statistics(numpy_available):
+    """Test the field statistics of values added in several chunks"""
+    del numpy_available
+    layout = RegisterLayout.from_dict(LAYOUT)
+    statistics = collect_statistics(layout, array("H", VALUES), chunk_size=2)
+
+    assert statistics.count == 5
+    assert statistics.bit_counts == [
+        sum(value >> bit & 1 for value in VALUES) for bit in range(16)
+    ]
+    high, low = statistics.fields.values()
+    assert (high.min, high.max, high.distinct) == (0, 0xFF, 3)
+    assert high.histogram == {1: 3, 0xFF: 1, 0: 1}
+    assert low.bit_counts == [3, 4, 1, 1]
+
+    exported = io.StringIO()
+    statistics.export(exported)
+    data = json.loads(exported.getvalue())
+    assert RegisterLayout.from_dict(data).to_dict() == LAYOUT
+    assert data["statistics"]["LOW"] == {
+        "count": 5,
+        "min": 0,
+        "max": 15,
+        "distinct": 4,
+        "histogram": {"0": 1, "2": 1, "3": 2, "15": 1},
+        "overflow": 0,
+        "bit counts": [3, 4, 1, 1],
+    }
+
+
+def test_statistics_overflow(numpy_available):
+    """Test that the histograms are bounded by max_bins"""
+    del numpy_available
+    layout = RegisterLayout.from_dict(LAYOUT)
+    statistics = RegisterStatistics(layout, max_bins=2)
+    statistics.update(VALUES)
+    statistics.update(iter(VALUES))
+
+    low = statistics.fields["LOW"]
+    assert len(low.histogram) == 2
+    assert low.count == 10
+    assert low.overflow == 10 - sum(low.histogram.values())
+    assert low.distinct is None
+    assert (low.min, low.max) == (0, 15)
@@ -0,0 +1,242 @@
+"""SVD and IP-XACT importer tests"""
+
+import io
+
+import pytest
+
+from registercalculator.cli import main
+from registercalculator.register import (
+    compile_layout,
+    iter_peripherals,
+    load_peripheral,
+    load_register,
+    load_register_map,
+)
+
+SVD = b"""<?xml version="1.0" encoding="utf-8"?>
+<device>
+  <name>DEVICE</name>
+  <size>32</size>
+  <peripherals>
+    <peripheral>
+      <name>UART0</name>
+      <baseAddress>0x40001000</baseAddress>
+      <addressBlock>
+        <offset>0x0</offset>
+        <size>0x400</size>
+        <usage>registers</usage>
+      </addressBlock>
+      <registers>
+        <register>
+          <name>CTRL</name>
+          <addressOffset>0x0</addressOffset>
+          <fields>
+            <field><name>EN</name><bitOffset>0</bitOffset><bitWidth>1</bitWidth></field>
+            <field><name>MODE</name><lsb>4</lsb><msb>7</msb></field>
+            <field><name>BAUD</name><bitRange>[31:16]</bitRange></field>
+          </fields>
+        </register>
+        <register>
+          <dim>2</dim>
+          <dimIncrement>2</dimIncrement>
+          <name>DATA%s</name>
+          <addressOffset>0x4</addressOffset>
+          <size>16</size>
+          <fields>
+            <field><name>VALUE</name><bitOffset>0</bitOffset><bitWidth>9</bitWidth></field>
+          </fields>
+        </register>
+        <cluster>
+          <name>FIFO</name>
+          <addressOffset>0x10</addressOffset>
+          <register>
+            <name>LEVEL</name>
+            <addressOffset>0x0</addressOffset>
+            <size>8</size>
+          </register>
+        </cluster>
+      </registers>
+    </peripheral>
+    <peripheral derivedFrom="UART0">
+      <name>UART1</name>
+      <baseAddress>0x40002000</baseAddress>
+    </peripheral>
+  </peripherals>
+</device>
+"""
+
+DERIVED = b"""<peripheral derivedFrom='UART1'>
+      <name>UART2</name>
+      <baseAddress>0x40003000</baseAddress>
+    </peripheral>
+"""
+
+IP_XACT = b"""<?xml version="1.0" encoding="utf-8"?>
+<ipxact:component xmlns:ipxact="http://www.accellera.org/XMLSchema/IPXACT/1685-2014">
+  <ipxact:memoryMaps>
+    <ipxact:memoryMap>
+      <ipxact:name>MAP</ipxact:name>
+      <ipxact:addressBlock>
+        <ipxact:name>TIMER</ipxact:name>
+        <ipxact:baseAddress>'h100</ipxact:baseAddress>
+        <ipxact:register>
+          <ipxact:name>COUNT</ipxact:name>
+          <ipxact:addressOffset>'h8</ipxact:addressOffset>
+          <ipxact:size>16</ipxact:size>
+          <ipxact:field>
+            <ipxact:name>LOW</ipxact:name>
+            <ipxact:bitOffset>0</ipxact:bitOffset>
+            <ipxact:bitWidth>8</ipxact:bitWidth>
+          </ipxact:field>
+        </ipxact:register>
+      </ipxact:addressBlock>
+    </ipxact:memoryMap>
+  </ipxact:memoryMaps>
+</ipxact:component>
+"""
+
+
+def test_svd_peripherals():
+    """Test that registers, dim arrays, clusters and derived peripherals are read"""
+    uart0, uart1 = iter_peripherals(io.BytesIO(SVD))
+    assert (uart0.name, uart0.base_address) == ("UART0", 0x40001000)
+    assert [
+        (reg["name"], reg["address"], reg["bit length"]) for reg in uart0.registers
+    ] == [
+        ("CTRL", 0x40001000, 32),
+        ("DATA0", 0x40001004, 16),
+        ("DATA1", 0x40001006, 16),
+        ("FIFO.LEVEL", 0x40001010, 8),
+    ]
+    assert uart0.register("CTRL")["fields"] == [
+        {"name": "EN", "start": 0, "end": 0},
+        {"name": "MODE", "start": 7, "end": 4},
+        {"name": "BAUD", "start": 31, "end": 16},
+    ]
+    assert uart1.register("DATA1")["address"] == 0x40002006
+
+    with pytest.raises(ValueError):
+        uart0.register("MISSING")
+
+
+DERIVED_REGISTERS = b"""<peripheral>
+      <name>GPIO</name>
+      <baseAddress>0x50000000</baseAddress>
+      <registers>
+        <register>
+          <dim>2</dim>
+          <dimIncrement>4</dimIncrement>
+          <dimIndex>A-B</dimIndex>
+          <name>PORT%s</name>
+          <addressOffset>0x0</addressOffset>
+          <size>16</size>
+          <fields>
+            <field><name>PIN0</name><bitOffset>0</bitOffset><bitWidth>1</bitWidth></field>
+            <field derivedFrom="PIN0"><name>PIN1</name></field>
+          </fields>
+        </register>
+        <register derivedFrom="PORTA">
+          <name>PORTC</name>
+          <addressOffset>0x8</addressOffset>
+        </register>
+      </registers>
+    </peripheral>
+"""
+
+
+def test_svd_derived_registers():
+    """Test letter dim indices and registers and fields derived from others"""
+    (gpio,) = iter_peripherals(io.BytesIO(DERIVED_REGISTERS))
+    assert [
+        (reg["name"], reg["address"], reg["bit length"]) for reg in gpio.registers
+    ] == [
+        ("PORTA", 0x50000000, 16),
+        ("PORTB", 0x50000004, 16),
+        ("PORTC", 0x50000008, 16),
+    ]
+    assert gpio.register("PORTC")["fields"] == [
+        {"name": "PIN0", "start": 0, "end": 0},
+        {"name": "PIN1", "start": 0, "end": 0},
+    ]
+
+    with pytest.raises(ValueError, match="Register 'PORTC' .* unknown 'PORTD'"):
+        list(
+            iter_peripherals(
+                io.BytesIO(DERIVED_REGISTERS.replace(b'"PORTA"', b'"PORTD"'))
+            )
+        )
+    with pytest.raises(ValueError, match="Field 'PIN1' .* unknown 'PIN2'"):
+        list(
+            iter_peripherals(
+                io.BytesIO(DERIVED_REGISTERS.replace(b'"PIN0"', b'"PIN2"'))
+            )
+        )
+
+
+class Stream(io.BytesIO):
+    """A file object that cannot be rewound, like a pipe"""
+
+    def seekable(self):
+        return False
+
+
+def test_svd_derived_peripherals():
+    """Test deriving peripherals from files that can and cannot be read twice"""
+    svd = SVD.replace(b"</peripherals>", DERIVED + b"</peripherals>")
+    for source in [io.BytesIO(svd), Stream(svd)]:
+        peripherals = {
+            peripheral.name: peripheral for peripheral in iter_peripherals(source)
+        }
+        assert list(peripherals) == ["UART0", "UART1", "UART2"]
+        assert peripherals["UART2"].register("CTRL")["address"] == 0x40003000
+
+    with pytest.raises(ValueError, match="unknown 'UART3'"):
+        list(iter_peripherals(io.BytesIO(svd.replace(b"'UART1'", b"'UART3'"))))
+
+
+def test_svd_register_map():
+    """Test building register maps and layouts from an SVD file"""
+    register_map = load_register_map(io.BytesIO(SVD))
+    assert len(register_map) == 8
+    assert register_map[0x40002000].name == "UART1.CTRL"
+    assert register_map[0x40002000].labels == ["EN", "MODE", "BAUD"]
+
+    peripheral = load_peripheral(io.BytesIO(SVD), "UART1")
+    peripheral_map = peripheral.to_register_map("UART1.")
+    assert [layout.name for _, layout in peripheral_map.items()] == [
+        layout.name for _, layout in register_map.in_range(0x40002000, 0x40003000)
+    ]
+
+    layout = compile_layout(load_register(io.BytesIO(SVD), "UART0.CTRL"))
+    assert layout.labels == ["EN", "MODE", "BAUD"]
+
+    with pytest.raises(ValueError):
+        load_peripheral(io.BytesIO(SVD), "SPI0")
+
+
+def test_ip_xact():
+    """Test reading the address blocks of an IP-XACT component"""
+    (timer,) = iter_peripherals(io.BytesIO(IP_XACT))
+    assert timer.name == "TIMER"
+    assert timer.registers == [
+        {
+            "address": 0x108,
+            "name": "COUNT",
+            "bit length": 16,
+            "bit 0 is lsb": True,
+            "fields": [{"name": "LOW", "start": 7, "end": 0}],
+        }
+    ]
+
+
+def test_decode_svd_register(tmp_path, monkeypatch, capsys):
+    """Test decoding values with a register of an SVD file"""
+    svd_path = tmp_path / "device.svd"
+    svd_path.write_bytes(SVD)
+    monkeypatch.setattr("sys.stdin", io.StringIO("0x12340051\n"))
+
+    assert main([str(svd_path), "--register", "UART1.CTRL"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "value,EN,MODE,BAUD",
+        "305397841,1,5,4660",
+    ]